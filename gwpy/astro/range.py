@@ -22,11 +22,17 @@ distance of an instrumental power-spectral density.
 
 import warnings
 
-from functools import wraps
+from functools import (
+    lru_cache,
+    wraps,
+)
 from math import pi
 
+import numpy
+
 from scipy.integrate import trapz
-from scipy.interpolate import interp1d
+from scipy.special import roots_legendre
+from scipy.interpolate import CubicSpline
 
 from astropy import (
     units,
@@ -105,6 +111,67 @@ def _preformat_psd(func):
 
 # -- SenseMon range -----------------------------
 
+def _sensemon_range_psd_values(f, psd, snr=8, mass1=1.4, mass2=1.4,
+                               horizon=False):
+    """Calculate the SenseMon range integrand (Mpc^2 / Hz) for PSD values
+
+    ``f`` gives the (non-zero) frequencies in Hz of the last axis of
+    ``psd``, which may have any number of dimensions.
+    """
+    # compute total mass and chirp mass
+    mass1 = units.Quantity(mass1, 'solMass').to('kg')
+    mass2 = units.Quantity(mass2, 'solMass').to('kg')
+    mtotal = mass1 + mass2
+    mchirp = (mass1 * mass2) ** (3/5.) / mtotal ** (1/5.)
+    # calculate integrand pre-factor, including the units of f^(-7/3)/psd
+    prefactor = (
+        (  # numerator
+            (16 if horizon else 1.77**2)
+            * 5
+            * constants.c ** (1/3.)
+            * (mchirp * constants.G / constants.c ** 2) ** (5/3.)
+        )  # denominator
+        / (
+            96
+            * pi ** (4/3.)
+            * snr ** 2
+        )
+        * units.Hz ** (-4/3.)
+    ).to('Mpc^2 / Hz').value
+    return prefactor * f ** (-7/3.) / psd
+
+
+def _sensemon_range_values(psd, snr=8, mass1=1.4, mass2=1.4, fmin=None,
+                           fmax=None, horizon=False):
+    """Calculate the SenseMon range (Mpc) along the frequency axis of ``psd``
+
+    ``psd`` can be a `~gwpy.frequencyseries.FrequencySeries` or a
+    `~gwpy.spectrogram.Spectrogram`, in which case the range is
+    calculated for all times at once.
+    """
+    fisco = _get_isco_frequency(mass1, mass2)
+    # format frequency limits
+    fmin = units.Quantity(fmin or psd.df, 'Hz')  # avoid DC value
+    fmax = units.Quantity(fmax or fisco, 'Hz')
+    if fmax > fisco:
+        warnings.warn("Upper frequency bound greater than %s-%s ISCO "
+                      "frequency of %s, using ISCO" % (mass1, mass2, fisco))
+        fmax = fisco
+    # integrate and return
+    f = psd.frequencies.to('Hz')
+    frange = (f >= fmin) & (f < fmax)
+    f = f.value[frange]
+    integrand = _sensemon_range_psd_values(
+        f,
+        psd.value[..., frange],
+        snr=snr,
+        mass1=mass1,
+        mass2=mass2,
+        horizon=horizon,
+    )
+    return trapz(integrand, f) ** (1/2.)
+
+
 @_preformat_psd
 def sensemon_range_psd(psd, snr=8, mass1=1.4, mass2=1.4, horizon=False):
     """Approximate the inspiral sensitive distance PSD from a GW strain PSD
@@ -141,29 +208,19 @@ def sensemon_range_psd(psd, snr=8, mass1=1.4, mass2=1.4, horizon=False):
     rspec : `~gwpy.frequencyseries.FrequencySeries`
         the calculated inspiral sensitivity PSD [Mpc^2 / Hz]
     """
-    frange = (psd.frequencies > 0)
-    # compute total mass and chirp mass
-    mass1 = units.Quantity(mass1, 'solMass').to('kg')
-    mass2 = units.Quantity(mass2, 'solMass').to('kg')
-    mtotal = mass1 + mass2
-    mchirp = (mass1 * mass2) ** (3/5.) / mtotal ** (1/5.)
-    # calculate integrand with pre-factor
-    prefactor = (
-        (  # numerator
-            (16 if horizon else 1.77**2)
-            * 5
-            * constants.c ** (1/3.)
-            * (mchirp * constants.G / constants.c ** 2) ** (5/3.)
-        )  # denominator
-        / (
-            96
-            * pi ** (4/3.)
-            * snr ** 2
-        )
-    )
-    return (  # inspiral range PSD, avoiding DC value
-        1 / psd[frange] * psd.frequencies[frange] ** (-7/3.) * prefactor
-    ).to('Mpc^2 / Hz')
+    psd = psd[psd.frequencies > 0]  # avoid DC value
+    out = type(psd)(_sensemon_range_psd_values(
+        psd.frequencies.to('Hz').value,
+        psd.value,
+        snr=snr,
+        mass1=mass1,
+        mass2=mass2,
+        horizon=horizon,
+    ))
+    # finalize properties and return
+    out.__array_finalize__(psd)
+    out.override_unit('Mpc^2 / Hz')
+    return out
 
 
 def sensemon_range(psd, snr=8, mass1=1.4, mass2=1.4, fmin=None, fmax=None,
@@ -224,23 +281,11 @@ def sensemon_range(psd, snr=8, mass1=1.4, mass2=1.4, fmin=None, fmax=None,
     >>> print(r)
     70.4612102889 Mpc
     """
-    fisco = _get_isco_frequency(mass1, mass2)
-    # format frequency limits
-    fmin = units.Quantity(fmin or psd.df, 'Hz')  # avoid DC value
-    fmax = units.Quantity(fmax or fisco, 'Hz')
-    if fmax > fisco:
-        warnings.warn("Upper frequency bound greater than %s-%s ISCO "
-                      "frequency of %s, using ISCO" % (mass1, mass2, fisco))
-        fmax = fisco
-    # integrate and return
-    f = psd.frequencies.to('Hz')
-    frange = (f >= fmin) & (f < fmax)
-    integrand = sensemon_range_psd(psd[frange], snr=snr, mass1=mass1,
-                                   mass2=mass2, horizon=horizon)
-    return (units.Quantity(
-        trapz(integrand.value, f.value[frange]),
-        unit=integrand.unit * units.Hertz,
-    ) ** (1/2.)).to('Mpc')
+    return units.Quantity(
+        _sensemon_range_values(psd, snr=snr, mass1=mass1, mass2=mass2,
+                               fmin=fmin, fmax=fmax, horizon=horizon),
+        'Mpc',
+    )
 
 
 # -- inspiral range -----------------------------
@@ -270,9 +315,280 @@ def _import_inspiral_range():
     )
 
 
+#: maximum number of inspiral range kernels to hold in memory
+INSPIRAL_RANGE_CACHE_SIZE = 4
+
+#: redshifts at which the inspiral range kernel is pre-computed
+INSPIRAL_RANGE_REDSHIFTS = numpy.logspace(-6, 3, num=289)  # 32 per decade
+
+
+class _InspiralRangeKernel(object):
+    """Pre-computed kernel for cosmology-corrected inspiral range
+
+    This object simulates the waveform once for a given frequency array,
+    so that the exact range of each new PSD only requires the root-finding
+    and volume integration of :mod:`inspiral_range`.
+
+    For ``approximate=True``, the (squared) SNR of a waveform at redshift
+    ``z`` is used as a weighted sum of the inverse PSD, with weights that
+    depend only on the waveform and the frequency array.
+    Those weights are computed (once) for a grid of redshifts
+    (`INSPIRAL_RANGE_REDSHIFTS`), so that the SNR of each new PSD at all
+    redshifts is a single matrix product, from which the horizon redshift
+    and the sensitive volume are interpolated.
+    The relative difference from the exact calculation is typically
+    less than ``1e-5`` for horizon redshifts below ~10; PSDs whose horizon
+    is outside of the grid fall back to the exact calculation.
+
+    Parameters
+    ----------
+    frequencies : `numpy.ndarray`
+        the (non-zero) frequencies (Hz) at which PSDs will be given
+
+    mass1 : `float`
+        the mass (in solar masses) of the first binary component
+
+    mass2 : `float`
+        the mass (in solar masses) of the second binary component
+
+    **kwargs
+        other keyword arguments to `~inspiral_range.waveform.CBCWaveform`
+    """
+    def __init__(self, frequencies, mass1=1.4, mass2=1.4, **kwargs):
+        (
+            self._range,
+            self._find_root_redshift,
+            CBCWaveform,
+        ) = _import_inspiral_range()
+        from inspiral_range.ang_avg import ang_avg
+        self._ang_avg = numpy.vectorize(ang_avg, otypes=[float])
+
+        f = self.frequencies = numpy.asarray(frequencies, dtype=float)
+        self.waveform = CBCWaveform(f, m1=mass1, m2=mass2, **kwargs)
+        self.weights = None
+
+    def _setup_interpolation(self):
+        """Pre-compute the SNR weights and volume density on the redshift grid
+        """
+        if self.weights is not None:
+            return
+        f = self.frequencies
+        inspiral = self.waveform
+
+        # trapezium-rule integration weights
+        dfby2 = numpy.diff(f) / 2.
+        trap = numpy.zeros_like(f)
+        trap[:-1] += dfby2
+        trap[1:] += dfby2
+
+        # weights of 1/psd for the squared SNR at each redshift
+        z = self.redshifts = INSPIRAL_RANGE_REDSHIFTS
+        weights = numpy.empty((z.size, f.size))
+        for i, zz in enumerate(z):
+            fz, hz = inspiral.z_scale(zz)
+            hz = numpy.interp(f, fz, hz, left=hz[0], right=0)
+            weights[i] = 4 * hz ** 2 * trap
+
+        # redshift-corrected comoving volume density
+        self._logz = numpy.log(z)
+        self._logdvdz = CubicSpline(self._logz, numpy.log([
+            inspiral.cosmo.differential_comoving_volume(zz) for zz in z
+        ]))
+        self._gl_roots, self._gl_weights = roots_legendre(20)
+        self.weights = weights  # set last, marks setup as complete
+
+    def snr(self, psd):
+        """Calculate the SNR at each redshift for one or more PSDs
+
+        Parameters
+        ----------
+        psd : `numpy.ndarray`
+            PSD values, with frequency along the last axis
+
+        Returns
+        -------
+        snr : `numpy.ndarray`
+            the SNR at each of `redshifts` (along the last axis)
+        """
+        self._setup_interpolation()
+        return numpy.dot(1 / psd, self.weights.T) ** (1/2.)
+
+    def _snr_spline(self, snrs):
+        """Interpolate log(SNR) as a function of log(redshift)
+        """
+        good = snrs > 0  # high-redshift signals can be out-of-band
+        return CubicSpline(self._logz[good], numpy.log(snrs[good]))
+
+    def horizon_redshift(self, snrs, snr=8):
+        """Interpolate the redshift at which the SNR equals ``snr``
+
+        Returns `None` if ``snr`` is outside the range of ``snrs``.
+        """
+        if not snrs[-1] < snr < snrs[0]:
+            return None
+        spline = self._snr_spline(snrs)
+        logsnr = numpy.log(snr)
+        # SNR decreases monotonically with redshift, so start from a
+        # linear interpolation and refine using the spline
+        good = snrs > 0
+        logz = numpy.interp(
+            -logsnr,
+            -numpy.log(snrs[good]),
+            self._logz[good],
+        )
+        for _ in range(3):
+            logz -= (spline(logz) - logsnr) / spline(logz, 1)
+        return numpy.exp(logz)
+
+    def volume(self, snrs, z_hor, snr=8):
+        """Calculate the sensitive comoving volume (Mpc^3)
+
+        This is the same Gauss-Legendre quadrature as
+        :func:`inspiral_range.volume`, with the SNR and volume density
+        interpolated from the pre-computed redshift grid.
+        """
+        logz = numpy.log(.5 * z_hor * (self._gl_roots + 1.))
+        frac = self._ang_avg(numpy.exp(self._snr_spline(snrs)(logz)) / snr)
+        dvdz = numpy.exp(self._logdvdz(logz))
+        return .5 * z_hor * numpy.sum(self._gl_weights * dvdz * frac)
+
+    def distance(self, psd, snr=8, horizon=False, approximate=False):
+        """Calculate the sensitive distance (Mpc) for one or more PSDs
+
+        Parameters
+        ----------
+        psd : `numpy.ndarray`
+            PSD values, with frequency along the last axis
+
+        snr : `float`, optional
+            the signal-to-noise ratio for which to calculate range
+
+        horizon : `bool`, optional
+            if `True`, return the maximal 'horizon' luminosity distance,
+            otherwise return the angle-averaged comoving distance
+
+        approximate : `bool`, optional
+            if `True`, interpolate the horizon redshift and sensitive
+            volume from the pre-computed redshift grid, otherwise
+            (default) calculate them exactly
+
+        Returns
+        -------
+        distance : `numpy.ndarray`
+            the distance for each PSD, with the same shape as
+            ``psd`` without the last axis
+        zhor : `numpy.ndarray`
+            the horizon redshift for each PSD
+        """
+        psd = numpy.asarray(psd)
+        psd2d = psd.reshape((-1, self.frequencies.size))
+        dist = numpy.empty(psd2d.shape[0])
+        zhor = numpy.empty(psd2d.shape[0])
+        if approximate:
+            snrs = self.snr(psd2d)
+        for i, psd_ in enumerate(psd2d):
+            z = None
+            if approximate:
+                z = self.horizon_redshift(snrs[i], snr=snr)
+            if z is None or not numpy.isfinite(z):  # do it the slow way
+                zhor[i] = z = self._find_root_redshift(
+                    lambda z: self.waveform.SNR(psd_, z) - snr,
+                )
+                if not horizon:
+                    dist[i] = self._range(
+                        self.frequencies,
+                        psd_,
+                        z_hor=z,
+                        H=self.waveform,
+                    )
+                continue
+            zhor[i] = z
+            dist[i] = (
+                3 * self.volume(snrs[i], z, snr=snr) / (4 * pi)
+            ) ** (1/3.)
+        if horizon:
+            dist = self.waveform.cosmo.luminosity_distance(zhor)
+        return dist.reshape(psd.shape[:-1]), zhor.reshape(psd.shape[:-1])
+
+
+@lru_cache(maxsize=INSPIRAL_RANGE_CACHE_SIZE)
+def _cached_inspiral_range_kernel(frequencies, mass1, mass2, kwargs):
+    return _InspiralRangeKernel(
+        numpy.frombuffer(frequencies, dtype=float),
+        mass1=mass1,
+        mass2=mass2,
+        **dict(kwargs)
+    )
+
+
+def _inspiral_range_kernel(frequencies, mass1=1.4, mass2=1.4, **kwargs):
+    """Return the `_InspiralRangeKernel` for these parameters
+
+    Kernels are cached (up to `INSPIRAL_RANGE_CACHE_SIZE` at a time)
+    using the frequency array, masses, and waveform/cosmology options
+    as a key.
+    """
+    frequencies = numpy.asarray(frequencies, dtype=float)
+    key = (frequencies.tobytes(), mass1, mass2, tuple(sorted(kwargs.items())))
+    try:
+        hash(key)
+    except TypeError:  # can't cache this one
+        return _InspiralRangeKernel(frequencies, mass1=mass1, mass2=mass2,
+                                    **kwargs)
+    return _cached_inspiral_range_kernel(*key)
+
+
+def _inspiral_range_psd_values(f, psd, snr=8, mass1=1.4, mass2=1.4,
+                               horizon=False, approximate=False, **kwargs):
+    """Calculate the inspiral range integrand (Mpc^2 / Hz) for PSD values
+
+    ``f`` gives the (non-zero) frequencies in Hz of the last axis of
+    ``psd``, which may have any number of dimensions.
+    """
+    kernel = _inspiral_range_kernel(f, mass1=mass1, mass2=mass2, **kwargs)
+    dist, z_hor = kernel.distance(psd, snr=snr, horizon=horizon,
+                                  approximate=approximate)
+    out = numpy.empty(numpy.shape(psd))
+    for idx in numpy.ndindex(dist.shape):
+        (fz, hz) = kernel.waveform.z_scale(z_hor[idx])
+        hz = numpy.interp(f, fz, hz, left=hz[0], right=0)
+        out[idx] = 4 * (dist[idx] / snr) ** 2 * hz ** 2 / psd[idx]
+    return out
+
+
+def _inspiral_range_values(psd, snr=8, mass1=1.4, mass2=1.4, fmin=None,
+                           fmax=None, horizon=False, approximate=False,
+                           **kwargs):
+    """Calculate the inspiral range (Mpc) along the frequency axis of ``psd``
+
+    ``psd`` can be a `~gwpy.frequencyseries.FrequencySeries` or a
+    `~gwpy.spectrogram.Spectrogram`, in which case the range is
+    calculated for all times at once.
+    """
+    # format frequency limits
+    f = psd.frequencies.to('Hz').value
+    fmin = fmin or psd.df.to('Hz').value  # avoid DC value
+    fmax = fmax or round_to_power(f[-1], which='lower')
+    frange = (f >= fmin) & (f < fmax)
+
+    # calculate the distance using the (cached) kernel for this system
+    kernel = _inspiral_range_kernel(
+        f[frange],
+        mass1=mass1,
+        mass2=mass2,
+        **kwargs
+    )
+    return kernel.distance(
+        psd.value[..., frange],
+        snr=snr,
+        horizon=horizon,
+        approximate=approximate,
+    )[0]
+
+
 @_preformat_psd
 def inspiral_range_psd(psd, snr=8, mass1=1.4, mass2=1.4, horizon=False,
-                       **kwargs):
+                       approximate=False, **kwargs):
     """Calculate the cosmology-corrected inspiral sensitive distance PSD
 
     This method returns the power spectral density (in ``Mpc**2 / Hz``) to
@@ -303,6 +619,13 @@ def inspiral_range_psd(psd, snr=8, mass1=1.4, mass2=1.4, horizon=False,
         if `True`, return the maximal 'horizon' luminosity distance, otherwise
         return the angle-averaged comoving distance, default: `False`
 
+    approximate : `bool`, optional
+        if `True`, interpolate the horizon redshift and sensitive volume
+        from a grid of redshifts that is pre-computed once for each set of
+        parameters, which is much faster when calculating the range for
+        many PSDs, with a relative error typically less than ``1e-5``,
+        default: `False` (calculate the exact range)
+
     **kwargs : `dict`, optional
         additional keyword arguments to `~inspiral_range.waveform.CBCWaveform`
 
@@ -319,25 +642,17 @@ def inspiral_range_psd(psd, snr=8, mass1=1.4, mass2=1.4, horizon=False,
         the package which does heavy lifting for waveform simulation and
         cosmology calculations
     """
-    # import the optional extras required here:
-    range_func, find_root_redshift, CBCWaveform = _import_inspiral_range()
-
-    # generate a waveform for this system
     f = psd.frequencies.to('Hz').value
-    inspiral = CBCWaveform(f[f > 0], m1=mass1, m2=mass2, **kwargs)
-
-    # determine the detector horizon redshift
-    z_hor = find_root_redshift(
-        lambda z: inspiral.SNR(psd.value[f > 0], z) - snr,
-    )
-    dist = (
-        inspiral.cosmo.luminosity_distance(z_hor) if horizon else
-        range_func(f[f > 0], psd.value[f > 0], z_hor=z_hor, H=inspiral)
-    )
-    # calculate the sensitive distance PSD
-    (fz, hz) = inspiral.z_scale(z_hor)
-    hz = interp1d(fz, hz, bounds_error=False, fill_value=(hz[0], 0))(f)
-    out = type(psd)(4 * (dist / snr)**2 * (hz**2 / psd.value)[f > 0])
+    out = type(psd)(_inspiral_range_psd_values(
+        f[f > 0],
+        psd.value[f > 0],
+        snr=snr,
+        mass1=mass1,
+        mass2=mass2,
+        horizon=horizon,
+        approximate=approximate,
+        **kwargs
+    ))
     # finalize properties and return
     out.__array_finalize__(psd)
     out.override_unit('Mpc^2 / Hz')
@@ -347,7 +662,7 @@ def inspiral_range_psd(psd, snr=8, mass1=1.4, mass2=1.4, horizon=False,
 
 @_preformat_psd
 def inspiral_range(psd, snr=8, mass1=1.4, mass2=1.4, fmin=None, fmax=None,
-                   horizon=False, **kwargs):
+                   horizon=False, approximate=False, **kwargs):
     """Calculate the cosmology-corrected inspiral sensitive distance
 
     This method returns the distance (in megaparsecs) to which a compact
@@ -385,6 +700,13 @@ def inspiral_range(psd, snr=8, mass1=1.4, mass2=1.4, fmin=None, fmax=None,
         if `True`, return the maximal 'horizon' luminosity distance, otherwise
         return the angle-averaged comoving distance, default: `False`
 
+    approximate : `bool`, optional
+        if `True`, interpolate the horizon redshift and sensitive volume
+        from a grid of redshifts that is pre-computed once for each set of
+        parameters, which is much faster when calculating the range for
+        many PSDs, with a relative error typically less than ``1e-5``,
+        default: `False` (calculate the exact range)
+
     **kwargs : `dict`, optional
         additional keyword arguments to `~inspiral_range.waveform.CBCWaveform`
 
@@ -416,32 +738,57 @@ def inspiral_range(psd, snr=8, mass1=1.4, mass2=1.4, fmin=None, fmax=None,
         the package which does heavy lifting for waveform simulation and
         cosmology calculations
     """
-    # import the optional extras required here:
-    range_func, find_root_redshift, CBCWaveform = _import_inspiral_range()
+    return units.Quantity(
+        _inspiral_range_values(psd, snr=snr, mass1=mass1, mass2=mass2,
+                               fmin=fmin, fmax=fmax, horizon=horizon,
+                               approximate=approximate, **kwargs),
+        'Mpc',
+    )
 
-    # format frequency limits
-    f = psd.frequencies.to('Hz').value
-    fmin = fmin or psd.df.value  # avoid DC value
-    fmax = fmax or round_to_power(f[-1], which='lower')
-    frange = (f >= fmin) & (f < fmax)
 
-    # generate a waveform for this system
-    inspiral = CBCWaveform(f[frange], m1=mass1, m2=mass2, **kwargs)
+# -- burst range --------------------------------
 
-    # determine the detector horizon redshift
-    z_hor = find_root_redshift(
-        lambda z: inspiral.SNR(psd.value[frange], z) - snr,
-    )
+def _burst_range_spectrum_values(f, psd, snr=8, energy=1e-2):
+    """Calculate the burst range spectrum (Mpc) for PSD values
 
-    # return the sensitive distance metric
-    return units.Quantity(
-        inspiral.cosmo.luminosity_distance(z_hor) if horizon else
-        range_func(f[frange], psd.value[frange], z_hor=z_hor, H=inspiral),
-        unit='Mpc',
-    )
+    ``f`` gives the (non-zero) frequencies in Hz of the last axis of
+    ``psd``, which may have any number of dimensions.
+    """
+    # calculate frequency-independent factor, including the units of
+    # psd^(-1/2) / f
+    a = (
+        (
+            constants.G * energy * constants.M_sun * 0.4
+            / (pi**2 * constants.c)
+        ) ** (1/2.)
+        * units.Hz ** (-1/2.)
+    ).to('Mpc').value
+    return psd ** (-1/2.) * a / (snr * f)
 
 
-# -- burst range --------------------------------
+def _burst_range_values(psd, snr=8, energy=1e-2, fmin=100, fmax=500):
+    """Calculate the burst range (Mpc) along the frequency axis of ``psd``
+
+    ``psd`` can be a `~gwpy.frequencyseries.FrequencySeries` or a
+    `~gwpy.spectrogram.Spectrogram`, in which case the range is
+    calculated for all times at once.
+    """
+    f = psd.frequencies.to('Hz').value
+    # restrict integral
+    fmin = fmin or psd.df.to('Hz').value
+    fmax = fmax or f[-1]
+    frange = (f >= fmin) & (f < fmax)
+    # calculate integrand and integrate
+    integrand = _burst_range_spectrum_values(
+        f[frange],
+        psd.value[..., frange],
+        snr=snr,
+        energy=energy,
+    ) ** 3
+    out = trapz(integrand, f[frange])
+    # normalize and return
+    return (out / (fmax - fmin)) ** (1/3.)
+
 
 @_preformat_psd
 def burst_range_spectrum(psd, snr=8, energy=1e-2):
@@ -465,15 +812,17 @@ def burst_range_spectrum(psd, snr=8, energy=1e-2):
     rangespec : `~gwpy.frequencyseries.FrequencySeries`
         the burst range `FrequencySeries` [Mpc (default)]
     """
-    frange = (psd.frequencies > 0)
-    # calculate frequency dependent range in parsecs
-    a = (
-        constants.G * energy * constants.M_sun * 0.4
-        / (pi**2 * constants.c)
-    ) ** (1/2.)
-    return (  # burst range spectrum, avoiding DC value
-        psd[frange] ** (-1/2.) * a / (snr * psd.frequencies[frange])
-    ).to('Mpc')
+    psd = psd[psd.frequencies > 0]  # avoid DC value
+    out = type(psd)(_burst_range_spectrum_values(
+        psd.frequencies.to('Hz').value,
+        psd.value,
+        snr=snr,
+        energy=energy,
+    ))
+    # finalize properties and return
+    out.__array_finalize__(psd)
+    out.override_unit('Mpc')
+    return out
 
 
 def burst_range(psd, snr=8, energy=1e-2, fmin=100, fmax=500):
@@ -520,24 +869,29 @@ def burst_range(psd, snr=8, energy=1e-2, fmin=100, fmax=500):
     >>> print(r)
     42.5055584195 Mpc
     """
-    f = psd.frequencies.to('Hz').value
-    # restrict integral
-    fmin = fmin or psd.df.to('Hz').value
-    fmax = fmax or f[-1].value
-    frange = (f >= fmin) & (f < fmax)
-    # calculate integrand and integrate
-    integrand = burst_range_spectrum(
-        psd[frange], snr=snr, energy=energy) ** 3
-    out = trapz(integrand.value, f[frange])
-    # normalize and return
-    return (units.Quantity(
-        out / (fmax - fmin),
-        unit=integrand.unit,
-    ) ** (1/3.)).to('Mpc')
+    return units.Quantity(
+        _burst_range_values(psd, snr=snr, energy=energy, fmin=fmin,
+                            fmax=fmax),
+        'Mpc',
+    )
 
 
 # -- timeseries/spectrogram wrappers ------------
 
+# implementations of range functions that operate on all columns of a
+# spectrogram at once, keyed by the relevant public function
+_RANGE_VALUES = {
+    burst_range: _burst_range_values,
+    inspiral_range: _inspiral_range_values,
+    sensemon_range: _sensemon_range_values,
+}
+_RANGE_SPECTRUM_VALUES = {
+    burst_range_spectrum: _burst_range_spectrum_values,
+    inspiral_range_psd: _inspiral_range_psd_values,
+    sensemon_range_psd: _sensemon_range_psd_values,
+}
+
+
 def range_timeseries(
     hoft,
     stride=None,
@@ -622,10 +976,11 @@ def range_timeseries(
     hoft = _get_spectrogram(
         hoft, stride=stride, fftlength=fftlength, overlap=overlap,
         window=window, method=method, nproc=nproc)
-    # loop over time bins
-    out = TimeSeries(
-        [range_func(psd, **rangekwargs).value for psd in hoft],
-    )
+    if range_func in _RANGE_VALUES:  # calculate for all times at once
+        values = _RANGE_VALUES[range_func](hoft, **rangekwargs)
+    else:  # loop over time bins
+        values = [range_func(psd, **rangekwargs).value for psd in hoft]
+    out = TimeSeries(values)
     # finalise output
     out.__array_finalize__(hoft)
     out.override_unit('Mpc')
@@ -740,14 +1095,20 @@ def range_spectrogram(
         ),
         'Hz',
     )
-    frange = (f >= fmin) & (f < fmax)
-    # loop over time bins
-    out = Spectrogram(
-        [range_func(psd[frange], **rangekwargs).value for psd in hoft],
-    )
+    frange = (f >= fmin) & (f < fmax) & (f > 0)  # avoid DC value
+    if range_func in _RANGE_SPECTRUM_VALUES:  # all times at once
+        values = _RANGE_SPECTRUM_VALUES[range_func](
+            f.value[frange],
+            hoft.value[:, frange],
+            **rangekwargs
+        )
+    else:  # loop over time bins
+        values = [range_func(psd[frange], **rangekwargs).value for
+                  psd in hoft]
+    out = Spectrogram(values)
     # finalise output
     out.__array_finalize__(hoft)
     out.override_unit('Mpc' if 'energy' in rangekwargs
                       else 'Mpc^2 / Hz')
-    out.f0 = fmin
+    out.f0 = f[frange][0]
     return out
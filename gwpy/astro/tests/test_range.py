@@ -21,6 +21,7 @@
 
 from unittest import mock
 
+import numpy
 import pytest
 
 from astropy import units
@@ -119,6 +120,56 @@ def test_inspiral_range(psd):
     utils.assert_quantity_almost_equal(r, TEST_RESULTS['inspiral_range'])
 
 
+@SKIP_INSPIRAL_RANGE
+def test_inspiral_range_kernel(psd):
+    """Test that the cached inspiral range kernel matches the full calculation
+    """
+    from inspiral_range import (find_root_redshift, range as range_func)
+    f = psd.frequencies.value
+    frange = (f >= psd.df.value) & (f < 4096)
+    f = f[frange]
+    kernel = astro.range._inspiral_range_kernel(f, mass1=10, mass2=10)
+    assert astro.range._inspiral_range_kernel(
+        f.copy(), mass1=10, mass2=10) is kernel
+
+    # calculate distance for a stack of PSDs at once
+    psds = psd.value[frange] * numpy.array([[.1], [1], [10]])
+    dist, zhor = kernel.distance(psds, approximate=True)
+    assert dist.shape == zhor.shape == (3,)
+    for i, psd_ in enumerate(psds):
+        z = find_root_redshift(
+            lambda z: kernel.waveform.SNR(psd_, z) - 8,
+        )
+        assert zhor[i] == pytest.approx(z, rel=1e-5)
+        assert dist[i] == pytest.approx(
+            range_func(f, psd_, z_hor=z, H=kernel.waveform),
+            rel=1e-5,
+        )
+
+
+@SKIP_INSPIRAL_RANGE
+def test_inspiral_range_exact(psd):
+    """Test that :func:`gwpy.astro.inspiral_range` is exact by default
+    """
+    from inspiral_range import (find_root_redshift, range as range_func)
+    from inspiral_range.waveform import CBCWaveform
+    f = psd.frequencies.value
+    frange = (f >= psd.df.value) & (f < 4096)
+    inspiral = CBCWaveform(f[frange], m1=1.4, m2=1.4)
+    z_hor = find_root_redshift(
+        lambda z: inspiral.SNR(psd.value[frange], z) - 8,
+    )
+    exact = range_func(f[frange], psd.value[frange], z_hor=z_hor, H=inspiral)
+
+    r = astro.inspiral_range(psd)
+    assert r.value == pytest.approx(exact, rel=1e-12)
+    # check that the cached kernel is reused with the same result
+    assert astro.inspiral_range(psd) == r
+
+    approx = astro.inspiral_range(psd, approximate=True)
+    assert approx.value == pytest.approx(exact, rel=1e-5)
+
+
 # -- burst range --------------------------------
 
 def test_burst_range_spectrum(psd):
@@ -204,6 +255,38 @@ def test_range_spectrogram(hoft, rangekwargs, outunit):
     assert spec.df == 4 * units.Hertz
 
 
+@pytest.mark.parametrize('wrapper, range_func, rangekwargs', [
+    pytest.param(
+        astro.range_timeseries,
+        astro.inspiral_range,
+        {'mass1': 10, 'mass2': 10},
+        marks=[SKIP_INSPIRAL_RANGE],
+    ),
+    pytest.param(
+        astro.range_spectrogram,
+        astro.inspiral_range_psd,
+        {},
+        marks=[SKIP_INSPIRAL_RANGE],
+    ),
+    (astro.range_timeseries, astro.sensemon_range, {'fmin': 10}),
+    (astro.range_timeseries, astro.burst_range, {'energy': 1e-2}),
+    (astro.range_spectrogram, astro.sensemon_range_psd, {'fmax': 1000}),
+    (astro.range_spectrogram, astro.burst_range_spectrum, {'energy': 1.}),
+])
+def test_range_vectorized(hoft, wrapper, range_func, rangekwargs):
+    """Check that the vectorized range calculations match a simple loop
+    """
+    spec = hoft.spectrogram(0.25, fftlength=0.25, overlap=0.125)
+    vectorized = wrapper(spec, range_func=range_func, **rangekwargs)
+    looped = wrapper(
+        spec,
+        range_func=lambda psd, **kw: range_func(psd, **kw),
+        **rangekwargs,
+    )
+    assert vectorized.shape[0] == spec.shape[0]
+    utils.assert_quantity_sub_equal(vectorized, looped, almost_equal=True)
+
+
 @pytest.mark.parametrize('range_func', [
     astro.range_timeseries,
     astro.range_spectrogram,
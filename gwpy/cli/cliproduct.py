@@ -426,35 +426,13 @@ class CliProduct(object, metaclass=abc.ABCMeta):
         """
         self.log(2, '---- Loading data -----')
 
-        verb = self.verbose > 1
-        args = self.args
-
-        # determine how we're supposed get our data
-        source = 'cache' if args.framecache is not None else 'nds2'
-
         # Get the data from NDS or Frames
         for start in self.start_list:
-            end = start + self.duration
-            if source == 'nds2':
-                tsd = TimeSeriesDict.get(self.chan_list, start, end,
-                                         verbose=verb, host=args.nds2_server,
-                                         frametype=args.frametype)
-            else:
-                tsd = TimeSeriesDict.read(args.framecache, self.chan_list,
-                                          start=start, end=end)
-
-            for data in tsd.values():
-                if str(data.unit) in BAD_UNITS:
-                    data.override_unit('undef')
-
-                data = self._filter_timeseries(
-                    data, highpass=args.highpass, lowpass=args.lowpass,
-                    notch=args.notch)
-
-                if data.dtype.kind == 'f':  # cast single to double
-                    data = data.astype('float64', order='A', copy=False)
-
-                self.timeseries.append(data)
+            self.timeseries.extend(self._read_data(
+                self.chan_list,
+                start,
+                start + self.duration,
+            ))
 
         # report what we have if they asked for it
         self.log(3, f'Channels: {self.chan_list}')
@@ -464,6 +442,38 @@ class CliProduct(object, metaclass=abc.ABCMeta):
         )
         self.log(3, f'Number of time series: {len(self.timeseries)}')
 
+    def _read_data(self, channels, start, end):
+        """Read and condition data for some channels in a single interval
+
+        Returns a `list` of `~gwpy.timeseries.TimeSeries`, one per channel
+        """
+        verb = self.verbose > 1
+        args = self.args
+
+        # determine how we're supposed get our data
+        if args.framecache is None:
+            tsd = TimeSeriesDict.get(channels, start, end,
+                                     verbose=verb, host=args.nds2_server,
+                                     frametype=args.frametype)
+        else:
+            tsd = TimeSeriesDict.read(args.framecache, channels,
+                                      start=start, end=end)
+
+        out = []
+        for data in tsd.values():
+            if str(data.unit) in BAD_UNITS:
+                data.override_unit('undef')
+
+            data = self._filter_timeseries(
+                data, highpass=args.highpass, lowpass=args.lowpass,
+                notch=args.notch)
+
+            if data.dtype.kind == 'f':  # cast single to double
+                data = data.astype('float64', order='A', copy=False)
+
+            out.append(data)
+        return out
+
     @staticmethod
     def _filter_timeseries(data, highpass=None, lowpass=None, notch=None):
         """Apply highpass, lowpass, and notch filters to some data
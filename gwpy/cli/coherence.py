@@ -19,10 +19,18 @@
 """Coherence plots
 """
 
+import os.path
+import time
 from collections import OrderedDict
 
+import numpy
+
 from ..plot import Plot
 from ..plot.tex import label_to_latex
+from ..signal.spectral import OneToManyCoherence
+from ..table import Table
+from ..utils.mp import multiprocess_with_queues
+from .cliproduct import to_hz
 from .spectrum import Spectrum
 
 __author__ = 'Joseph Areeda <joseph.areeda@ligo.org>'
@@ -43,14 +51,69 @@ class Coherence(Spectrum):
         if ',' in self.ref_chan:
             self.ref_chan = self.ref_chan.split(',')[0]
 
+    @classmethod
+    def init_data_options(cls, parser):
+        super().init_data_options(parser)
+        cls.arg_rank(parser)
+
+    @classmethod
+    def init_plot_options(cls, parser):
+        super().init_plot_options(parser)
+        # unset the default --out so that it can be chosen to match --rank
+        parser.set_defaults(out=None)
+
     @classmethod
     def arg_channels(cls, parser):
         group = super().arg_channels(parser)
         group.add_argument('--ref', help='Reference channel against which '
                                          'others will be compared')
+        group.add_argument('--channel-list', metavar='FILE',
+                           help='file containing a list of channels to '
+                                'compare against the reference, one per line')
+        return group
+
+    @classmethod
+    def arg_rank(cls, parser):
+        """Add an `~argparse.ArgumentGroup` for coherence-ranking options
+        """
+        group = parser.add_argument_group(
+            'Ranking options',
+            'Rank channels by coherence (instead of plotting)',
+        )
+        group.add_argument('--rank', action='store_true',
+                           help='write a table of the channels with the '
+                                'highest coherence in each frequency band '
+                                'to --out (.csv or .h5, default: '
+                                'gwpy-coherence.csv), instead of a plot')
+        group.add_argument('--band', type=to_hz, nargs=2, action='append',
+                           metavar=('FMIN', 'FMAX'),
+                           help='frequency band in which to rank channels '
+                                '(can give multiple), default: all '
+                                'frequencies')
+        group.add_argument('--top', type=int, default=10,
+                           help='number of channels to record per band')
+        group.add_argument('--nproc', type=int, default=1,
+                           help='number of processes to use')
+        group.add_argument('--batch-size', type=int, default=16,
+                           help='number of channels to read and transform '
+                                'at once in each process')
         return group
 
     def _finalize_arguments(self, args):
+        if args.channel_list:
+            with open(args.channel_list, 'r') as fobj:
+                args.chan.append([
+                    line.split('#', 1)[0].strip() for line in fobj
+                    if line.split('#', 1)[0].strip()
+                ])
+        if args.rank:
+            if args.out is None:
+                args.out = 'gwpy-coherence.csv'
+            if _table_format(args.out) is None:
+                raise ValueError(
+                    f"cannot determine output format for {args.out!r}, "
+                    "please use a .csv or .h5 file extension",
+                )
         if args.yscale is None:
             args.yscale = 'linear'
         if args.yscale == 'linear':
@@ -129,3 +192,151 @@ class Coherence(Spectrum):
         if leg is not None:
             leg.set_title('Coherence with:')
         return leg
+
+    # -- ranking --------------------------------
+
+    def run(self):
+        """Make the plot, or the coherence ranking if ``--rank`` was given
+        """
+        if not self.args.rank:
+            return super().run()
+        table = self.rank()
+        write_table(table, self.args.out)
+        self.log(1, f'wrote {self.args.out}')
+
+    def rank(self):
+        """Rank all channels by their coherence with the reference
+
+        Each process reads and transforms ``--batch-size`` channels at a
+        time, reducing the coherence to the peak (and mean) in each band,
+        so that only that many channels are held in memory per process.
+
+        Returns
+        -------
+        table : `~gwpy.table.Table`
+            a table of the ``--top`` channels in each band, for each
+            start time, ordered by peak coherence
+        """
+        args = self.args
+        fftlength = float(args.secpfft)
+        overlap = args.overlap
+        if overlap is not None:
+            overlap *= fftlength
+        others = [c for c in self.chan_list if c != self.ref_chan]
+        batches = [others[i:i + args.batch_size] for
+                   i in range(0, len(others), args.batch_size)]
+
+        # total time (summed over processes) spent in each stage
+        self.timing = OrderedDict((key, 0.) for key in
+                                  ('read', 'fft', 'reduce'))
+
+        rows = []
+        for start in self.start_list:
+            end = start + self.duration
+            _start = time.time()
+            ref = self._read_data([self.ref_chan], start, end)[0]
+            self.timing['read'] += time.time() - _start
+            _start = time.time()
+            engine = OneToManyCoherence(ref, fftlength=fftlength,
+                                        overlap=overlap, window=args.window)
+            self.timing['fft'] += time.time() - _start
+            bands = args.band or [(0, ref.sample_rate.to('Hz').value / 2.)]
+
+            def _rank_batch(channels):
+                timing = []
+                _start = time.time()
+                data = self._read_data(channels, start, end)
+                timing.append(time.time() - _start)
+                _start = time.time()
+                cohs = [coh for _, coh in engine.iter_coherence(
+                    data, batch=len(channels))]
+                timing.append(time.time() - _start)
+                _start = time.time()
+                stats = _band_statistics(cohs, bands)
+                timing.append(time.time() - _start)
+                return [ts.name for ts in data], stats, timing
+
+            wall = time.time()
+            results = multiprocess_with_queues(args.nproc, _rank_batch,
+                                               batches)
+            self.log(2, f'Ranked {len(others)} channels against '
+                        f'{self.ref_chan} at {start} in '
+                        f'{time.time() - wall:.1f} sec')
+
+            # combine results and sort within each band
+            names = [name for result in results for name in result[0]]
+            for result in results:
+                for key, dt in zip(self.timing, result[2]):
+                    self.timing[key] += dt
+            if not names:
+                continue
+            peak, freq, mean = (
+                numpy.concatenate([result[1][i] for result in results])
+                for i in range(3)
+            )
+            _start = time.time()
+            for j, (fmin, fmax) in enumerate(bands):
+                order = numpy.argsort(-peak[:, j], kind='stable')
+                for rank, i in enumerate(order[:args.top], start=1):
+                    rows.append((start, fmin, fmax, rank, names[i],
+                                 peak[i, j], freq[i, j], mean[i, j]))
+            self.timing['reduce'] += time.time() - _start
+
+        for key, dt in self.timing.items():
+            self.log(1, f'{key} took {dt:.1f} sec')
+
+        return Table(
+            rows=rows or None,
+            names=('gps', 'flow', 'fhigh', 'rank', 'channel',
+                   'coherence', 'frequency', 'mean_coherence'),
+            dtype=(int, float, float, int, str, float, float, float),
+        )
+
+
+# -- utilities ----------------------------------------------------------------
+
+def _band_statistics(coherences, bands):
+    """Reduce a list of coherence spectra to statistics in each band
+
+    Returns the peak coherence, the frequency of that peak, and the mean
+    coherence, as arrays of shape ``(len(coherences), len(bands))``.
+    """
+    peak = numpy.zeros((len(coherences), len(bands)))
+    freq = numpy.zeros_like(peak)
+    mean = numpy.zeros_like(peak)
+    if not coherences:
+        return peak, freq, mean
+    frequencies = coherences[0].frequencies.value
+    # a flat channel has undefined (NaN) coherence, treat that as zero
+    data = numpy.nan_to_num(numpy.vstack([c.value for c in coherences]))
+    for j, (fmin, fmax) in enumerate(bands):
+        idx = (frequencies >= fmin) & (frequencies < fmax)
+        if not idx.any():
+            continue
+        band = data[:, idx]
+        argmax = band.argmax(axis=1)
+        peak[:, j] = band[numpy.arange(band.shape[0]), argmax]
+        freq[:, j] = frequencies[idx][argmax]
+        mean[:, j] = band.mean(axis=1)
+    return peak, freq, mean
+
+
+def _table_format(filename):
+    """Return the table format to use for a given output filename
+    """
+    ext = os.path.splitext(filename)[1].lower()
+    if ext in ('.h5', '.hdf', '.hdf5'):
+        return 'hdf5'
+    if ext == '.csv':
+        return 'ascii.csv'
+    return None
+
+
+def write_table(table, filename):
+    """Write a coherence-ranking table to a CSV or HDF5 file
+    """
+    fmt = _table_format(filename)
+    if fmt == 'hdf5':
+        return table.write(filename, format=fmt, path='coherence',
+                           overwrite=True)
+    return table.write(filename, format=fmt, overwrite=True)
@@ -19,7 +19,15 @@
 """Unit tests for :mod:`gwpy.cli.coherence`
 """
 
+from argparse import ArgumentParser
+
+import pytest
+
+from numpy import random
+
 from ... import cli
+from ...table import Table
+from ...timeseries import TimeSeries
 from .base import _TestCliProduct
 from .test_spectrum import TestCliSpectrum as _TestCliSpectrum
 
@@ -37,3 +45,90 @@ class TestCliCoherence(_TestCliSpectrum):
 
     def test_get_suptitle(self, prod):
         assert prod.get_suptitle() == f'Coherence: {prod.chan_list[0]}'
+
+    # -- ranking --------------------------------
+
+    @classmethod
+    def _rank_prod(cls, tmp_path, out, *extra):
+        chanlist = tmp_path / "channels.txt"
+        chanlist.write_text(
+            "# auxiliary channels\n"
+            + "".join(f"Z1:AUX-{i}\n" for i in range(10)),
+        )
+        parser = ArgumentParser()
+        parser.add_argument('--verbose', action='count', default=1)
+        parser.add_argument('--silent', action='store_true')
+        cls.TEST_CLASS.init_cli(parser)
+        args = parser.parse_args(list(map(str, cls.TEST_ARGS + [
+            '--channel-list', chanlist,
+            '--rank',
+            '--out', tmp_path / out,
+            '--batch-size', 3,
+        ] + list(extra))))
+        prod = cls.TEST_CLASS(args)
+
+        # mock data access: Z1:AUX-4 is strongly coherent with the
+        # reference, and Z1:AUX-7 less so
+        random.seed(0)
+        ref = random.normal(size=10240)
+
+        def _read_data(channels, start, end):
+            out = []
+            for chan in channels:
+                random.seed(prod.chan_list.index(chan))
+                data = random.normal(size=10240)
+                if chan == prod.ref_chan:
+                    data = ref
+                elif chan == 'Z1:AUX-4':
+                    data += 2 * ref
+                elif chan == 'Z1:AUX-7':
+                    data += .5 * ref
+                out.append(TimeSeries(data, t0=start, sample_rate=1024,
+                                      name=chan))
+            return out
+
+        prod._read_data = _read_data
+        return prod
+
+    def test_init_channel_list(self, tmp_path):
+        prod = self._rank_prod(tmp_path, 'rank.csv')
+        assert prod.chan_list[:2] == ['X1:TEST-CHANNEL', 'Y1:TEST-CHANNEL']
+        assert prod.chan_list[2:] == [f'Z1:AUX-{i}' for i in range(10)]
+        assert prod.ref_chan == 'X1:TEST-CHANNEL'
+
+    @pytest.mark.parametrize('out', ('rank.csv', 'rank.h5'))
+    def test_run_rank(self, tmp_path, out):
+        if out.endswith('.h5'):
+            pytest.importorskip('h5py')
+        prod = self._rank_prod(tmp_path, out, '--band', 10, 100,
+                               '--band', 100, 200, '--top', 3)
+        prod.run()
+        assert prod.plot is None
+        assert list(prod.timing) == ['read', 'fft', 'reduce']
+
+        table = Table.read(str(tmp_path / out))
+        assert len(table) == 6
+        assert list(table['rank']) == [1, 2, 3] * 2
+        assert list(table['flow']) == [10] * 3 + [100] * 3
+        for band in (table[:3], table[3:]):
+            assert list(band['channel'][:2]) == ['Z1:AUX-4', 'Z1:AUX-7']
+            assert (band['coherence'][:-1] >= band['coherence'][1:]).all()
+            assert ((band['frequency'] >= band['flow'])
+                    & (band['frequency'] < band['fhigh'])).all()
+
+    @pytest.mark.parametrize('out', ('rank.txt', 'rank.png'))
+    def test_rank_errors(self, tmp_path, out):
+        with pytest.raises(ValueError) as exc:
+            self._rank_prod(tmp_path, out)
+        assert str(exc.value).startswith(
+            "cannot determine output format for")
+
+    def test_rank_default_out(self):
+        parser = ArgumentParser()
+        parser.add_argument('--verbose', action='count', default=1)
+        parser.add_argument('--silent', action='store_true')
+        self.TEST_CLASS.init_cli(parser)
+        args = parser.parse_args(list(map(str, self.TEST_ARGS + ['--rank'])))
+        assert self.TEST_CLASS(args).args.out == 'gwpy-coherence.csv'
+        args = parser.parse_args(list(map(str, self.TEST_ARGS)))
+        assert self.TEST_CLASS(args).args.out == 'gwpy.png'
@@ -33,6 +33,39 @@ __author__ = 'Duncan Macleod <duncan.macleod@ligo.org>'
 __all__ = ['SpectralVariance']
 
 
+def _histogram_counts(data, bins):
+    """Histogram each column of a 2-D array using the same bin edges
+
+    This matches calling :func:`numpy.histogram` for each column, with the
+    rightmost bin including its right edge, and values outside of the
+    bins (or NaN) being ignored.
+
+    Parameters
+    ----------
+    data : `numpy.ndarray`
+        2-D array of shape ``(nsamples, ncolumns)``
+
+    bins : `numpy.ndarray`
+        monotonically increasing array of bin edges, including
+        the rightmost edge
+
+    Returns
+    -------
+    counts : `numpy.ndarray`
+        2-D array of shape ``(ncolumns, nbins)``
+    """
+    nbins = bins.size - 1
+    ncol = data.shape[1]
+    index = numpy.searchsorted(bins, data, side='right') - 1
+    index[data == bins[-1]] = nbins - 1  # include right edge
+    valid = (index >= 0) & (index < nbins)
+    flat = index + numpy.arange(ncol) * nbins  # (column, bin) index
+    return numpy.bincount(
+        flat[valid],
+        minlength=ncol * nbins,
+    ).reshape((ncol, nbins))
+
+
 class SpectralVariance(Array2D):
     """A 2-dimensional array containing the variance histogram of a
     frequency-series `FrequencySeries`
@@ -225,8 +258,9 @@ class SpectralVariance(Array2D):
 
         Parameters
         ----------
-        spectrogram : `~gwpy.spectrogram.Spectrogram`
-            input `Spectrogram` data
+        *spectrograms : `~gwpy.spectrogram.Spectrogram`
+            input `Spectrogram` data, or a single iterable (e.g. a
+            generator) that yields `Spectrogram` data
 
         bins : `~numpy.ndarray`, optional
             array of histogram bin edges, including the rightmost edge
@@ -262,10 +296,23 @@ class SpectralVariance(Array2D):
         --------
         numpy.histogram
             The histogram function
+
+        Notes
+        -----
+        Each `Spectrogram` is histogrammed separately and the counts
+        are accumulated, so the input data are never stacked into a
+        single array.
+        If ``bins``, or both of ``low`` and ``high``, are given, a generator
+        of spectrograms is consumed one at a time, otherwise all of the
+        input spectrograms are required up-front to determine the range
+        of the amplitude bins.
         """
         # parse args and kwargs
-        if not spectrograms:
-            raise ValueError("Must give at least one Spectrogram")
+        if (
+            len(spectrograms) == 1
+            and not isinstance(spectrograms[0], numpy.ndarray)
+        ):  # single iterable of spectrograms
+            spectrograms = spectrograms[0]
         bins = kwargs.pop('bins', None)
         low = kwargs.pop('low', None)
         high = kwargs.pop('high', None)
@@ -277,36 +324,43 @@ class SpectralVariance(Array2D):
             raise ValueError("Cannot give both norm=True and density=True, "
                              "please pick one")
 
-        # get data and bins
-        spectrogram = spectrograms[0]
-        data = numpy.vstack([s.value for s in spectrograms])
+        # get bins
+        if bins is None and (low is None or high is None):
+            spectrograms = list(spectrograms)
+            if not spectrograms:
+                raise ValueError("Must give at least one Spectrogram")
+            if low is None:
+                low = min(s.value.min() for s in spectrograms) / 2
+            if high is None:
+                high = max(s.value.max() for s in spectrograms) * 2
         if bins is None:
-            if low is None and log:
-                low = numpy.log10(data.min() / 2)
-            elif low is None:
-                low = data.min()/2
-            elif log:
-                low = numpy.log10(low)
-            if high is None and log:
-                high = numpy.log10(data.max() * 2)
-            elif high is None:
-                high = data.max() * 2
-            elif log:
-                high = numpy.log10(high)
             if log:
-                bins = numpy.logspace(low, high, num=nbins+1)
+                bins = numpy.logspace(numpy.log10(low), numpy.log10(high),
+                                      num=nbins+1)
             else:
                 bins = numpy.linspace(low, high, num=nbins+1)
+        bins = numpy.asarray(bins)
         nbins = bins.size-1
-        qbins = bins * spectrogram.unit
 
-        # loop over frequencies
-        out = numpy.zeros((data.shape[1], nbins))
-        for i in range(data.shape[1]):
-            out[i, :], bins = numpy.histogram(data[:, i], bins,
-                                              density=density)
-            if norm and out[i, :].sum():  # normalise
-                out[i, :] /= out[i, :].sum()
+        # accumulate counts for each spectrogram
+        spectrogram = out = None
+        for spec in spectrograms:
+            if spectrogram is None:
+                spectrogram = spec
+                out = numpy.zeros((spec.shape[1], nbins))
+            out += _histogram_counts(spec.value, bins)
+        if spectrogram is None:
+            raise ValueError("Must give at least one Spectrogram")
+
+        # normalise
+        if norm or density:
+            with numpy.errstate(divide='ignore', invalid='ignore'):
+                total = out.sum(axis=1, keepdims=True)
+                if norm:  # empty rows are left as zeros
+                    out = numpy.divide(out, total, out=out, where=total > 0)
+                else:  # empty rows are NaN, as with numpy.histogram
+                    out /= total * numpy.diff(bins)
+        qbins = bins * spectrogram.unit
 
         # return SpectralVariance
         name = f"{spectrogram.name} variance"
@@ -110,6 +110,49 @@ class TestSpectralVariance(_TestArray2D):
     def test_is_compatible_error_yindex(self, array):
         return NotImplemented
 
+    @pytest.mark.parametrize('kwargs', [
+        {},
+        {'log': True, 'nbins': 20},
+        {'low': .5, 'high': 2., 'nbins': 10, 'norm': True},
+        {'bins': numpy.linspace(0, 3, 11), 'density': True},
+    ])
+    def test_from_spectrogram(self, kwargs):
+        from ...spectrogram import Spectrogram
+        numpy.random.seed(0)
+        specs = [Spectrogram(numpy.random.exponential(size=(n, 16)),
+                             f0=10, df=2, unit='m', name='test') for
+                 n in (20, 30)]
+        data = numpy.vstack([s.value for s in specs])
+        new = self.TEST_CLASS.from_spectrogram(*specs, **kwargs)
+
+        # compare with numpy.histogram for each frequency bin
+        bins = new.bins.value
+        density = kwargs.get('density', False)
+        for i in range(data.shape[1]):
+            counts = numpy.histogram(data[:, i], bins, density=density)[0]
+            if kwargs.get('norm'):
+                counts = counts / counts.sum()
+            utils.assert_allclose(new.value[i], counts)
+        assert new.unit == units.dimensionless_unscaled
+        assert new.bins.unit == units.m
+        assert new.f0 == 10 * units.Hz
+        assert new.name == 'test variance'
+
+    def test_from_spectrogram_iterable(self):
+        from ...spectrogram import Spectrogram
+        numpy.random.seed(0)
+        specs = [Spectrogram(numpy.random.exponential(size=(10, 16)))
+                 for i in range(3)]
+        bins = numpy.linspace(0, 3, 11)
+        utils.assert_quantity_sub_equal(
+            self.TEST_CLASS.from_spectrogram(iter(specs), bins=bins),
+            self.TEST_CLASS.from_spectrogram(*specs, bins=bins),
+        )
+        with pytest.raises(ValueError):
+            self.TEST_CLASS.from_spectrogram()
+        with pytest.raises(ValueError):
+            self.TEST_CLASS.from_spectrogram(bins=bins)
+
     def test_plot(self, array):
         with rc_context(rc={'text.usetex': False}):
             plot = array.plot(yscale='linear')
@@ -24,9 +24,12 @@ relevant data, and sieving large file lists, easier for the user.
 """
 
 import os
+import re
 import warnings
 from collections import (namedtuple, OrderedDict)
 
+import numpy
+
 from ..time import LIGOTimeGPS
 from .utils import (
     FILE_LIKE,
@@ -127,15 +130,256 @@ class _CacheEntry(namedtuple(
             raise
 
 
+class CacheTable(tuple):
+    """An immutable list of file paths with columnar metadata
+
+    A `CacheTable` behaves like a `tuple` of `str` file paths, so can be
+    used anywhere a list of file paths is accepted, but also stores the
+    metadata for each entry as arrays, enabling fast sieving and sorting
+    of very large caches.
+
+    Parameters
+    ----------
+    paths : `list` of `str`
+        the file paths
+
+    start : `numpy.ndarray`
+        the GPS start time of each file
+
+    duration : `numpy.ndarray`
+        the duration (seconds) of each file
+
+    observatory : `list` of `str`, optional
+        the observatory for each file
+
+    description : `list` of `str`, optional
+        the description tag for each file
+
+    See also
+    --------
+    read_cache_table
+        to read a `CacheTable` from a LAL- or FFL-format cache file
+    """
+    def __new__(cls, paths=(), start=(), duration=(), observatory=None,
+                description=None):
+        new = super().__new__(cls, paths)
+        size = len(new)
+        new.start = numpy.array(start, dtype=float, ndmin=1)
+        new.duration = numpy.array(duration, dtype=float, ndmin=1)
+        new.observatory = _object_column(observatory, size)
+        new.description = _object_column(description, size)
+        if not new.start.size == new.duration.size == size:
+            raise ValueError(
+                "start and duration must have the same length as paths",
+            )
+        new._order = None
+        return new
+
+    def __reduce__(self):
+        return (type(self), (
+            tuple(self),
+            self.start,
+            self.duration,
+            self.observatory,
+            self.description,
+        ))
+
+    def __add__(self, other):
+        if not isinstance(other, CacheTable):
+            return super().__add__(other)
+        new = type(self)(
+            tuple(self) + tuple(other),
+            numpy.concatenate((self.start, other.start)),
+            numpy.concatenate((self.duration, other.duration)),
+            numpy.concatenate((self.observatory, other.observatory)),
+            numpy.concatenate((self.description, other.description)),
+        )
+        # if simply appending later entries, we can reuse the sorting
+        if not len(self) or not len(other):
+            return new
+        if other.start.min() > self.start.max():
+            new._order = numpy.concatenate((
+                self.argsort(),
+                other.argsort() + len(self),
+            ))
+        return new
+
+    def __getitem__(self, key):
+        if isinstance(key, (int, numpy.integer)):
+            return super().__getitem__(key)
+        return self._take(numpy.arange(len(self))[key])
+
+    def __repr__(self):
+        return f"<{type(self).__name__}({len(self)} entries)>"
+
+    @classmethod
+    def from_paths(cls, paths):
+        """Create a new `CacheTable` from a list of file paths
+
+        Parameters
+        ----------
+        paths : `list` of `str`
+            the file paths (or :class:`~lal.utils.CacheEntry` objects),
+            each of which must follow the |LIGO-T050017|_ convention
+
+        Raises
+        ------
+        ValueError
+            if any of the paths cannot be parsed
+        """
+        if not paths:
+            return cls()
+        paths, obs, tags, segs = zip(*map(_preformat_entry, paths))
+        return cls(
+            paths,
+            [float(seg[0]) for seg in segs],
+            [float(abs(seg)) for seg in segs],
+            obs,
+            tags,
+        )
+
+    @property
+    def end(self):
+        """The GPS end time of each file
+        """
+        return self.start + self.duration
+
+    def argsort(self):
+        """Return the indices that sort this cache by segment
+
+        Returns
+        -------
+        indices : `numpy.ndarray`
+            the indices of the entries, sorted by start time, then end time
+        """
+        if self._order is None:
+            self._order = numpy.lexsort((self.end, self.start))
+        return self._order
+
+    def _take(self, index):
+        """Return a new `CacheTable` containing only the given entries
+        """
+        return type(self)(
+            [tuple.__getitem__(self, i) for i in index],
+            self.start[index],
+            self.duration[index],
+            self.observatory[index],
+            self.description[index],
+        )
+
+    def sieve(self, segment):
+        """Return the entries of this cache that overlap ``segment``
+
+        The returned entries are in the same order as in this cache.
+
+        Parameters
+        ----------
+        segment : `~gwpy.segments.Segment`, `tuple`
+            the ``[start, stop)`` interval to match against, either end
+            may be `None` to indicate an open interval
+
+        Returns
+        -------
+        sieved : `CacheTable`
+            a new cache containing only matching entries
+        """
+        if not len(self):
+            return self
+        segstart, segend = segment
+        if segstart is None:
+            segstart = -numpy.inf
+        if segend is None:
+            segend = numpy.inf
+
+        # binary-search for entries that might overlap, based on the
+        # longest file duration
+        order = self.argsort()
+        starts = self.start[order]
+        lo = numpy.searchsorted(
+            starts,
+            float(segstart) - self.duration.max(),
+            side="left",
+        )
+        hi = numpy.searchsorted(starts, float(segend), side="left")
+        index = order[lo:hi]
+
+        # then apply the exact test to the candidates
+        index = index[self.end[index] > float(segstart)]
+        return self._take(numpy.sort(index))
+
+    def _contiguous(self):
+        """Split the (sorted) indices of this cache into contiguous groups
+
+        Returns
+        -------
+        groups : `list` of `numpy.ndarray`
+            the indices of each contiguous group of entries
+
+        starts : `numpy.ndarray`
+            the GPS start time of each group
+
+        ends : `numpy.ndarray`
+            the GPS end time of each group
+        """
+        order = self.argsort()
+        starts = self.start[order]
+        ends = numpy.maximum.accumulate(self.end[order])
+        breaks = numpy.flatnonzero(starts[1:] > ends[:-1]) + 1
+        return (
+            numpy.split(order, breaks),
+            starts[numpy.r_[0, breaks]],
+            ends[numpy.r_[breaks - 1, -1]],
+        )
+
+    def cache_segments(self):
+        """Return the segments of data covered by entries in this cache
+
+        Returns
+        -------
+        segments : `~gwpy.segments.SegmentList`
+            a coalesced list of segments
+        """
+        from ..segments import (Segment, SegmentList)
+        if not len(self):
+            return SegmentList()
+        _, starts, ends = self._contiguous()
+        return SegmentList(map(Segment, zip(starts, ends)))
+
+    def find_contiguous(self):
+        """Separate this cache into time-contiguous sub-caches
+
+        Returns
+        -------
+        caches : `iter` of `CacheTable`
+            an interable yielding each contiguous cache, in time order
+        """
+        if not len(self):
+            return
+        for index in self._contiguous()[0]:
+            yield self._take(numpy.sort(index))
+
+
+def _object_column(values, size):
+    """Format a column of metadata for a `CacheTable`
+    """
+    column = numpy.empty(size, dtype=object)
+    if values is not None:
+        column[:] = values
+    return column
+
+
 # -- cache I/O ----------------------------------------------------------------
 
-def _iter_cache(cachefile, gpstype=LIGOTimeGPS):
+def _iter_cache(cachefile, gpstype=LIGOTimeGPS, name=None):
     """Internal method that yields a `_CacheEntry` for each line in the file
 
     This method supports reading LAL- and (nested) FFL-format cache files.
+
+    ``cachefile`` can be any iterable of lines, in which case ``name``
+    should be given as the path of the file the lines were read from.
     """
     try:
-        path = os.path.abspath(cachefile.name)
+        path = os.path.abspath(name or cachefile.name)
     except AttributeError:
         path = None
     for line in cachefile:
@@ -152,6 +396,136 @@ def _iter_cache(cachefile, gpstype=LIGOTimeGPS):
                 raise
 
 
+def _parse_cache_table(text):
+    """Parse the content of a LAL- or FFL-format cache file as a `CacheTable`
+
+    This method only supports files where all lines have the same format,
+    and doesn't support nested FFL files.
+
+    Raises
+    ------
+    ValueError
+        if the text cannot be parsed
+    """
+    nlines = len(text.splitlines())
+    tokens = text.split()
+    if not tokens:
+        return CacheTable()
+    if len(tokens) != 5 * nlines:
+        raise ValueError("cannot parse cache with variable number of columns")
+    columns = [tokens[i::5] for i in range(5)]
+
+    # LAL format: observatory description start duration path
+    if not any(map(_is_number, columns[0] + columns[1])):
+        return CacheTable(
+            columns[4],
+            _float_column(columns[2]),
+            _float_column(columns[3]),
+            columns[0],
+            columns[1],
+        )
+
+    # FFL format: path start duration 0 0
+    paths = columns[0]
+    obs, desc = zip(*map(_ffl_metadata, paths))
+    return CacheTable(
+        paths,
+        _float_column(columns[1]),
+        _float_column(columns[2]),
+        obs,
+        desc,
+    )
+
+
+_NUMBER = re.compile(r"\A[+-]?(\d+\.?\d*|\.\d+)([eE][+-]?\d+)?\Z")
+
+
+def _is_number(value):
+    """Returns `True` if ``value`` is a number written in decimal notation
+
+    Unlike `float`, this doesn't accept ``'inf'`` or ``'nan'``, which are
+    valid LAL-format description tags.
+    """
+    return _NUMBER.match(value) is not None
+
+
+def _float_column(values):
+    """Convert a list of `str` into an array of `float`
+    """
+    return numpy.fromiter(map(float, values), dtype=float, count=len(values))
+
+
+def _ffl_metadata(path):
+    """Parse the observatory and description for a file in an FFL cache
+    """
+    try:
+        observatory, description = os.path.basename(path).split('-', 2)[:2]
+    except ValueError:
+        return None, None
+    return observatory, description
+
+
+def _read_cache_table(cachefile, gpstype=LIGOTimeGPS):
+    """Internal method to read a `CacheTable` from an open file
+    """
+    lines = cachefile.read()
+    if isinstance(lines, bytes):
+        lines = lines.decode('utf-8')
+    try:
+        return _parse_cache_table(lines)
+    except ValueError:
+        pass
+
+    # parse lines one at a time (e.g. for nested FFL files), reusing the
+    # text we already have, as the file might not be seekable
+    return _cache_table_from_entries(_iter_cache(
+        lines.splitlines(),
+        gpstype=gpstype,
+        name=getattr(cachefile, 'name', None),
+    ))
+
+
+def _cache_table_from_entries(entries):
+    """Build a `CacheTable` from an iterable of `_CacheEntry` objects
+    """
+    entries = list(entries)
+    if not entries:
+        return CacheTable()
+    obs, desc, segs, paths = zip(*entries)
+    return CacheTable(
+        paths,
+        [float(seg[0]) for seg in segs],
+        [float(abs(seg)) for seg in segs],
+        obs,
+        desc,
+    )
+
+
+@with_open
+def read_cache_table(cachefile, segment=None):
+    """Read a LAL- or FFL-format cache file as a `CacheTable`
+
+    Parameters
+    ----------
+    cachefile : `str`, `pathlib.Path`, `file`
+        Input file or file path to read.
+
+    segment : `gwpy.segments.Segment`, optional
+        A GPS `[start, stop)` interval, if given only files overlapping this
+        interval will be returned.
+
+    Returns
+    -------
+    cache : `CacheTable`
+        A list of file paths, with associated metadata, as read from the
+        cache file.
+    """
+    cache = _read_cache_table(cachefile)
+    if segment:
+        return cache.sieve(segment)
+    return cache
+
+
 @with_open
 def read_cache(
     cachefile,
@@ -178,21 +552,26 @@ def read_cache(
         interval will be returned.
 
     strict : `bool`, optional
-        If `False` warn about entries that don't follow the LIGO-T050017
-        standard, then skip them; if `True` all errors are raised as
-        exceptions.
+        This option has no effect, the segment for each entry is taken
+        from the cache file, rather than being parsed from the file name.
 
     Returns
     -------
     paths : `list` of `str`
         A list of file paths as read from the cache file.
+
+    See also
+    --------
+    read_cache_table
+        to read a cache file including the metadata for each entry
     """
     # read file
-    cache = [x.path for x in _iter_cache(cachefile, gpstype=coltype)]
+    cache = _read_cache_table(cachefile, gpstype=coltype)
 
     # sieve and sort
     if segment:
-        cache = sieve(cache, segment=segment, strict=strict)
+        cache = cache.sieve(segment)
+    cache = list(cache)
     if sort:
         cache.sort(key=sort)
 
@@ -290,6 +669,8 @@ def is_cache(cache):
             return False
     if HAS_CACHE and isinstance(cache, Cache):
         return True
+    if isinstance(cache, CacheTable):
+        return bool(len(cache))
     return bool(
         isinstance(cache, (list, tuple))
         and cache
@@ -427,7 +808,10 @@ def cache_segments(*caches):
     from ..segments import SegmentList
     out = SegmentList()
     for cache in caches:
-        out.extend(file_segment(e) for e in cache)
+        if isinstance(cache, CacheTable):
+            out.extend(cache.cache_segments())
+        else:
+            out.extend(file_segment(e) for e in cache)
     return out.coalesce()
 
 
@@ -463,6 +847,9 @@ def find_contiguous(*caches):
     caches : `iter` of `list`
         an interable yielding each contiguous cache
     """
+    if len(caches) == 1 and isinstance(caches[0], CacheTable):
+        yield from caches[0].find_contiguous()
+        return
     flat = flatten(*caches)
     for segment in cache_segments(flat):
         yield sieve(flat, segment=segment)
@@ -490,6 +877,8 @@ def sieve(cache, segment=None, strict=True):
         if ``strict=False`` is given; these files are excluded from the
         sieved cache.
     """
+    if isinstance(cache, CacheTable):
+        return cache.sieve(segment)
     out = type(cache)()
     for e in cache:
         try:  # try and get the segment for this entry
@@ -34,13 +34,16 @@ variable to point to the directory containing FFL files, **or** the
 ``ffl` subdirectory, which contains FFL files.
 """
 
+import json
 import os
 import os.path
 import re
+import time
 import warnings
 from collections import defaultdict
 from functools import wraps
 from http.client import HTTPException
+from io import StringIO
 
 from ligo.segments import (
     segment as LigoSegment,
@@ -48,8 +51,16 @@ from ligo.segments import (
 )
 
 from ..time import to_gps
-from .cache import (cache_segments, read_cache_entry, _iter_cache)
-from .gwf import (num_channels, iter_channel_names)
+from ..utils.env import bool_env
+from .cache import (
+    CacheTable,
+    cache_segments,
+    read_cache_entry,
+    _cache_table_from_entries,
+    _iter_cache,
+    _parse_cache_table,
+)
+from .gwf import iter_channel_names
 from .utils import file_path
 
 __author__ = 'Duncan Macleod <duncan.macleod@ligo.org>'
@@ -73,6 +84,85 @@ LOW_PRIORITY_TYPE = re.compile("({})".format("|".join((
 
 # -- utilities ----------------------------------------------------------------
 
+class _FflFile(object):
+    """In-process record of the parsed contents of an FFL file
+
+    The contents are only re-read if the file has been modified, and if
+    the file has only been appended to (the usual case for live FFL files)
+    only the new lines are parsed.
+    """
+    def __init__(self, path, site, tag):
+        self.path = path
+        self.site = site
+        self.tag = tag
+        self._reset()
+
+    def _reset(self):
+        self.stat = None
+        self.offset = 0  # position of the end of the last parsed line
+        self.last = b""  # the last parsed line, including the newline
+        self.cache = CacheTable()
+
+    def _is_extended(self, fobj, size):
+        """Returns `True` if the file content we have already parsed is
+        unchanged
+        """
+        if size < self.offset:  # file has been truncated
+            return False
+        fobj.seek(self.offset - len(self.last))
+        return fobj.read(len(self.last)) == self.last
+
+    def read(self):
+        """Return the contents of this file as a `CacheTable`
+        """
+        stat = os.stat(self.path)
+        if self.stat is not None and (
+            (stat.st_mtime, stat.st_size)
+            == (self.stat.st_mtime, self.stat.st_size)
+        ):  # file not modified since last read
+            return self.cache
+
+        with open(self.path, 'rb') as fobj:
+            if not self._is_extended(fobj, stat.st_size):
+                self._reset()
+            fobj.seek(self.offset)
+            new = fobj.read()
+
+        # only parse complete lines, the last line may still be being written
+        end = new.rfind(b"\n") + 1
+        if end:
+            lines = new[:end]
+            self.cache = self.cache + self._parse(lines.decode('utf-8'))
+            self.offset += end
+            self.last = lines[lines.rfind(b"\n", 0, -1) + 1:]
+        self.stat = stat
+        return self.cache
+
+    def _parse(self, text):
+        try:
+            cache = _parse_cache_table(text)
+        except ValueError:  # parse one line at a time (e.g. nested FFL)
+            cache = _cache_table_from_entries(
+                _iter_cache(StringIO(text), gpstype=float),
+            )
+        # override the metadata using the FFL file metadata
+        return CacheTable(
+            cache,
+            cache.start,
+            cache.duration,
+            self.site,
+            self.tag,
+        )
+
+
+#: in-process record of FFL file contents, keyed by file path
+_FFL_CACHE = {}
+
+#: in-process record of ``((mtime, size), (site, tag))`` for each FFL file,
+#: keyed by file path
+_FFL_SITE_TAG = {}
+
+
 class FflConnection(object):
     """API for Virgo FFL queries that mimics `gwdatafind.http.HTTPConnection`
     """
@@ -82,7 +172,6 @@ class FflConnection(object):
     def __init__(self, ffldir=None):
         self.ffldir = ffldir or self._get_ffl_dir()
         self.paths = {}
-        self.cache = {}
         self._find_paths()
 
     # -- utilities ------------------------------
@@ -112,7 +201,7 @@ class FflConnection(object):
             for name in filter(_is_ffl, files):
                 path = os.path.join(root, name)
                 try:
-                    site, tag = self._get_site_tag(path)
+                    site, tag = self._cached_site_tag(path)
                 except (OSError, IOError, AttributeError):
                     # OSError: file is empty (or cannot be read at all)
                     # IOError: as above on python2
@@ -120,40 +209,80 @@ class FflConnection(object):
                     continue
                 paths[(site, tag)] = path
 
+    def _cached_site_tag(self, path):
+        """Return the ``(site, tag)`` for an FFL file
+
+        The result from a previous scan is used, unless the file has
+        been modified since (the same check used for `_FFL_CACHE`).
+        """
+        try:
+            stat = os.stat(path)
+        except OSError:  # can't check for changes, so don't record
+            return self._get_site_tag(path)
+        key = (stat.st_mtime, stat.st_size)
+        try:
+            cached, sitetag = _FFL_SITE_TAG[path]
+        except KeyError:
+            cached = None
+        if cached != key:
+            _FFL_SITE_TAG.pop(path, None)
+            sitetag = self._get_site_tag(path)
+            _FFL_SITE_TAG[path] = key, sitetag
+        return sitetag
+
     # -- readers --------------------------------
 
-    def _read_ffl_cache(self, site, tag):
-        key = (site, tag)
+    def _get_ffl_file(self, site, tag):
         path = self.ffl_path(site, tag)
-
-        # use cached result if already read, and file not modified since
         try:
-            mtime = self.cache[key][0]
+            ffl = _FFL_CACHE[path]
         except KeyError:
-            mtime = 0
-        newm = os.path.getmtime(path)
-        if newm > mtime:  # read FFL file
-            def _update_metadata(entry):
-                return type(entry)(site, tag, entry.segment, entry.path)
-            with open(path, 'r') as fobj:
-                cache = list(map(
-                    _update_metadata,
-                    _iter_cache(fobj, gpstype=float),
-                ))
-            self.cache[key] = newm, cache
-        return self.cache[key][-1]
+            ffl = _FFL_CACHE[path] = _FflFile(path, site, tag)
+        return ffl
+
+    def _read_ffl_cache(self, site, tag):
+        """Read the contents of the FFL file for the given site and tag
+
+        The contents of each file are recorded in memory, and are only
+        re-read if the file has been modified.
+
+        Returns
+        -------
+        cache : `~gwpy.io.cache.CacheTable`
+            the table of file paths and metadata
+        """
+        return self._get_ffl_file(site, tag).read()
 
     @staticmethod
-    def _read_last_line(path):
+    def _read_last_line(path, blocksize=4096):
+        """Read the last complete (newline-terminated) entry in a file
+
+        As for `_FflFile`, a final line without a newline is ignored, as it
+        may still be being written, as are blank lines.
+
+        Raises
+        ------
+        OSError
+            if the file contains no complete entries
+        """
         with open(path, 'rb') as fobj:
-            # read last line of file only
-            fobj.seek(-2, os.SEEK_END)
-            while fobj.read(1) != b"\n":
-                fobj.seek(-2, os.SEEK_CUR)
-            line = fobj.readline().rstrip()
-            if isinstance(line, bytes):
-                return line.decode('utf-8')
-            return line
+            pos = fobj.seek(0, os.SEEK_END)
+            data = b""
+            while True:
+                start = max(0, pos - blocksize)
+                fobj.seek(start)
+                data = fobj.read(pos - start) + data
+                pos = start
+                # discard anything after the last newline
+                lines = data[:data.rfind(b"\n") + 1].splitlines()
+                if pos:  # the first line might be incomplete
+                    lines = lines[1:]
+                for line in reversed(lines):
+                    if line.strip():
+                        return line.strip().decode('utf-8')
+                if not pos:
+                    raise OSError(f"no complete entries found in {path}")
+                blocksize *= 2
 
     def _get_site_tag(self, path):
         # tag is just name of file minus extension
@@ -201,14 +330,8 @@ class FflConnection(object):
         """Find all files of the given type in the [start, end) GPS interval.
         """
         span = LigoSegment(gpsstart, gpsend)
-        cache = [
-            e for e in self._read_ffl_cache(site, frametype) if (
-                e.observatory == site
-                and e.description == frametype
-                and e.segment.intersects(span)
-            )
-        ]
-        urls = [e.path for e in cache]
+        cache = self._read_ffl_cache(site, frametype).sieve(span)
+        urls = list(cache)
         missing = LigoSegmentList([span]) - cache_segments(cache)
 
         if match:
@@ -230,15 +353,15 @@ class FflConnection(object):
         """Return the most recent file of a given type.
         """
         try:
-            urls = [self.cache[(site, frametype)][-1].path]
-        except KeyError:
-            try:
-                path = self.ffl_path(site, frametype)
+            path = self.ffl_path(site, frametype)
+            if path in _FFL_CACHE:  # update the contents we already have
+                urls = list(_FFL_CACHE[path].read()[-1:])
+            else:
                 urls = [
                     read_cache_entry(self._read_last_line(path), gpstype=float)
                 ]
-            except (KeyError, OSError):
-                urls = []
+        except (KeyError, OSError):
+            urls = []
         if urls or on_missing == 'ignore':
             return urls
 
@@ -413,14 +536,140 @@ def _error_missing_channels(required, found, gpstime, allow_tape):
 def _rank_types(match):
     """Rank and sort the matched frametypes according to some criteria
 
-    ``matches`` is a dict of (channel, [(type, gwf, gapsize), ...])
-    entries.
+    ``matches`` is a dict of (channel, [(type, gwf, gapsize, index), ...])
+    entries, where ``index`` is the set of channels in that type.
     """
     paths = set(typetuple[1] for key in match for typetuple in match[key])
-    rank = {path: (on_tape(path), num_channels(path)) for path in paths}
+    tape = {path: on_tape(path) for path in paths}
     # deprioritise types on tape and those with lots of channels
     for key in match:
-        match[key].sort(key=lambda x: (-x[2],) + rank[x[1]])
+        match[key].sort(key=lambda x: (-x[2], tape[x[1]], len(x[3])))
+
+
+# -- channel index ------------------------------------------------------------
+
+#: duration (seconds) of the GPS epochs over which the list of channels
+#: in a given frametype is assumed to be unchanged
+CHANNEL_INDEX_EPOCH = 86400
+
+#: maximum age (seconds) of a channel index before it is rebuilt
+CHANNEL_INDEX_EXPIRY = 86400 * 7
+
+#: in-process record of the channels in each frametype,
+#: keyed by ``(observatory, frametype, epoch)``
+_CHANNEL_INDEX = {}
+
+
+def _channel_index_key(observatory, frametype, gpstime):
+    """Return the key for the channel index of a frametype at a GPS time
+
+    If ``gpstime`` is `None` the current GPS time is used.
+    """
+    if gpstime is None:
+        gpstime = to_gps('now')
+    return observatory, frametype, int(gpstime) // CHANNEL_INDEX_EPOCH
+
+
+def _channel_index_path(key):
+    """Return the path of the on-disk record for this channel index
+    """
+    from astropy.config.paths import get_cache_dir
+    cachedir = os.path.join(get_cache_dir('gwpy'), 'channel-index')
+    return os.path.join(cachedir, '{}-{}-{}.json'.format(*key))
+
+
+def _read_channel_index(key):
+    """Read the channel index for this key from disk
+
+    Returns `None` if no (unexpired) record is found.
+    """
+    path = _channel_index_path(key)
+    try:
+        with open(path, 'r') as fobj:
+            record = json.load(fobj)
+    except (OSError, ValueError):  # missing or corrupt record
+        return None
+    if time.time() - record['created'] > CHANNEL_INDEX_EXPIRY:
+        return None
+    return record['created'], frozenset(record['channels'])
+
+
+def _write_channel_index(key, created, channels):
+    """Write the channel index for this key to disk
+    """
+    path = _channel_index_path(key)
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp = f"{path}.{os.getpid()}.tmp"
+        with open(tmp, 'w') as fobj:
+            json.dump({
+                'created': created,
+                'channels': sorted(channels),
+            }, fobj)
+        os.replace(tmp, path)
+    except OSError as exc:  # failing to persist the index isn't fatal
+        warnings.warn(f"failed to write channel index to {path}: {exc}")
+
+
+def channel_index(observatory, frametype, path, gpstime=None, cache=None):
+    """Return the set of channel names stored in a frametype
+
+    The channel list is read from the table-of-contents of the
+    representative frame file ``path`` once for each
+    ``(observatory, frametype, epoch)``, where the epoch is
+    ``gpstime // CHANNEL_INDEX_EPOCH``, and is then reused for all
+    subsequent queries until it is older than `CHANNEL_INDEX_EXPIRY`
+    seconds.
+
+    Parameters
+    ----------
+    observatory : `str`
+        the prefix of the observatory
+
+    frametype : `str`
+        the name of the frametype
+
+    path : `str`
+        the path of a frame file of this type
+
+    gpstime : `int`, optional
+        the GPS time of interest, defaults to now
+
+    cache : `bool`, optional
+        whether to persist the index on disk, so that it can be reused
+        by other processes, defaults to the value of the ``GWPY_CACHE``
+        environment variable
+
+    Returns
+    -------
+    channels : `frozenset` of `str`
+        the names of all channels in the frametype
+    """
+    if cache is None:
+        cache = bool_env('GWPY_CACHE', False)
+    key = _channel_index_key(observatory, frametype, gpstime)
+    now = time.time()
+
+    # check the in-memory record
+    try:
+        created, channels = _CHANNEL_INDEX[key]
+    except KeyError:
+        pass
+    else:
+        if now - created <= CHANNEL_INDEX_EXPIRY:
+            return channels
+
+    # check the on-disk record
+    record = _read_channel_index(key) if cache else None
+
+    # otherwise read the TOC of the representative frame
+    if record is None:
+        record = (now, frozenset(iter_channel_names(path)))
+        if cache:
+            _write_channel_index(key, *record)
+
+    _CHANNEL_INDEX[key] = record
+    return record[1]
 
 
 # -- user methods -------------------------------------------------------------
@@ -560,30 +809,22 @@ def find_frametype(channel, gpstime=None, frametype_match=None,
             # check for gaps in the record for this type
             gaps = _find_gaps(ifo, ftype, gpssegment, on_gaps, connection)
 
-            # search the TOC for one frame file and match any channels
-            found = 0
-            nchan = len(names)
+            # match all channels against the index of this type
             try:
-                for n in iter_channel_names(path):
-                    if n in names:  # frametype includes this channel!
-                        # count how many channels we have found in this type
-                        found += 1
-
-                        # record the match using the user-given channel name
-                        match[names[n]].append((ftype, path, gaps))
-
-                        # if only matching once, don't search other types
-                        # for this channel
-                        if not return_all:
-                            names.pop(n)
-
-                        if found == nchan:  # all channels have been found
-                            break
+                index = channel_index(ifo, ftype, path, gpstime=gpstime)
             except RuntimeError as exc:  # failed to open file (probably)
                 warnings.warn(
                     f"failed to read channels for type {ftype!r}: {exc}:",
                 )
                 continue
+            for n in names.keys() & index:
+                # record the match using the user-given channel name
+                match[names[n]].append((ftype, path, gaps, index))
+
+                # if only matching once, don't search other types
+                # for this channel
+                if not return_all:
+                    names.pop(n)
 
             # record this type as having been searched
             searched.add((ifo, ftype))
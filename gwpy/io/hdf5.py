@@ -113,12 +113,14 @@ def with_write_hdf5(func):
     - ``append=False, overwrite=False``: raise `~exceptions.IOError`
     - ``append=True``: open in mode ``a``
     - ``append=False, overwrite=True``: open in mode ``w``
+
+    ``extend=True`` (to extend existing datasets) implies ``append=True``.
     """
     @wraps(func)
     def decorated_func(obj, fobj, *args, **kwargs):
         # pylint: disable=missing-docstring
         if not isinstance(fobj, h5py.HLObject):
-            append = kwargs.get('append', False)
+            append = kwargs.get('append', False) or kwargs.get('extend', False)
             overwrite = kwargs.get('overwrite', False)
             if os.path.exists(fobj) and not (overwrite or append):
                 raise IOError(f"File exists: {fobj}")
@@ -19,7 +19,9 @@
 """Unit test for `io` module
 """
 
+import io
 import os.path
+import pickle
 import tempfile
 from copy import deepcopy
 
@@ -94,6 +96,145 @@ def test_read_write_cache(cache, tmp_path, format, entry1):
     ) == cache[1::-1]
 
 
+@pytest.mark.parametrize("format", ("lal", "ffl"))
+def test_read_cache_table(cache, tmp_path, format):
+    tmp = tmp_path / "test.lcf"
+    io_cache.write_cache(cache, tmp, format=format)
+
+    table = io_cache.read_cache_table(tmp)
+    assert isinstance(table, io_cache.CacheTable)
+    assert list(table) == cache
+    assert list(table.observatory) == ["A"] * len(cache)
+    assert list(table.description) == ["B"] * len(cache)
+    numpy.testing.assert_array_equal(
+        table.start,
+        [seg[0] for seg in SEGMENTS],
+    )
+    numpy.testing.assert_array_equal(
+        table.duration,
+        [abs(seg) for seg in SEGMENTS],
+    )
+
+    # check sieving
+    sieved = io_cache.read_cache_table(tmp, segment=Segment(0, 2))
+    assert isinstance(sieved, io_cache.CacheTable)
+    assert list(sieved) == cache[:2]
+    numpy.testing.assert_array_equal(sieved.start, table.start[:2])
+
+
+def test_read_cache_table_nested(cache, tmp_path):
+    """Check that `read_cache_table` falls back to line-by-line parsing
+    """
+    nested = tmp_path / "nested.ffl"
+    io_cache.write_cache(cache[1:], nested, format="ffl")
+    tmp = tmp_path / "test.ffl"
+    with tmp.open("w") as tmpf:
+        io_cache.write_cache(cache[:1], tmpf, format="ffl")
+        print(f"{nested} 0 0", file=tmpf)
+    table = io_cache.read_cache_table(tmp)
+    assert list(table) == cache
+    numpy.testing.assert_array_equal(table.end, [1, 2, 5])
+
+
+def test_read_cache_table_nested_unseekable(cache, tmp_path):
+    """Check that `read_cache_table` falls back to line-by-line parsing
+    without rewinding the file
+    """
+    class UnseekableStringIO(io.StringIO):
+        def seekable(self):
+            return False
+
+        def seek(self, *args):
+            raise io.UnsupportedOperation("seek")
+
+    nested = tmp_path / "nested.ffl"
+    io_cache.write_cache(cache[1:], nested, format="ffl")
+    tmp = UnseekableStringIO(f"{cache[0]} 0 1 0 0\n{nested} 0 0\n")
+    table = io_cache.read_cache_table(tmp)
+    assert list(table) == cache
+    numpy.testing.assert_array_equal(table.end, [1, 2, 5])
+
+
+@pytest.mark.parametrize("description", ("inf", "nan", "INF"))
+def test_read_cache_table_lal_numeric_description(tmp_path, description):
+    """Check that LAL-format descriptions that `float` accepts are not
+    mistaken for the start times of an FFL-format cache
+    """
+    tmp = tmp_path / "test.lcf"
+    tmp.write_text(
+        f"X {description} 0 1 /path/to/X-{description}-0-1.gwf\n"
+        f"X {description} 1 1 /path/to/X-{description}-1-1.gwf\n",
+    )
+    table = io_cache.read_cache_table(tmp)
+    assert list(table) == [
+        f"/path/to/X-{description}-0-1.gwf",
+        f"/path/to/X-{description}-1-1.gwf",
+    ]
+    assert list(table.observatory) == ["X", "X"]
+    assert list(table.description) == [description] * 2
+    numpy.testing.assert_array_equal(table.start, [0, 1])
+    numpy.testing.assert_array_equal(table.duration, [1, 1])
+
+
+def test_cache_table(cache, segments):
+    table = io_cache.CacheTable.from_paths(cache[::-1])
+    assert list(table) == cache[::-1]
+    assert list(table[table.argsort()]) == cache
+    assert table[0] == cache[-1]
+    assert isinstance(table[1:], io_cache.CacheTable)
+
+    # check module functions work with a table
+    assert io_cache.is_cache(table)
+    assert not io_cache.is_cache(io_cache.CacheTable())
+    assert list(io_cache.sieve(table, segments[0])) == cache[:1]
+    assert io_cache.cache_segments(table) == segments.coalesce()
+    assert list(map(list, io_cache.find_contiguous(table))) == [
+        cache[1::-1],
+        cache[2:],
+    ]
+
+
+@pytest.mark.parametrize("segment", [
+    (-10, 10),
+    (0.5, 1),
+    (1, 1.5),
+    (2, 4),
+    (3, 4.5),
+    (5, 6),
+    (None, 1.5),
+    (4.5, None),
+])
+def test_cache_table_sieve(segment):
+    """Check that `CacheTable.sieve` matches `sieve`
+    """
+    cache = [
+        "A-B-0-10.txt",
+        "A-B-1-1.txt",
+        "A-B-2-1.txt",
+        "A-B-1.5-0.5.txt",
+        "A-B-4-0.txt",
+        "A-B-4-1.txt",
+    ]
+    start, end = segment
+    full = Segment(
+        -numpy.inf if start is None else start,
+        numpy.inf if end is None else end,
+    )
+    table = io_cache.CacheTable.from_paths(cache)
+    assert list(table.sieve(segment)) == io_cache.sieve(
+        cache,
+        full,
+    )
+
+
+def test_cache_table_pickle(cache):
+    table = io_cache.CacheTable.from_paths(cache)
+    new = pickle.loads(pickle.dumps(table))
+    assert new == table
+    numpy.testing.assert_array_equal(new.start, table.start)
+    numpy.testing.assert_array_equal(new.observatory, table.observatory)
+
+
 @skip_missing_dependency('lal.utils')
 def test_write_cache_cacheentry(cache, tmp_path):
     from lal.utils import CacheEntry
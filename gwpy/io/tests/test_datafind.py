@@ -21,7 +21,6 @@
 
 import os
 from http.client import (HTTPConnection, HTTPException)
-from io import BytesIO
 from itertools import cycle
 from unittest import mock
 
@@ -75,10 +74,13 @@ _mock_iter_channel_names = mock.patch(
     mock.MagicMock(return_value=['L1:LDAS-STRAIN', 'H1:LDAS-STRAIN']),
 )
 
-_mock_num_channels = mock.patch(
-    'gwpy.io.datafind.num_channels',
-    mock.MagicMock(return_value=1),
-)
+
+@pytest.fixture(autouse=True)
+def clear_channel_index():
+    io_datafind._CHANNEL_INDEX.clear()
+    yield
+    io_datafind._CHANNEL_INDEX.clear()
+
 
 # -- FFL tests ----------------------------------------------------------------
 
@@ -124,25 +126,76 @@ class TestFflConnection(object):
             ('X', 'test2'): os.path.join(os.curdir, 'test2.ffl'),
         }
 
-    @mock.patch("builtins.open", return_value=BytesIO(b"""
-/path/to/X-TEST-0-1.gwf 0 1 0 0
-/path/to/X-TEST-1-1.gwf 1 1 0 0
-""".lstrip()))
-    @mock.patch('os.path.getmtime', return_value=1)
-    @mock.patch('gwpy.io.datafind.FflConnection._read_last_line',
-                return_value='X-TEST-0-1.gwf 0 1 0 0')
-    def test_read_ffl_cache(self, mwalk, mreadlast, mgetmtime, mopen):
+    @pytest.fixture(autouse=True)
+    def clear_ffl_cache(self):
+        io_datafind._FFL_CACHE.clear()
+        io_datafind._FFL_SITE_TAG.clear()
+        yield
+        io_datafind._FFL_CACHE.clear()
+        io_datafind._FFL_SITE_TAG.clear()
+
+    @staticmethod
+    def _write_ffl(path, *segments, mode="w"):
+        with open(path, mode) as fobj:
+            for start, dur in segments:
+                print(f"/path/to/X-TEST-{start}-{dur}.gwf {start} {dur} 0 0",
+                      file=fobj)
+
+    def test_read_ffl_cache(self, mwalk, tmp_path):
+        ffl = tmp_path / "test.ffl"
+        self._write_ffl(ffl, (0, 1), (1, 1))
+        mwalk.return_value = [(str(tmp_path), [], ['test.ffl'])]
         conn = self.TEST_CLASS()
-        cache = list(conn._read_ffl_cache('X', 'test'))
-        assert [c.path for c in cache] == [
+        cache = conn._read_ffl_cache('X', 'test')
+        assert list(cache) == [
             '/path/to/X-TEST-0-1.gwf',
             '/path/to/X-TEST-1-1.gwf'
         ]
-        mopen.assert_called_once()
+        assert set(cache.observatory) == {'X'}
+        assert set(cache.description) == {'test'}
 
         # check that calling the same again is a no-op
+        with mock.patch("builtins.open") as mopen:
+            assert conn._read_ffl_cache('X', 'test') is cache
+        mopen.assert_not_called()
+
+        # check that a new connection uses the same record
+        assert self.TEST_CLASS()._read_ffl_cache('X', 'test') is cache
+
+    def test_read_ffl_cache_append(self, mwalk, tmp_path):
+        ffl = tmp_path / "test.ffl"
+        self._write_ffl(ffl, (0, 1), (1, 1))
+        mwalk.return_value = [(str(tmp_path), [], ['test.ffl'])]
+        conn = self.TEST_CLASS()
         conn._read_ffl_cache('X', 'test')
-        mopen.assert_called_once()
+
+        # append to the file (including a partially-written line)
+        self._write_ffl(ffl, (2, 1), mode="a")
+        with ffl.open("a") as fobj:
+            fobj.write("/path/to/X-TEST-3-1.gwf 3")
+        with mock.patch(
+            "gwpy.io.datafind._parse_cache_table",
+            wraps=io_datafind._parse_cache_table,
+        ) as mparse:
+            cache = conn._read_ffl_cache('X', 'test')
+        mparse.assert_called_once_with("/path/to/X-TEST-2-1.gwf 2 1 0 0\n")
+        assert list(cache) == [
+            f'/path/to/X-TEST-{i}-1.gwf' for i in range(3)
+        ]
+        assert conn.find_urls('X', 'test', 2, 3) == [
+            '/path/to/X-TEST-2-1.gwf',
+        ]
+
+        # finish the last line
+        with ffl.open("a") as fobj:
+            fobj.write(" 1 0 0\n")
+        assert conn.find_latest('X', 'test') == ['/path/to/X-TEST-3-1.gwf']
+
+        # check that rewriting the file triggers a full re-read
+        self._write_ffl(ffl, (10, 1), (11, 1), (12, 1), (13, 1))
+        assert list(conn._read_ffl_cache('X', 'test')) == [
+            f'/path/to/X-TEST-{i}-1.gwf' for i in range(10, 14)
+        ]
 
     def test_read_last_line(self, _, tmp_path):
         tmp = tmp_path / "tmp"
@@ -151,6 +204,50 @@ class TestFflConnection(object):
             print('line2', file=fobj)
         assert self.TEST_CLASS._read_last_line(tmp) == 'line2'
 
+    def test_read_last_line_incomplete(self, _, tmp_path):
+        tmp = tmp_path / "tmp"
+        with tmp.open("w") as fobj:
+            print('line1', file=fobj)
+            print('line2', file=fobj)
+            print('', file=fobj)
+            fobj.write('line3')
+        assert self.TEST_CLASS._read_last_line(tmp, blocksize=2) == 'line2'
+
+        # no complete lines at all
+        with tmp.open("w") as fobj:
+            fobj.write('line1')
+        with pytest.raises(OSError):
+            self.TEST_CLASS._read_last_line(tmp)
+
+    @pytest.mark.parametrize("cached", (False, True))
+    def test_find_latest_incomplete(self, mwalk, tmp_path, cached):
+        ffl = tmp_path / "test.ffl"
+        self._write_ffl(ffl, (0, 1), (1, 1))
+        with ffl.open("a") as fobj:
+            fobj.write("/path/to/X-TEST-2-1.gwf 2")
+        mwalk.return_value = [(str(tmp_path), [], ['test.ffl'])]
+        conn = self.TEST_CLASS()
+        if cached:
+            conn._read_ffl_cache('X', 'test')
+        assert (str(ffl) in io_datafind._FFL_CACHE) is cached
+        assert conn.find_latest('X', 'test') == ['/path/to/X-TEST-1-1.gwf']
+
+    def test_site_tag_invalidated(self, mwalk, tmp_path):
+        ffl = tmp_path / "test.ffl"
+        self._write_ffl(ffl, (0, 1))
+        mwalk.return_value = [(str(tmp_path), [], ['test.ffl'])]
+        conn = self.TEST_CLASS()
+        assert conn.find_types('X') == ['test']
+
+        # rewrite the file for a different site
+        with ffl.open("w") as fobj:
+            print("/path/to/Y-TEST-0-100.gwf 0 100 0 0", file=fobj)
+        os.utime(ffl, (0, 0))
+        conn = self.TEST_CLASS()
+        assert conn.find_types('X') == []
+        assert conn.find_types('Y') == ['test']
+        assert io_datafind._FFL_SITE_TAG[str(ffl)][1] == ('Y', 'test')
+
     @mock.patch('gwpy.io.datafind.FflConnection._read_last_line',
                 return_value='X-TEST-0-1.gwf 0 1 0 0')
     def test_ffl_path(self, mwalk, mreadlast):
@@ -170,15 +267,11 @@ class TestFflConnection(object):
         assert conn.find_types('X') == ['test']
         assert conn.find_types(match='test2') == ['test2']
 
-    @mock.patch("builtins.open", return_value=BytesIO(b"""
-/path/to/X-TEST-0-1.gwf 0 1 0 0
-/path/to/X-TEST-1-1.gwf 1 1 0 0
-/path/to/X-TEST-2-1.gwf 2 1 0 0
-""".lstrip()))
-    @mock.patch('os.path.getmtime', return_value=1)
     @mock.patch('gwpy.io.datafind.FflConnection._get_site_tag',
                 side_effect=cycle([('X', 'test'), ('Y', 'test2')]))
-    def test_find_urls(self, mwalk, msitetag, getmtime, mopen):
+    def test_find_urls(self, msitetag, mwalk, tmp_path):
+        self._write_ffl(tmp_path / "test.ffl", (0, 1), (1, 1), (2, 1))
+        mwalk.return_value = [(str(tmp_path), [], ['test.ffl', 'test2.ffl'])]
         conn = self.TEST_CLASS()
         assert conn.find_urls('X', 'test', 0, 2) == [
             '/path/to/X-TEST-0-1.gwf',
@@ -266,7 +359,6 @@ def test_reconnect():
 @_mock_connection
 @_mock_env
 @_mock_iter_channel_names
-@_mock_num_channels
 def test_find_frametype():
     # simple test
     assert io_datafind.find_frametype(
@@ -278,7 +370,6 @@ def test_find_frametype():
 @_mock_connection
 @_mock_env
 @_mock_iter_channel_names
-@_mock_num_channels
 def test_find_frametype_return_all():
     assert io_datafind.find_frametype(
         'L1:LDAS-STRAIN',
@@ -289,7 +380,6 @@ def test_find_frametype_return_all():
 @_mock_connection
 @_mock_env
 @_mock_iter_channel_names
-@_mock_num_channels
 def test_find_frametype_multiple():
     # test multiple channels
     assert io_datafind.find_frametype(
@@ -301,7 +391,6 @@ def test_find_frametype_multiple():
 @_mock_connection
 @_mock_env
 @_mock_iter_channel_names
-@_mock_num_channels
 def test_find_frametype_errors():
     # test missing channel raises sensible error
     with pytest.raises(ValueError) as exc:
@@ -332,10 +421,69 @@ def test_find_frametype_errors():
         assert '[files on tape have not been checked' in str(exc.value)
 
 
+@_mock_connection
+@_mock_env
+def test_find_frametype_channel_index():
+    names = ['X1:TEST-{}'.format(i) for i in range(500)]
+    with mock.patch(
+        'gwpy.io.datafind.iter_channel_names',
+        return_value=iter(names),
+    ) as mock_iter:
+        # resolve many channels at once, and again one-by-one
+        assert io_datafind.find_frametype(
+            names,
+            gpstime=968654552,
+            allow_tape=True,
+        ) == dict.fromkeys(names, 'HW100916')
+        for name in names[:10]:
+            assert io_datafind.find_frametype(
+                name,
+                gpstime=968654552,
+                allow_tape=True,
+            ) == 'HW100916'
+    # but only read the frame TOC once
+    mock_iter.assert_called_once_with(TEST_GWF_FILE)
+
+
+@mock.patch('gwpy.io.datafind.iter_channel_names',
+            return_value=['X1:TEST-1', 'X1:TEST-2'])
+def test_channel_index(mock_iter, tmp_path):
+    key = ('X', 'TEST', 968654552 // io_datafind.CHANNEL_INDEX_EPOCH)
+    path = tmp_path / 'index.json'
+    with mock.patch('gwpy.io.datafind._channel_index_path',
+                    return_value=str(path)) as mock_path:
+        index = io_datafind.channel_index(
+            'X', 'TEST', 'X-TEST-0-1.gwf',
+            gpstime=968654552,
+            cache=True,
+        )
+        assert index == {'X1:TEST-1', 'X1:TEST-2'}
+        mock_path.assert_called_with(key)
+        assert path.is_file()
+
+        # check that a new process reuses the record on disk
+        io_datafind._CHANNEL_INDEX.clear()
+        assert io_datafind.channel_index(
+            'X', 'TEST', 'X-TEST-0-1.gwf',
+            gpstime=968654552 + 1,
+            cache=True,
+        ) == index
+        mock_iter.assert_called_once()
+
+        # check that an expired record gets rebuilt
+        io_datafind._CHANNEL_INDEX.clear()
+        with mock.patch('gwpy.io.datafind.CHANNEL_INDEX_EXPIRY', -1):
+            io_datafind.channel_index(
+                'X', 'TEST', 'X-TEST-0-1.gwf',
+                gpstime=968654552,
+                cache=True,
+            )
+        assert mock_iter.call_count == 2
+
+
 @_mock_connection
 @_mock_env
 @_mock_iter_channel_names
-@_mock_num_channels
 def test_find_best_frametype(connection):
     assert io_datafind.find_best_frametype(
         'L1:LDAS-STRAIN',
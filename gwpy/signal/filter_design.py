@@ -20,8 +20,11 @@
 """
 
 import operator
-from functools import reduce
-from math import (pi, log10)
+from collections import (OrderedDict, namedtuple)
+from fractions import Fraction
+from functools import (reduce, wraps)
+from math import (pi, log10, isclose)
+from threading import RLock
 
 import numpy
 from numpy import fft as npfft
@@ -48,6 +51,163 @@ FIRWIN_DEFAULTS = {
     'window': 'hann',
 }
 
+#: largest decimation factor applied in a single stage
+MAX_DECIMATION_STAGE = 8
+
+#: largest up- or down-sampling factor for polyphase resampling
+MAX_POLYPHASE_FACTOR = 2 ** 16
+
+
+# -- design cache -------------------------------------------------------------
+
+CacheInfo = namedtuple('CacheInfo', ('hits', 'misses', 'maxsize', 'currsize'))
+
+
+def _freeze(value):
+    """Convert a function argument into a hashable key
+
+    Raises `TypeError` if the argument cannot be converted
+    """
+    if isinstance(value, Quantity):
+        return ('Quantity', _freeze(value.value), str(value.unit))
+    if isinstance(value, numpy.ndarray):
+        return ('ndarray', value.dtype.str, value.shape, value.tobytes())
+    if isinstance(value, (list, tuple)):
+        return (type(value).__name__,) + tuple(map(_freeze, value))
+    if isinstance(value, dict):
+        return tuple(sorted((key, _freeze(val)) for key, val in
+                            value.items()))
+    hash(value)
+    return value
+
+
+def _readonly(filt):
+    """Make the arrays of a filter design read-only (in place)
+    """
+    if isinstance(filt, numpy.ndarray):
+        filt.flags.writeable = False
+    elif isinstance(filt, (list, tuple)):
+        filt = tuple(map(_readonly, filt))
+    return filt
+
+
+class _DesignCache(object):
+    """Least-recently-used cache of filter designs
+
+    The cache is disabled (``maxsize=0``) until `enable_cache` is called.
+    """
+    def __init__(self, maxsize=0):
+        self.maxsize = maxsize
+        self._designs = OrderedDict()
+        self._lock = RLock()  # designs may be requested from many threads
+        self.hits = 0
+        self.misses = 0
+
+    def __call__(self, func):
+        """Decorate a filter design function to use this cache
+        """
+        @wraps(func)
+        def wrapped_func(*args, **kwargs):
+            if not self.maxsize:
+                return func(*args, **kwargs)
+            try:
+                key = (func.__name__, _freeze(args), _freeze(kwargs))
+            except TypeError:  # can't hash these arguments
+                return func(*args, **kwargs)
+            with self._lock:
+                filt = self._designs.get(key)
+                if filt is not None:
+                    self.hits += 1
+                    self._designs.move_to_end(key)
+                    return filt
+            filt = _readonly(func(*args, **kwargs))
+            with self._lock:
+                self.misses += 1
+                self._designs[key] = filt
+                self._evict()
+            return filt
+
+        return wrapped_func
+
+    def _evict(self):
+        with self._lock:
+            while len(self._designs) > self.maxsize:
+                self._designs.popitem(last=False)
+
+    def info(self):
+        return CacheInfo(self.hits, self.misses, self.maxsize,
+                         len(self._designs))
+
+    def clear(self):
+        with self._lock:
+            self._designs.clear()
+            self.hits = self.misses = 0
+
+
+_CACHE = _DesignCache()
+
+
+def enable_cache(maxsize=128):
+    """Enable caching of filter designs
+
+    Once enabled, the results of `lowpass`, `highpass`, `bandpass`, and
+    `notch` (and the anti-aliasing filters used by `TimeSeries.resample
+    <gwpy.timeseries.TimeSeries.resample>`) are stored, keyed on all of
+    the design parameters, so that repeated calls with the same
+    parameters (e.g. when filtering many segments of data) return the
+    stored design instead of recalculating it.
+
+    Parameters
+    ----------
+    maxsize : `int`, optional
+        the maximum number of designs to store, once full the least
+        recently used design is discarded
+
+    Notes
+    -----
+    The arrays returned from the cache are read-only, so that a stored
+    design cannot be modified by accident, make a copy if you need to
+    modify a filter design.
+
+    Examples
+    --------
+    >>> from gwpy.signal import filter_design
+    >>> filter_design.enable_cache()
+    >>> for seg in segments:
+    ...     data = TimeSeries.get('X1:TEST', *seg).bandpass(50, 250)
+    >>> print(filter_design.cache_info())
+    CacheInfo(hits=99, misses=1, maxsize=128, currsize=1)
+    """
+    if maxsize < 1:
+        raise ValueError("maxsize must be a positive integer")
+    _CACHE.maxsize = int(maxsize)
+    _CACHE._evict()
+
+
+def disable_cache():
+    """Disable caching of filter designs, and empty the cache
+    """
+    _CACHE.maxsize = 0
+    _CACHE.clear()
+
+
+def clear_cache():
+    """Empty the filter design cache, and reset its statistics
+    """
+    _CACHE.clear()
+
+
+def cache_info():
+    """Return statistics for the filter design cache
+
+    Returns
+    -------
+    info : `CacheInfo`
+        a `~collections.namedtuple` of ``(hits, misses, maxsize, currsize)``,
+        ``maxsize=0`` means the cache is disabled
+    """
+    return _CACHE.info()
+
 
 # -- core filter design utilities ---------------------------------------------
 
@@ -130,6 +290,116 @@ def num_taps(sample_rate, transitionwidth, gpass, gstop):
     )
 
 
+@_CACHE
+def _decimation_filter(factor, ftype='fir', n=None, window='hamming'):
+    """Design an anti-aliasing filter for integer decimation
+
+    See `TimeSeries.resample <gwpy.timeseries.TimeSeries.resample>`
+    for details of the arguments.
+    """
+    if ftype == 'iir':
+        return signal.cheby1(n, 0.05, 0.8/factor, output='zpk')
+    return signal.firwin(n+1, 1./factor, window=window)
+
+
+def _prime_factors(n):
+    """Return the prime factors of ``n`` (in ascending order)
+    """
+    factors = []
+    p = 2
+    while p * p <= n:
+        while not n % p:
+            factors.append(p)
+            n //= p
+        p += 1
+    if n > 1:
+        factors.append(n)
+    return factors
+
+
+def decimation_plan(factor, maxstage=MAX_DECIMATION_STAGE):
+    """Plan the stages of a multi-stage integer decimation
+
+    Large decimation factors are split into the smallest number of
+    stages of at most ``maxstage`` (where possible), with the overall
+    factor spread as evenly as possible between the stages, so that a
+    short (cheap) anti-aliasing filter can be applied in each stage.
+
+    Parameters
+    ----------
+    factor : `int`
+        the overall decimation factor
+
+    maxstage : `int`, optional
+        the largest decimation factor for a single stage, prime factors
+        of ``factor`` larger than this are given their own stage
+
+    Returns
+    -------
+    stages : `list` of `int`
+        the decimation factor for each stage, in the order they should
+        be applied (largest first), the product of which is ``factor``
+
+    Examples
+    --------
+    >>> from gwpy.signal.filter_design import decimation_plan
+    >>> decimation_plan(1024)
+    [8, 8, 4, 4]
+    >>> decimation_plan(1000)
+    [8, 5, 5, 5]
+    """
+    factor = int(factor)
+    if factor < 1:
+        raise ValueError("decimation factor must be a positive integer")
+    primes = _prime_factors(factor)
+    # large primes can't be combined with anything
+    stages = [p for p in primes if p > maxstage]
+    primes = [p for p in primes if p <= maxstage]
+    if primes:
+        nstage = max(1, int(numpy.ceil(
+            round(numpy.log(reduce(operator.mul, primes))
+                  / numpy.log(maxstage), 10))))
+        while True:
+            # assign each prime (largest first) to the smallest stage
+            small = [1] * nstage
+            for p in primes[::-1]:
+                small.sort()
+                small[0] *= p
+            if max(small) <= maxstage:
+                break
+            nstage += 1
+        stages.extend(small)
+    return sorted(stages, reverse=True)
+
+
+def _rational_ratio(new, old):
+    """Return the ``(up, down)`` factors to resample from ``old`` to ``new``
+
+    Returns `None` if the ratio cannot be represented by factors no larger
+    than `MAX_POLYPHASE_FACTOR`.
+    """
+    ratio = Fraction(new) / Fraction(old)
+    approx = ratio.limit_denominator(MAX_POLYPHASE_FACTOR)
+    if (
+        approx.numerator > MAX_POLYPHASE_FACTOR
+        or not isclose(approx, ratio, rel_tol=1e-9)
+    ):
+        return None
+    return approx.numerator, approx.denominator
+
+
+@_CACHE
+def _polyphase_filter(up, down, window='hamming'):
+    """Design an anti-aliasing filter for rational (polyphase) resampling
+
+    This matches the filter design in :func:`scipy.signal.resample_poly`,
+    the output should be scaled by ``up`` before use.
+    """
+    max_rate = max(up, down)
+    half_len = 10 * max_rate
+    return signal.firwin(2 * half_len + 1, 1. / max_rate, window=window)
+
+
 def is_zpk(zpktup):
     """Determin whether the given tuple is a ZPK-format filter definition
 
@@ -370,6 +640,7 @@ def parse_filter(args, analog=False, sample_rate=None):
 
 # -- user methods -------------------------------------------------------------
 
+@_CACHE
 def lowpass(frequency, sample_rate, fstop=None, gpass=2, gstop=30, type='iir',
             **kwargs):
     """Design a low-pass filter for the given cutoff frequency
@@ -432,6 +703,7 @@ def lowpass(frequency, sample_rate, fstop=None, gpass=2, gstop=30, type='iir',
     return _design_fir(frequency, fstop, sample_rate, gpass, gstop, **kwargs)
 
 
+@_CACHE
 def highpass(frequency, sample_rate, fstop=None, gpass=2, gstop=30, type='iir',
              **kwargs):
     """Design a high-pass filter for the given cutoff frequency
@@ -495,6 +767,7 @@ def highpass(frequency, sample_rate, fstop=None, gpass=2, gstop=30, type='iir',
                        **kwargs)
 
 
+@_CACHE
 def bandpass(flow, fhigh, sample_rate, fstop=None, gpass=2, gstop=30,
              type='iir', **kwargs):
     """Design a band-pass filter for the given cutoff frequencies
@@ -564,6 +837,7 @@ def bandpass(flow, fhigh, sample_rate, fstop=None, gpass=2, gstop=30,
                        pass_zero=False, **kwargs)
 
 
+@_CACHE
 def notch(frequency, sample_rate, type='iir', output='zpk', **kwargs):
     """Design a ZPK notch filter for the given frequency and sampling rate
 
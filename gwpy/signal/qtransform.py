@@ -28,9 +28,11 @@ from math import (log, ceil, pi, isinf, exp)
 
 import numpy
 from numpy import fft as npfft
+from scipy import fft as sfft
 
 from ..utils import round_to_power
 from ..segments import Segment
+from .spectral._utils import (as_precision, real_dtype)
 
 __author__ = 'Duncan Macleod <duncan.macleod@ligo.org>'
 __credits__ = 'Scott Coughlin <scott.coughlin@ligo.org>, ' \
@@ -424,14 +426,20 @@ class QTile(QBase):
         """
         from ..timeseries import TimeSeries
 
-        windowed = fseries[self.get_data_indices()] * self.get_window()
+        window = self.get_window().astype(real_dtype(fseries.dtype),
+                                          copy=False)
+        windowed = fseries[self.get_data_indices()] * window
         # pad data, move negative frequencies to the end, and IFFT
         padded = numpy.pad(windowed, self.padding, mode='constant')
         wenergy = npfft.ifftshift(padded)
         # return a `TimeSeries`
         if epoch is None:
             epoch = fseries.epoch
-        tdenergy = npfft.ifft(wenergy)
+        if wenergy.dtype == numpy.complex64:
+            # numpy.fft always returns double precision
+            tdenergy = sfft.ifft(wenergy)
+        else:
+            tdenergy = npfft.ifft(wenergy)
         cenergy = TimeSeries(tdenergy, x0=epoch,
                              dx=self.duration/tdenergy.size, copy=False)
         energy = type(cenergy)(
@@ -634,7 +642,7 @@ class QGram(object):
 
 def q_scan(data, mismatch=DEFAULT_MISMATCH, qrange=DEFAULT_QRANGE,
            frange=DEFAULT_FRANGE, duration=None, sampling=None,
-           **kwargs):
+           dtype=None, **kwargs):
     """Transform data by scanning over a `QTiling`
 
     This utility is provided mainly to allow direct manipulation of the
@@ -661,6 +669,10 @@ def q_scan(data, mismatch=DEFAULT_MISMATCH, qrange=DEFAULT_QRANGE,
     sampling : `float`, optional
         sample rate (Hertz) of input, required if `data` is not a `TimeSeries`
 
+    dtype : `type`, `str`, optional
+        the floating-point precision of the transform, e.g. ``'float32'``,
+        default: `None` (the precision of the frequency-domain data)
+
     **kwargs
         other keyword arguments to be passed to :meth:`QTiling.transform`,
         including ``'epoch'`` and ``'search'``
@@ -681,6 +693,7 @@ def q_scan(data, mismatch=DEFAULT_MISMATCH, qrange=DEFAULT_QRANGE,
         sampling = data.sample_rate.to('Hz').value
         kwargs.update({'epoch': data.t0.value})
         data = data.fft().value
+    data = as_precision(data, dtype)
     # return a raw Q-transform and its significance
     qgram, N = QTiling(duration, sampling, mismatch=mismatch, qrange=qrange,
                        frange=frange).transform(data, **kwargs)
@@ -27,6 +27,7 @@ object.
 """
 
 from ...utils.decorators import deprecated_function
+from ._cache import (cache_info, clear_cache, set_cache_size)
 from ._registry import (get_method, register_method)
 from ._scipy import (
     bartlett,
@@ -37,6 +38,8 @@ from ._scipy import (
     welch,
 )
 from ._ui import (psd, spectrogram, average_spectrogram)
+from ._running import (RunningWelch, RunningMedian, ExponentialAverage)
+from ._coherence import OneToManyCoherence
 
 # register deprecated methods
 from . import (
@@ -0,0 +1,217 @@
+# -*- coding: utf-8 -*-
+# Copyright (C) Duncan Macleod (2014-2020)
+#
+# This file is part of GWpy.
+#
+# GWpy is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# GWpy is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with GWpy.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Cache of FFT plans and window arrays shared by all FFT libraries
+
+Each entry is keyed on ``(kind, library, length, window, dtype)``, and the
+least recently used entry is discarded once the cache is full.
+"""
+
+from collections import (OrderedDict, namedtuple)
+from threading import RLock
+
+import numpy
+
+from scipy.signal import get_window as _scipy_get_window
+
+__author__ = 'Duncan Macleod <duncan.macleod@ligo.org>'
+
+CacheInfo = namedtuple('CacheInfo', ('plan_hits', 'plan_misses',
+                                     'window_hits', 'window_misses',
+                                     'maxsize', 'currsize'))
+
+#: default maximum number of FFT plans and windows to store
+DEFAULT_CACHE_SIZE = 64
+
+
+class _FFTCache(object):
+    """Least-recently-used cache of FFT plans and windows
+    """
+    def __init__(self, maxsize=DEFAULT_CACHE_SIZE):
+        self.maxsize = maxsize
+        self._entries = OrderedDict()
+        self._lock = RLock()
+        self.clear()
+
+    def get(self, kind, key, create):
+        """Return the cached ``kind`` ('plan' or 'window') for ``key``
+
+        If ``key`` is not in the cache, ``create()`` is called to make
+        the new entry.
+        """
+        key = (kind,) + tuple(key)
+        with self._lock:
+            try:
+                value = self._entries[key]
+            except KeyError:
+                pass
+            else:
+                self._hits[kind] += 1
+                self._entries.move_to_end(key)
+                return value
+        value = create()
+        with self._lock:
+            self._misses[kind] += 1
+            if self.maxsize:
+                self._entries[key] = value
+                self._evict()
+        return value
+
+    def _evict(self):
+        with self._lock:
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def info(self):
+        with self._lock:
+            return CacheInfo(
+                self._hits['plan'], self._misses['plan'],
+                self._hits['window'], self._misses['window'],
+                self.maxsize, len(self._entries),
+            )
+
+    def entries(self, kind, library):
+        """Return a list of ``(key, value)`` pairs for ``kind`` and ``library``
+
+        Each ``key`` is the cache key without the leading
+        ``(kind, library)``.
+        """
+        with self._lock:
+            return [(key[2:], value) for key, value in self._entries.items()
+                    if key[:2] == (kind, library)]
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._hits = {'plan': 0, 'window': 0}
+            self._misses = {'plan': 0, 'window': 0}
+
+
+_CACHE = _FFTCache()
+
+
+def _window_key(window):
+    """Return a hashable key for a window specification
+    """
+    if isinstance(window, list):
+        return tuple(window)
+    return window
+
+
+def get_window(window, length, library='scipy', dtype='float64',
+               create=None):
+    """Return a (cached) window array
+
+    Parameters
+    ----------
+    window : `str`, `tuple`
+        the window specification, see :func:`scipy.signal.get_window`
+
+    length : `int`
+        the length of the window (samples)
+
+    library : `str`, optional
+        the name of the FFT library that will use the window
+
+    dtype : `numpy.dtype`, optional
+        the data type of the window
+
+    create : `callable`, optional
+        function to create a new window, defaults to
+        :func:`scipy.signal.get_window`
+
+    Returns
+    -------
+    window : `numpy.ndarray`, or the library-specific window type
+        the window, `numpy.ndarray` windows are read-only
+    """
+    if create is None:
+        def create():
+            win = _scipy_get_window(window, length).astype(dtype, copy=False)
+            win.flags.writeable = False
+            return win
+    return _CACHE.get(
+        'window',
+        (library, length, _window_key(window), numpy.dtype(dtype).str),
+        create,
+    )
+
+
+def get_fft_plan(length, library, dtype='float64', create=None, **params):
+    """Return a (cached) FFT plan
+
+    Parameters
+    ----------
+    length : `int`
+        the length of the FFT (samples)
+
+    library : `str`
+        the name of the FFT library that will use the plan
+
+    dtype : `numpy.dtype`, optional
+        the data type of the plan
+
+    create : `callable`
+        function to create a new plan
+
+    **params
+        other parameters that identify the plan (e.g. ``forward=True``)
+
+    Returns
+    -------
+    plan
+        the library-specific FFT plan
+    """
+    return _CACHE.get(
+        'plan',
+        (library, length, tuple(sorted(params.items())),
+         numpy.dtype(dtype).str),
+        create,
+    )
+
+
+def cache_info():
+    """Return statistics for the FFT plan and window cache
+
+    Returns
+    -------
+    info : `CacheInfo`
+        a `~collections.namedtuple` of ``(plan_hits, plan_misses,
+        window_hits, window_misses, maxsize, currsize)``
+    """
+    return _CACHE.info()
+
+
+def clear_cache():
+    """Empty the FFT plan and window cache, and reset its statistics
+    """
+    _CACHE.clear()
+
+
+def set_cache_size(maxsize):
+    """Set the maximum number of FFT plans and windows to store
+
+    Parameters
+    ----------
+    maxsize : `int`
+        the new maximum size, ``0`` disables the cache
+    """
+    if maxsize < 0:
+        raise ValueError("maxsize must be a non-negative integer")
+    _CACHE.maxsize = int(maxsize)
+    _CACHE._evict()
@@ -0,0 +1,270 @@
+# -*- coding: utf-8 -*-
+# Copyright (C) Duncan Macleod (2014-2020)
+#
+# This file is part of GWpy.
+#
+# GWpy is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# GWpy is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with GWpy.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Coherence between one reference channel and many others
+
+The Fourier transforms of the reference data are calculated once, and
+the other channels are transformed in batches, so that the cost of each
+additional channel is only the FFT of that channel.
+"""
+
+import numpy
+from numpy.lib.stride_tricks import as_strided
+
+from ...frequencyseries import FrequencySeries
+from . import _cache as fft_cache
+from ._ui import (
+    _normalize_overlap,
+    _normalize_window,
+    seconds_to_samples,
+)
+
+__author__ = 'Duncan Macleod <duncan.macleod@ligo.org>'
+
+__all__ = ['OneToManyCoherence']
+
+
+def _segments(data, nstride, nfft, nstep):
+    """Return a strided view of the FFT segments of each stride of ``data``
+
+    The input array should have time along the last axis, the output
+    array will have shape ``data.shape[:-1] + (nstrides, nseg, nfft)``.
+    """
+    nstrides = data.shape[-1] // nstride
+    nseg = (nstride - nfft) // nstep + 1
+    step = data.strides[-1]
+    return as_strided(
+        data,
+        shape=data.shape[:-1] + (nstrides, nseg, nfft),
+        strides=data.strides[:-1] + (nstride * step, nstep * step, step),
+        writeable=False,
+    )
+
+
+class OneToManyCoherence(object):
+    """Calculate the coherence between one reference and many other channels
+
+    Parameters
+    ----------
+    reference : `~gwpy.timeseries.TimeSeries`
+        the reference data (e.g. the calibrated strain)
+
+    fftlength : `float`, optional
+        number of seconds in single FFT, defaults to a single FFT
+        covering the full duration (or ``stride``)
+
+    overlap : `float`, optional
+        number of seconds of overlap between FFTs, defaults to the
+        recommended overlap for the given window (if given), or 0
+
+    window : `str`, `numpy.ndarray`, optional
+        window function to apply to timeseries prior to FFT,
+        see :func:`scipy.signal.get_window` for details on acceptable
+        formats
+
+    stride : `float`, optional
+        number of seconds in single coherence estimate, if given a
+        `~gwpy.spectrogram.Spectrogram` is returned for each channel,
+        otherwise a single `~gwpy.frequencyseries.FrequencySeries`
+        covering the full duration
+
+    Notes
+    -----
+    The coherence is calculated using Welch's method (mean average),
+    identically to :meth:`TimeSeries.coherence
+    <gwpy.timeseries.TimeSeries.coherence>`.
+    If the other data have a higher sampling rate than the reference,
+    they are resampled to match it; if they have a lower sampling rate,
+    the reference is resampled (once for each rate) instead.
+
+    The complex FFTs of every segment of the reference data are held
+    in memory, which requires ~8 bytes per sample of the reference data
+    (or more for overlapping segments).
+
+    Examples
+    --------
+    >>> from gwpy.signal.spectral import OneToManyCoherence
+    >>> engine = OneToManyCoherence(data['H1:GDS-CALIB_STRAIN'], 8, 4)
+    >>> for name, coh in engine.iter_coherence(aux.values()):
+    ...     print(name, coh.max())
+    """
+    def __init__(self, reference, fftlength=None, overlap=None,
+                 window='hann', stride=None):
+        self.reference = reference
+        self.fftlength = fftlength
+        self.overlap = overlap
+        self.window = window
+        self.stride = stride
+        self._cache = {}
+        # transform the reference data now, so that copies of this object
+        # (e.g. in forked processes) don't have to repeat the work
+        self._params(reference.sample_rate.to('Hz').value)
+
+    def _params(self, rate):
+        """Return the FFT parameters and reference FFTs for a sample rate
+        """
+        try:
+            return self._cache[rate]
+        except KeyError:
+            pass
+        reference = self.reference
+        if reference.sample_rate.to('Hz').value != rate:
+            reference = reference.resample(rate)
+        duration = self.stride or reference.duration
+        params = {}
+        params['nstride'] = nstride = seconds_to_samples(duration, rate)
+        params['nfft'] = nfft = seconds_to_samples(
+            self.fftlength or duration, rate)
+        noverlap = _normalize_overlap(self.overlap, self.window, nfft, rate)
+        params['nstep'] = nfft - noverlap
+        if nfft > nstride:
+            raise ValueError("fftlength cannot be greater than stride")
+        window = _normalize_window(self.window, nfft, None, reference.dtype)
+        if window is None:  # match the default of scipy.signal.coherence
+            window = fft_cache.get_window('hann', nfft)
+        params['window'] = numpy.asarray(window)
+        params['frequencies'] = numpy.fft.rfftfreq(nfft, 1 / rate)
+        params['size'] = reference.size
+        params['fft'] = fft = self._fft(reference.value, params)
+        params['power'] = (fft.real ** 2 + fft.imag ** 2).sum(axis=-2)
+        self._cache[rate] = params
+        return params
+
+    @staticmethod
+    def _fft(data, params):
+        """Calculate the (windowed, detrended) FFT of each segment
+        """
+        segments = _segments(
+            numpy.asarray(data, dtype=float),
+            params['nstride'],
+            params['nfft'],
+            params['nstep'],
+        )
+        segments = segments - segments.mean(axis=-1, keepdims=True)
+        segments *= params['window']
+        return numpy.fft.rfft(segments, axis=-1)
+
+    def _prepare(self, other):
+        """Resample ``other`` if required, and return it with its rate
+        """
+        ref = self.reference.sample_rate.to('Hz').value
+        rate = other.sample_rate.to('Hz').value
+        if rate > ref:
+            other = other.resample(ref)
+            rate = ref
+        return other, rate
+
+    def _compute(self, data, params):
+        """Calculate the coherence for a 2-D array of data (one per row)
+        """
+        fft = self._fft(data, params)
+        csd = numpy.einsum('ijk,cijk->cik', params['fft'].conj(), fft)
+        power = (fft.real ** 2 + fft.imag ** 2).sum(axis=-2)
+        with numpy.errstate(divide='ignore', invalid='ignore'):
+            return (
+                (csd.real ** 2 + csd.imag ** 2)
+                / (params['power'] * power)
+            )
+
+    def _format(self, coh, other, params):
+        name = "Coherence between {} and {}".format(
+            self.reference.name,
+            other.name,
+        )
+        if self.stride is None:
+            return FrequencySeries(
+                coh[0],
+                frequencies=params['frequencies'],
+                unit='coherence',
+                name=name,
+                epoch=self.reference.epoch,
+                channel=self.reference.channel,
+                copy=False,
+            )
+        from ...spectrogram import Spectrogram
+        return Spectrogram(
+            coh,
+            epoch=self.reference.epoch,
+            dt=self.stride,
+            f0=0,
+            df=params['frequencies'][1],
+            unit='coherence',
+            name=name,
+            channel=self.reference.channel,
+            copy=False,
+        )
+
+    def coherence(self, other):
+        """Calculate the coherence between the reference and another channel
+
+        Parameters
+        ----------
+        other : `~gwpy.timeseries.TimeSeries`
+            the other data, must cover the same span as the reference
+
+        Returns
+        -------
+        coherence : `~gwpy.frequencyseries.FrequencySeries`, `Spectrogram`
+            the coherence, as a `~gwpy.spectrogram.Spectrogram` if
+            ``stride`` was given
+        """
+        return next(self.iter_coherence([other]))[1]
+
+    def iter_coherence(self, others, batch=16):
+        """Calculate the coherence between the reference and many channels
+
+        Parameters
+        ----------
+        others : `iterable` of `~gwpy.timeseries.TimeSeries`
+            the other data, each must cover the same span as the reference,
+            these are read (and transformed) ``batch`` at a time, so can
+            be given as a generator to limit memory usage
+
+        batch : `int`, optional
+            the number of channels to transform at once
+
+        Yields
+        ------
+        name : `str`
+            the name of each channel (in the same order as ``others``)
+
+        coherence : `~gwpy.frequencyseries.FrequencySeries`, `Spectrogram`
+            the coherence with the reference for each channel
+        """
+        pending = []
+
+        def _flush():
+            params = self._params(pending[0][1])
+            data = numpy.vstack([series.value for series, _ in pending])
+            for (series, _), coh in zip(
+                    pending, self._compute(data, params)):
+                yield series.name, self._format(coh, series, params)
+            pending.clear()
+
+        for other in others:
+            other, rate = self._prepare(other)
+            if other.size != self._params(rate)['size']:
+                raise ValueError(
+                    "Cannot calculate coherence between {} and {}, these "
+                    "data do not cover the same span".format(
+                        self.reference.name, other.name))
+            if pending and (rate != pending[0][1] or len(pending) >= batch):
+                yield from _flush()
+            pending.append((other, rate))
+        if pending:
+            yield from _flush()
@@ -33,17 +33,48 @@ import numpy
 from ...frequencyseries import FrequencySeries
 from ...time import to_gps
 from ..window import canonical_name
+from ._cache import (_CACHE, get_fft_plan, get_window)
 from ._utils import scale_timeseries_unit
 from . import _registry as fft_registry
 
 __author__ = 'Duncan Macleod <duncan.macleod@ligo.org>'
 
-# cache windows and FFT plans internally
-LAL_WINDOWS = {}
-LAL_FFTPLANS = {}
 LAL_FFTPLAN_LEVEL = 1
 
 
+def __getattr__(name):
+    """Provide the deprecated ``LAL_WINDOWS`` and ``LAL_FFTPLANS`` caches
+
+    Windows and plans are now stored in the shared FFT cache, so these
+    are read-only snapshots of the LAL entries in that cache, keyed as
+    before.
+    """
+    if name not in ('LAL_WINDOWS', 'LAL_FFTPLANS'):
+        raise AttributeError(
+            "module {!r} has no attribute {!r}".format(__name__, name))
+    warnings.warn(
+        "{}.{} is deprecated and will be removed in a future release, "
+        "LAL windows and FFT plans are now stored in the shared FFT cache, "
+        "see gwpy.signal.spectral.cache_info and "
+        "gwpy.signal.spectral.clear_cache; the returned dict is a copy "
+        "of the current cache contents".format(__name__, name),
+        DeprecationWarning,
+    )
+    kind = 'window' if name == 'LAL_WINDOWS' else 'plan'
+    entries = _CACHE.entries(kind, 'lal')
+    if not entries:
+        return {}
+    from ...utils.lal import to_lal_type_str
+    out = {}
+    for (length, param, dtype), value in entries:
+        laltype = to_lal_type_str(numpy.dtype(dtype))
+        if kind == 'window':
+            out[(length, str(param), laltype)] = value
+        else:
+            out[(length, dict(param)['forward'], laltype)] = value
+    return out
+
+
 # -- utilities ----------------------------------------------------------------
 
 def generate_fft_plan(length, level=None, dtype='float64', forward=True):
@@ -68,23 +99,24 @@ def generate_fft_plan(length, level=None, dtype='float64', forward=True):
     -------
     plan : `REAL8FFTPlan` or similar
         FFT plan of the relevant data type
+
+    Notes
+    -----
+    Plans are stored in the FFT plan cache,
+    see :func:`gwpy.signal.spectral.cache_info`.
     """
     from ...utils.lal import (find_typed_function, to_lal_type_str)
 
-    # generate key for caching plan
-    laltype = to_lal_type_str(dtype)
-    key = (length, bool(forward), laltype)
+    # validate the type before checking the cache
+    to_lal_type_str(dtype)
 
-    # find existing plan
-    try:
-        return LAL_FFTPLANS[key]
-    # or create one
-    except KeyError:
+    def _create():
         create = find_typed_function(dtype, 'Create', 'FFTPlan')
-        if level is None:
-            level = LAL_FFTPLAN_LEVEL
-        LAL_FFTPLANS[key] = create(length, int(bool(forward)), level)
-        return LAL_FFTPLANS[key]
+        return create(length, int(bool(forward)),
+                      LAL_FFTPLAN_LEVEL if level is None else level)
+
+    return get_fft_plan(length, 'lal', dtype=dtype, create=_create,
+                        forward=bool(forward))
 
 
 def generate_window(length, window=None, dtype='float64'):
@@ -107,31 +139,31 @@ def generate_window(length, window=None, dtype='float64'):
     -------
     `window` : `REAL8Window` or similar
         time-domain window to use for FFT
+
+    Notes
+    -----
+    Windows are stored in the FFT plan cache,
+    see :func:`gwpy.signal.spectral.cache_info`.
     """
     from ...utils.lal import (find_typed_function, to_lal_type_str)
 
     if window is None:
         window = ('kaiser', 24)
 
-    # generate key for caching window
-    laltype = to_lal_type_str(dtype)
-    key = (length, str(window), laltype)
+    # validate the type before checking the cache
+    to_lal_type_str(dtype)
 
-    # find existing window
-    try:
-        return LAL_WINDOWS[key]
-    # or create one
-    except KeyError:
+    def _create():
         # parse window as name and arguments, e.g. ('kaiser', 24)
         if isinstance(window, (list, tuple)):
-            window, beta = window
+            name, beta = window
         else:
-            beta = 0
-        window = canonical_name(window)
-        # create window
+            name, beta = window, 0
         create = find_typed_function(dtype, 'CreateNamed', 'Window')
-        LAL_WINDOWS[key] = create(window, beta, length)
-        return LAL_WINDOWS[key]
+        return create(canonical_name(name), beta, length)
+
+    return get_window(window, length, library='lal', dtype=dtype,
+                      create=_create)
 
 
 def window_from_array(array, dtype=None):
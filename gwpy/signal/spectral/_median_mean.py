@@ -28,11 +28,15 @@ This module is deprecated, and will likely be removed before too long.
 import warnings
 
 from . import _registry as fft_registry
+from ._quantile import approximate_median
 
 __author__ = 'Duncan Macleod <duncan.macleod@ligo.org>'
 
 
-def median_mean(*args, **kwargs):
+def median_mean(*args, approximate=False, **kwargs):
+    if approximate:  # doesn't need another library
+        kwargs.pop('plan', None)
+        return approximate_median(*args, median_mean=True, **kwargs)
     for api_name, api_func in filter(lambda x: x[0].endswith('_median_mean'),
                                      fft_registry.METHODS.items()):
         try:
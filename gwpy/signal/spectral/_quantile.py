@@ -0,0 +1,265 @@
+# -*- coding: utf-8 -*-
+# Copyright (C) Duncan Macleod (2014-2020)
+#
+# This file is part of GWpy.
+#
+# GWpy is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# GWpy is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with GWpy.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Approximate (streaming) median-average PSD estimation
+
+The exact median average requires every periodogram to be held in
+memory at once; the functions in this module instead feed each
+periodogram into a per-frequency-bin quantile sketch, so that the memory
+required is independent of the number of segments.
+"""
+
+import numpy
+
+from scipy.signal import spectrogram as scipy_spectrogram
+
+from ...frequencyseries import FrequencySeries
+from ._utils import scale_timeseries_unit
+
+__author__ = 'Duncan Macleod <duncan.macleod@ligo.org>'
+
+#: number of periodograms to calculate at once
+BATCH_SIZE = 64
+
+
+class P2Quantile(object):
+    """Streaming estimate of a quantile for many variables at once
+
+    This implements the P² algorithm of Jain & Chlamtac (1985), which
+    tracks five 'markers' per variable (the minimum, maximum, the
+    desired quantile, and the two quantiles half-way to each extreme),
+    adjusting the marker heights with a piecewise-parabolic fit as each
+    observation is added.
+    All variables are updated together, so each observation costs
+    a handful of vectorised operations over the variable axis.
+
+    Parameters
+    ----------
+    shape : `int`, `tuple` of `int`
+        the shape of each observation, e.g. the number of frequency bins
+
+    quantile : `float`, optional
+        the quantile to estimate, default: ``0.5`` (the median)
+
+    dtype : `type`, optional
+        the type in which to store the estimate, default: `float`
+
+    Notes
+    -----
+    The memory required is five heights and five positions per variable,
+    regardless of the number of observations.
+    The estimate is always bounded by the smallest and largest
+    observations, and is exact for five or fewer observations.
+    """
+    def __init__(self, shape, quantile=.5, dtype=float):
+        if not 0 < quantile < 1:
+            raise ValueError("quantile must be between 0 and 1")
+        self.shape = numpy.atleast_1d(shape).astype(int)
+        self.quantile = quantile
+        self.count = 0
+        self._heights = numpy.zeros((5,) + tuple(self.shape), dtype=dtype)
+        self._positions = numpy.tile(
+            numpy.arange(1., 6.).reshape((5,) + (1,) * self.shape.size),
+            (1,) + tuple(self.shape),
+        )
+        self._desired = numpy.array([
+            1, 1 + 2 * quantile, 1 + 4 * quantile, 3 + 2 * quantile, 5,
+        ])
+        self._increment = numpy.array([
+            0, quantile / 2, quantile, (1 + quantile) / 2, 1,
+        ])
+
+    def update(self, values):
+        """Add a new observation to this estimate
+
+        Parameters
+        ----------
+        values : `numpy.ndarray`
+            the new observation for each variable
+        """
+        values = numpy.asarray(values, dtype=self._heights.dtype)
+        q = self._heights
+        n = self._positions
+
+        # store the first five observations, sorted
+        if self.count < 5:
+            q[self.count] = values
+            self.count += 1
+            if self.count == 5:
+                q.sort(axis=0)
+            return
+
+        # find the cell containing each new value, extending the extremes
+        numpy.minimum(q[0], values, out=q[0])
+        numpy.maximum(q[4], values, out=q[4])
+        cell = (values >= q[1]).astype(int)
+        cell += values >= q[2]
+        cell += values >= q[3]
+        for i in range(1, 5):
+            n[i] += cell < i
+        self._desired += self._increment
+        self.count += 1
+
+        # adjust the heights of the central markers
+        for i in (1, 2, 3):
+            offset = self._desired[i] - n[i]
+            up = (offset >= 1) & (n[i + 1] - n[i] > 1)
+            down = (offset <= -1) & (n[i - 1] - n[i] < -1)
+            move = up | down
+            if not move.any():
+                continue
+            step = up.astype(float) - down
+            with numpy.errstate(divide='ignore', invalid='ignore'):
+                parabolic = q[i] + step / (n[i + 1] - n[i - 1]) * (
+                    (n[i] - n[i - 1] + step) * (q[i + 1] - q[i])
+                    / (n[i + 1] - n[i])
+                    + (n[i + 1] - n[i] - step) * (q[i] - q[i - 1])
+                    / (n[i] - n[i - 1])
+                )
+                linear = numpy.where(
+                    up,
+                    q[i] + (q[i + 1] - q[i]) / (n[i + 1] - n[i]),
+                    q[i] - (q[i - 1] - q[i]) / (n[i - 1] - n[i]),
+                )
+            good = (q[i - 1] < parabolic) & (parabolic < q[i + 1])
+            q[i] = numpy.where(move, numpy.where(good, parabolic, linear),
+                               q[i])
+            n[i] += step
+
+    @property
+    def value(self):
+        """The current estimate of the quantile for each variable
+
+        :type: `numpy.ndarray`
+        """
+        if not self.count:
+            raise ValueError("no data have been added to this estimate")
+        if self.count < 5:
+            return numpy.quantile(
+                self._heights[:self.count], self.quantile, axis=0,
+            ).astype(self._heights.dtype, copy=False)
+        return self._heights[2].copy()
+
+
+def _median_bias(n):
+    """Return the bias of the median of ``n`` exponential random variables
+
+    This matches the correction applied by :func:`scipy.signal.welch`
+    when ``average='median'``.
+    """
+    ii_2 = 2 * numpy.arange(1., (n - 1) // 2 + 1)
+    return float(1 + numpy.sum(1. / (ii_2 + 1) - 1. / ii_2))
+
+
+def _iter_periodograms(timeseries, segmentlength, noverlap=None,
+                       batch=BATCH_SIZE, **kwargs):
+    """Yield the periodogram of each segment of ``timeseries`` in turn
+
+    Periodograms are calculated ``batch`` segments at a time, so that only
+    that many are held in memory at once.
+    """
+    if noverlap is None:
+        noverlap = segmentlength // 2
+    kwargs.pop('average', None)
+    kwargs.setdefault('window', 'hann')
+    data = timeseries.value
+    nstep = segmentlength - noverlap
+    nseg = max(0, (data.size - segmentlength) // nstep + 1)
+    for first in range(0, nseg, batch):
+        nbatch = min(batch, nseg - first)
+        start = first * nstep
+        freqs, _, psds = scipy_spectrogram(
+            data[start:start + (nbatch - 1) * nstep + segmentlength],
+            fs=timeseries.sample_rate.decompose().value,
+            nperseg=segmentlength,
+            noverlap=noverlap,
+            mode='psd',
+            **kwargs
+        )
+        for psd in psds.T:
+            yield freqs, psd
+
+
+def approximate_median(timeseries, segmentlength, noverlap=None,
+                       median_mean=False, **kwargs):
+    """Calculate an approximate median-average PSD in constant memory
+
+    Parameters
+    ----------
+    timeseries : `~gwpy.timeseries.TimeSeries`
+        input `TimeSeries` data.
+
+    segmentlength : `int`
+        number of samples in single average.
+
+    noverlap : `int`
+        number of samples to overlap between segments, defaults to 50%.
+
+    median_mean : `bool`, optional
+        if `True`, return the mean of the medians of the 'even' and
+        'odd' segments, rather than the median of all segments
+
+    **kwargs
+        other keyword arguments are passed to
+        :func:`scipy.signal.spectrogram`
+
+    Returns
+    -------
+    spectrum : `~gwpy.frequencyseries.FrequencySeries`
+        average power `FrequencySeries`
+
+    Notes
+    -----
+    See :class:`P2Quantile` for details of the estimator, only
+    ``BATCH_SIZE`` periodograms are held in memory at any one time.
+
+    For stationary Gaussian noise averaged over ``N`` segments
+    (with ``N`` of a few hundred or more), the relative difference
+    between the approximate and exact median PSD is typically (in
+    half of the frequency bins) less than ``1/sqrt(N)``, and at most
+    ``3/sqrt(N)``.
+    For comparison, the statistical uncertainty of the exact median of
+    ``N`` periodograms is approximately ``1.44/sqrt(N)``.
+    """
+    nsketch = 2 if median_mean else 1
+    sketches = None
+    for i, (freqs, psd) in enumerate(_iter_periodograms(
+            timeseries, segmentlength, noverlap=noverlap, **kwargs)):
+        if sketches is None:
+            sketches = [P2Quantile(freqs.size, dtype=psd.dtype)
+                        for _ in range(nsketch)]
+        sketches[i % nsketch].update(psd)
+    if sketches is None:
+        raise ValueError("timeseries is too short to calculate a single "
+                         "{}-sample periodogram".format(segmentlength))
+    sketches = [sketch for sketch in sketches if sketch.count]
+    psd_ = numpy.mean([
+        sketch.value / _median_bias(sketch.count) for sketch in sketches
+    ], axis=0)
+    return FrequencySeries(
+        psd_,
+        unit=scale_timeseries_unit(
+            timeseries.unit,
+            kwargs.get('scaling', 'density'),
+        ),
+        frequencies=freqs,
+        name=timeseries.name,
+        epoch=timeseries.epoch,
+        channel=timeseries.channel,
+        copy=False,
+    )
@@ -0,0 +1,387 @@
+# -*- coding: utf-8 -*-
+# Copyright (C) Duncan Macleod (2014-2020)
+#
+# This file is part of GWpy.
+#
+# GWpy is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# GWpy is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with GWpy.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Incremental (online) estimators of the power spectral density
+
+These objects accept contiguous chunks of data one at a time, and
+update their PSD estimate using only the new data, so that a rolling
+PSD (or spectrogram) can be maintained without recalculating the
+periodograms for all of the data each time.
+"""
+
+import numpy
+
+from scipy.signal import spectrogram as scipy_spectrogram
+
+from ...frequencyseries import FrequencySeries
+from ._quantile import _median_bias
+from ._ui import (
+    _normalize_overlap,
+    _normalize_window,
+    seconds_to_samples,
+)
+from ._utils import scale_timeseries_unit
+
+__author__ = 'Duncan Macleod <duncan.macleod@ligo.org>'
+
+__all__ = ['RunningWelch', 'RunningMedian', 'ExponentialAverage']
+
+
+class _RunningSpectrum(object):
+    """Base class for incremental PSD estimators
+
+    Sub-classes should define `_add` to include a new periodogram in the
+    estimate, and `_estimate` to return the current estimate.
+    """
+    def __init__(self, fftlength, overlap=None, window='hann', stride=None):
+        self.fftlength = fftlength
+        self.overlap = overlap
+        self.window = window
+        self.stride = stride
+        self.reset()
+
+    def reset(self):
+        """Remove all data from this estimator
+        """
+        self.metadata = None
+        self.nsegments = 0  # number of segments in the current estimate
+        self._data = None  # samples not yet included in a segment
+        # the following are sample indices relative to the first sample
+        self._nreceived = 0  # number of samples received
+        self._nstart = 0  # start of the next segment
+        self._nfirst = None  # start of the current estimate
+        self._ncolumn = 0  # start of the next spectrogram column
+
+    def _setup(self, series):
+        rate = series.sample_rate
+        self.sample_rate = rate.to('Hz').value
+        self.nfft = seconds_to_samples(self.fftlength, rate)
+        self.noverlap = _normalize_overlap(self.overlap, self.window,
+                                           self.nfft, rate)
+        if self.noverlap >= self.nfft:
+            raise ValueError("overlap must be less than fftlength")
+        self.nstep = self.nfft - self.noverlap
+        if self.stride is None:
+            self.nstride = self.nstep
+        else:
+            self.nstride = seconds_to_samples(self.stride, rate)
+        if self.nstride % self.nstep:
+            raise ValueError("stride must be a multiple of the step between "
+                             "FFT segments (fftlength - overlap)")
+        self._window = _normalize_window(self.window, self.nfft, None,
+                                         series.dtype)
+        self.frequencies = numpy.fft.rfftfreq(self.nfft, 1 / self.sample_rate)
+        self.metadata = {
+            'unit': scale_timeseries_unit(series.unit, scaling='density'),
+            'name': series.name,
+            'channel': series.channel,
+        }
+        self.t0 = float(series.t0.value)
+        self._data = numpy.zeros(0, dtype=series.dtype)
+
+    def _gps(self, index):
+        return self.t0 + index / self.sample_rate
+
+    def update(self, series):
+        """Add new data to this estimate
+
+        Parameters
+        ----------
+        series : `~gwpy.timeseries.TimeSeries`
+            the new data, which must start exactly where the previous
+            data ended
+
+        Returns
+        -------
+        columns : `~gwpy.spectrogram.Spectrogram`
+            a spectrogram containing one column (the current estimate)
+            for each ``stride`` completed by these data,
+            possibly empty
+
+        Raises
+        ------
+        ValueError
+            if the new data are not contiguous with the previous data
+        """
+        from ...spectrogram import Spectrogram
+
+        if self.metadata is None:
+            self._setup(series)
+        else:
+            end = self._gps(self._nreceived)
+            if abs(float(series.t0.value) - end) * self.sample_rate > .5:
+                raise ValueError(
+                    "Cannot update {} with discontiguous data, expected "
+                    "data starting at {}, got {}".format(
+                        type(self).__name__, end, series.t0.value))
+        self._nreceived += series.size
+
+        # calculate periodograms for all complete segments
+        data = numpy.concatenate((self._data, series.value))
+        nseg = max(0, (data.size - self.nfft) // self.nstep + 1)
+        if nseg:
+            psds = scipy_spectrogram(
+                data[:(nseg - 1) * self.nstep + self.nfft],
+                fs=self.sample_rate,
+                window=self._window,
+                nperseg=self.nfft,
+                noverlap=self.noverlap,
+                scaling='density',
+                mode='psd',
+            )[2].T
+        else:
+            psds = []
+        self._data = data[nseg * self.nstep:]
+
+        # add each segment in turn, recording columns as strides complete
+        columns = []
+        t0 = self._gps(self._ncolumn)
+        for psd in psds:
+            if self._nfirst is None:
+                self._nfirst = self._nstart
+            self._add(psd)
+            if self._nstart + self.nfft >= self._ncolumn + self.nstride:
+                columns.append(self._estimate())
+                self._ncolumn += self.nstride
+            self._nstart += self.nstep
+
+        return Spectrogram(
+            numpy.reshape(columns, (len(columns), self.frequencies.size)),
+            t0=t0,
+            dt=self.nstride / self.sample_rate,
+            frequencies=self.frequencies,
+            copy=False,
+            **self.metadata,
+        )
+
+    @property
+    def psd(self):
+        """The current PSD estimate
+
+        :type: `~gwpy.frequencyseries.FrequencySeries`
+        """
+        if not self.nsegments:
+            raise ValueError("no data have been added to this estimate")
+        return FrequencySeries(
+            self._estimate(),
+            frequencies=self.frequencies,
+            epoch=self._gps(self._nfirst),
+            copy=False,
+            **self.metadata,
+        )
+
+    def _add(self, psd):
+        raise NotImplementedError
+
+    def _estimate(self):
+        raise NotImplementedError
+
+
+class _BufferedSpectrum(_RunningSpectrum):
+    """Base class for estimators that average over a fixed duration
+    """
+    def __init__(self, fftlength, duration, overlap=None, window='hann',
+                 stride=None):
+        self.duration = duration
+        super().__init__(fftlength, overlap=overlap, window=window,
+                         stride=stride)
+
+    def _setup(self, series):
+        super()._setup(series)
+        nsamp = seconds_to_samples(self.duration, series.sample_rate)
+        if nsamp < self.nfft:
+            raise ValueError("duration cannot be less than fftlength")
+        self.size = (nsamp - self.nfft) // self.nstep + 1
+        self._buffer = numpy.zeros((self.size, self.frequencies.size))
+        self._head = 0  # index of the next periodogram to write
+
+    def _add(self, psd):
+        self._buffer[self._head] = psd
+        self._head = (self._head + 1) % self.size
+        if self.nsegments == self.size:  # dropping the oldest segment
+            self._nfirst += self.nstep
+        else:
+            self.nsegments += 1
+
+    @property
+    def periodograms(self):
+        """The periodograms currently held in the buffer, oldest first
+
+        :type: `numpy.ndarray`
+        """
+        if self.nsegments < self.size:
+            return self._buffer[:self.nsegments]
+        return numpy.roll(self._buffer, -self._head, axis=0)
+
+
+class RunningWelch(_BufferedSpectrum):
+    """Incremental Welch (mean) average PSD over a fixed duration
+
+    The periodograms for the most recent ``duration`` seconds of data
+    are held in a circular buffer, and a running sum is updated as
+    each new periodogram is added (and the oldest removed), so each
+    update costs time proportional only to the amount of new data.
+
+    Parameters
+    ----------
+    fftlength : `float`
+        number of seconds in single FFT
+
+    duration : `float`
+        number of seconds of data over which to average
+
+    overlap : `float`, optional
+        number of seconds of overlap between FFTs, defaults to the
+        recommended overlap for the given window (if given), or 0
+
+    window : `str`, `numpy.ndarray`, optional
+        window function to apply to timeseries prior to FFT,
+        see :func:`scipy.signal.get_window` for details on acceptable
+        formats
+
+    stride : `float`, optional
+        number of seconds between each spectrogram column returned
+        by :meth:`update`, defaults to one column per new FFT segment,
+        must be a multiple of ``fftlength - overlap``
+
+    Examples
+    --------
+    >>> from gwpy.signal.spectral import RunningWelch
+    >>> welch = RunningWelch(4, 64, overlap=2)
+    >>> for block in stream:
+    ...     columns = welch.update(block['H1:GDS-CALIB_STRAIN'])
+    ...     asd = welch.psd ** (1/2.)
+
+    Notes
+    -----
+    Once ``duration`` seconds of data have been received, :attr:`psd`
+    matches `TimeSeries.psd` with ``method='welch'`` for the most recent
+    ``duration`` seconds.
+    """
+    def _setup(self, series):
+        super()._setup(series)
+        self._sum = numpy.zeros(self.frequencies.size)
+        self._nadd = 0
+
+    def _add(self, psd):
+        if self.nsegments == self.size:
+            self._sum -= self._buffer[self._head]
+        super()._add(psd)
+        self._sum += psd
+        # periodically recompute the sum to prevent rounding errors
+        self._nadd += 1
+        if self._nadd >= self.size:
+            self._sum = self._buffer[:self.nsegments].sum(axis=0)
+            self._nadd = 0
+
+    def _estimate(self):
+        return self._sum / self.nsegments
+
+
+class RunningMedian(_BufferedSpectrum):
+    """Incremental median average PSD over a fixed duration
+
+    The periodograms for the most recent ``duration`` seconds of data
+    are held in a circular buffer, so that only the new data have
+    to be transformed for each update.
+
+    Parameters
+    ----------
+    fftlength : `float`
+        number of seconds in single FFT
+
+    duration : `float`
+        number of seconds of data over which to average
+
+    overlap : `float`, optional
+        number of seconds of overlap between FFTs, defaults to the
+        recommended overlap for the given window (if given), or 0
+
+    window : `str`, `numpy.ndarray`, optional
+        window function to apply to timeseries prior to FFT,
+        see :func:`scipy.signal.get_window` for details on acceptable
+        formats
+
+    stride : `float`, optional
+        number of seconds between each spectrogram column returned
+        by :meth:`update`, defaults to one column per new FFT segment,
+        must be a multiple of ``fftlength - overlap``
+
+    Notes
+    -----
+    Once ``duration`` seconds of data have been received, :attr:`psd`
+    matches `TimeSeries.psd` with ``method='median'`` for the most recent
+    ``duration`` seconds.
+    """
+    def _estimate(self):
+        return numpy.median(
+            self._buffer[:self.nsegments],
+            axis=0,
+        ) / _median_bias(self.nsegments)
+
+
+class ExponentialAverage(_RunningSpectrum):
+    """Exponentially-weighted moving average PSD
+
+    Each new periodogram is included in the estimate with a weight
+    that decays exponentially with age, so no periodograms are stored.
+
+    Parameters
+    ----------
+    fftlength : `float`
+        number of seconds in single FFT
+
+    timescale : `float`
+        the time constant (in seconds) of the exponential weighting
+
+    overlap : `float`, optional
+        number of seconds of overlap between FFTs, defaults to the
+        recommended overlap for the given window (if given), or 0
+
+    window : `str`, `numpy.ndarray`, optional
+        window function to apply to timeseries prior to FFT,
+        see :func:`scipy.signal.get_window` for details on acceptable
+        formats
+
+    stride : `float`, optional
+        number of seconds between each spectrogram column returned
+        by :meth:`update`, defaults to one column per new FFT segment,
+        must be a multiple of ``fftlength - overlap``
+    """
+    def __init__(self, fftlength, timescale, overlap=None, window='hann',
+                 stride=None):
+        self.timescale = timescale
+        super().__init__(fftlength, overlap=overlap, window=window,
+                         stride=stride)
+
+    def _setup(self, series):
+        super()._setup(series)
+        #: weight of each new periodogram
+        self.alpha = 1 - numpy.exp(
+            -self.nstep / self.sample_rate / float(self.timescale))
+        self._average = None
+
+    def _add(self, psd):
+        if self._average is None:
+            self._average = psd.copy()
+        else:
+            self._average += self.alpha * (psd - self._average)
+        self.nsegments += 1
+
+    def _estimate(self):
+        return self._average.copy()
@@ -24,6 +24,7 @@ import numpy
 import scipy.signal
 
 from ...frequencyseries import FrequencySeries
+from ._quantile import approximate_median
 from ._utils import scale_timeseries_unit
 from . import _registry as fft_registry
 
@@ -73,9 +74,16 @@ def bartlett(timeseries, segmentlength, **kwargs):
     return _spectral_density(timeseries, segmentlength, noverlap=0, **kwargs)
 
 
-def median(timeseries, segmentlength, **kwargs):
+def median(timeseries, segmentlength, approximate=False, **kwargs):
     """Calculate a PSD using Welch's method with a median average
+
+    If ``approximate=True`` is given, the median is estimated using a
+    streaming quantile sketch, so that the memory required does not
+    depend on the number of segments, see
+    :func:`gwpy.signal.spectral._quantile.approximate_median`.
     """
+    if approximate:
+        return approximate_median(timeseries, segmentlength, **kwargs)
     kwargs.setdefault('average', 'median')
     return _spectral_density(timeseries, segmentlength, **kwargs)
 
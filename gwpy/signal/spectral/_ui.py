@@ -26,13 +26,11 @@ from functools import wraps
 
 import numpy
 
-from scipy.signal import (
-    get_window,
-    periodogram as scipy_periodogram,
-)
+from scipy.signal import periodogram as scipy_periodogram
 
 from astropy.units import Quantity
 
+from . import _cache as fft_cache
 from . import _utils as fft_utils
 from ...utils import mp as mp_utils
 from ..window import (canonical_name, recommended_overlap)
@@ -198,8 +196,8 @@ def _normalize_window(window, nfft, library, dtype):
         the name of the library that provides the PSD routine
 
     dtype : `type`
-        the required type of the window array, only used if
-        `library='lal'` is given
+        the type of the data to be windowed, `numpy.ndarray` windows
+        are created with the matching (real) precision
 
     Returns
     -------
@@ -215,7 +213,8 @@ def _normalize_window(window, nfft, library, dtype):
     if isinstance(window, str):
         window = canonical_name(window)
     if isinstance(window, (str, tuple)):
-        return get_window(window, nfft)
+        return fft_cache.get_window(window, nfft,
+                                    dtype=fft_utils.real_dtype(dtype))
     return window
 
 
@@ -226,9 +225,13 @@ def set_fft_params(func):
     def wrapped_func(series, method_func, *args, **kwargs):
         """Wrap function to normalize FFT params before execution
         """
+        # cast to the requested precision
+        dtype = kwargs.pop('dtype', None)
         if isinstance(series, tuple):
+            series = tuple(fft_utils.as_precision(x, dtype) for x in series)
             data = series[0]
         else:
+            series = fft_utils.as_precision(series, dtype)
             data = series
 
         # normalise FFT parameters for all libraries
@@ -315,6 +318,12 @@ def average_spectrogram(timeseries, method_func, stride, *args, **kwargs):
 
     nproc = kwargs.pop('nproc', 1)
 
+    # cast to the requested precision
+    dtype = kwargs.pop('dtype', None)
+    timeseries = fft_utils.as_precision(timeseries, dtype)
+    if other is not None:
+        other = fft_utils.as_precision(other, dtype)
+
     # get params
     epoch = timeseries.t0.value
     nstride = seconds_to_samples(stride, timeseries.sample_rate)
@@ -363,6 +372,9 @@ def spectrogram(timeseries, **kwargs):
     """
     from ...spectrogram import Spectrogram
 
+    # cast to the requested precision
+    timeseries = fft_utils.as_precision(timeseries, kwargs.pop('dtype', None))
+
     # normalise FFT parameters
     normalize_fft_params(timeseries, kwargs=kwargs)
 
@@ -414,7 +426,7 @@ def spectrogram(timeseries, **kwargs):
 
     # normalize over-dense grid
     density = nfft // nstride
-    weights = get_window('triangle', density)
+    weights = fft_cache.get_window('triangle', density)
     for i in range(numtimes):
         # get indices of overlapping columns
         x = max(0, i+1-density)
@@ -431,21 +443,28 @@ def spectrogram(timeseries, **kwargs):
     return out
 
 
-def _chunk_timeseries(series, nstride, noverlap):
-    # define chunks
+def _chunk_indices(size, nstride, noverlap):
+    """Yield the ``(start, end)`` indices of each spectrogram chunk
+    """
     x = 0
     step = nstride - int(noverlap // 2.)  # the first step is smaller
     nfft = nstride + noverlap
-    while x + nstride <= series.size:
+    while x + nstride <= size:
         y = x + nfft
-        if y >= series.size:
-            y = series.size  # pin to end of series
+        if y >= size:
+            y = size  # pin to end of series
             x = y - nfft  # and work back to get the correct amount of data
-        yield series[x:y]
+        yield x, y
         x += step
         step = nstride  # subsequent steps are the standard size
 
 
+def _chunk_timeseries(series, nstride, noverlap):
+    # define chunks
+    for x, y in _chunk_indices(series.size, nstride, noverlap):
+        yield series[x:y]
+
+
 def _fft_library(method_func):
     mod = method_func.__module__.rsplit('.', 1)[-1]
     if mod == 'median_mean':
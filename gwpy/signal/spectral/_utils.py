@@ -19,6 +19,8 @@
 """Utilities for FFT routines
 """
 
+import numpy
+
 from astropy import units
 
 __author__ = "Duncan Macleod <duncan.macleod@ligo.org>"
@@ -52,3 +54,65 @@ def scale_timeseries_unit(tsunit, scaling='density'):
     else:
         specunit = baseunit ** -1
     return specunit
+
+
+def as_precision(data, dtype=None):
+    """Cast data to the working precision of a spectral calculation
+
+    Parameters
+    ----------
+    data : `~gwpy.timeseries.TimeSeries`, `numpy.ndarray`
+        the input data
+
+    dtype : `type`, `str`, optional
+        the floating-point type in which to work, e.g. ``'float32'``,
+        complex ``data`` are cast to the complex type of the same
+        precision, default: `None` (return ``data`` unchanged)
+
+    Returns
+    -------
+    data : `~gwpy.timeseries.TimeSeries`, `numpy.ndarray`
+        the input ``data`` cast to the working precision, without a copy
+        if they are already of that type
+
+    Raises
+    ------
+    ValueError
+        if ``dtype`` is not a floating-point type
+
+    Examples
+    --------
+    >>> import numpy
+    >>> as_precision(numpy.arange(4.), 'float32').dtype
+    dtype('float32')
+    >>> as_precision(numpy.arange(4.) * 1j, 'float32').dtype
+    dtype('complex64')
+    """
+    if dtype is None:
+        return data
+    dtype = numpy.dtype(dtype)
+    if dtype.kind != 'f':
+        raise ValueError("cannot calculate spectra with precision {!r}, "
+                         "please give a floating-point type".format(
+                             dtype.name))
+    if numpy.iscomplexobj(data):
+        dtype = numpy.result_type(dtype, numpy.complex64)
+    return data.astype(dtype, copy=False)
+
+
+def real_dtype(dtype):
+    """Return the real floating-point type to use with data of ``dtype``
+
+    Complex types map to the real type of the same precision, and integer
+    types are promoted in the same way as by :mod:`scipy.signal`.
+
+    Examples
+    --------
+    >>> real_dtype('float32')
+    dtype('float32')
+    >>> real_dtype('complex64')
+    dtype('float32')
+    >>> real_dtype('int64')
+    dtype('float64')
+    """
+    return numpy.finfo(numpy.result_type(dtype, numpy.float32)).dtype
@@ -0,0 +1,352 @@
+# -*- coding: utf-8 -*-
+# Copyright (C) Duncan Macleod (2014-2020)
+#
+# This file is part of GWpy.
+#
+# GWpy is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# GWpy is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with GWpy.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Filtering and resampling of data that arrive in contiguous chunks
+"""
+
+import numpy
+
+from scipy import signal
+
+from . import filter_design
+
+__author__ = 'Duncan Macleod <duncan.macleod@ligo.org>'
+
+__all__ = ['StreamingFilter', 'StreamingResampler']
+
+
+def _check_contiguous(obj, series):
+    """Check that ``series`` follows on from the data seen by ``obj``
+    """
+    if series.sample_rate.to('Hz').value != obj.sample_rate:
+        raise ValueError(
+            "Cannot update {} with data sampled at {}, expected "
+            "{} Hz".format(type(obj).__name__, series.sample_rate,
+                           obj.sample_rate))
+    if abs(float(series.t0.value) - obj._end) * obj.sample_rate > .5:
+        raise ValueError(
+            "Cannot update {} with discontiguous data, expected "
+            "data starting at {}, got {}".format(
+                type(obj).__name__, obj._end, series.t0.value))
+
+
+class StreamingFilter(object):
+    """Apply a digital filter to contiguous chunks of data
+
+    The internal state of the filter is carried from one chunk to the
+    next, so that filtering a sequence of contiguous
+    `~gwpy.timeseries.TimeSeries` chunks gives the same result as
+    filtering all of the data at once with `TimeSeries.filter
+    <gwpy.timeseries.TimeSeries.filter>`, with no transients at the
+    chunk boundaries.
+
+    Parameters
+    ----------
+    *filt : filter arguments
+        1, 2, 3, or 4 arguments defining the filter to be applied,
+
+            - an ``Nx1`` `~numpy.ndarray` of FIR coefficients
+            - an ``Nx6`` `~numpy.ndarray` of SOS coefficients
+            - ``(numerator, denominator)`` polynomials
+            - ``(zeros, poles, gain)``
+            - ``(A, B, C, D)`` 'state-space' representation
+
+    analog : `bool`, optional
+        if `True`, filter coefficients will be converted from Hz
+        to Z-domain digital representation (using the sampling rate of
+        the first chunk of data), default: `False`
+
+    steady_state : `bool`, optional
+        if `True`, initialise the filter state to the steady-state response
+        to a step with the amplitude of the first sample, rather than zero,
+        which reduces the filter transient at the start of the data,
+        default: `False`
+
+    Notes
+    -----
+    IIR filters are applied as cascaded second-order sections using
+    :func:`scipy.signal.sosfilt`, FIR filters are applied using
+    :func:`scipy.signal.lfilter`.
+    Forward-backward (zero-phase) filtering cannot be applied to
+    streaming data.
+
+    Examples
+    --------
+    >>> from gwpy.signal.filter_design import bandpass
+    >>> from gwpy.signal.streaming import StreamingFilter
+    >>> bp = StreamingFilter(bandpass(50, 250, 4096))
+    >>> for block in stream:
+    ...     filtered = bp.update(block['H1:GDS-CALIB_STRAIN'])
+    """
+    def __init__(self, *filt, analog=False, steady_state=False):
+        self.filt = filt
+        self.analog = analog
+        self.steady_state = steady_state
+        self.reset()
+
+    def reset(self):
+        """Reset the filter state, so that the next chunk of data is
+        filtered as if it were the start of the data
+        """
+        self.sample_rate = None
+        self.sos = None
+        self.ba = None
+        self.zi = None
+        self._end = None  # GPS time of the end of the previous chunk
+
+    def _setup(self, series):
+        self.sample_rate = series.sample_rate.to('Hz').value
+        form, filt = filter_design.parse_filter(
+            self.filt,
+            analog=self.analog,
+            sample_rate=self.sample_rate,
+        )
+        if form == 'zpk':
+            self.sos = signal.zpk2sos(*filt)
+            zi = signal.sosfilt_zi(self.sos)
+        else:
+            self.ba = tuple(map(numpy.atleast_1d, filt))
+            zi = signal.lfilter_zi(*self.ba)
+        if self.steady_state and series.size:
+            self.zi = zi * series.value[0]
+        else:
+            self.zi = numpy.zeros_like(zi)
+
+    def update(self, series):
+        """Filter the next chunk of data
+
+        Parameters
+        ----------
+        series : `~gwpy.timeseries.TimeSeries`
+            the new data, which must start exactly where the previous
+            data ended
+
+        Returns
+        -------
+        filtered : `~gwpy.timeseries.TimeSeries`
+            the filtered version of the new data
+
+        Raises
+        ------
+        ValueError
+            if the new data are not contiguous with the previous data,
+            or have a different sampling rate
+        """
+        if self.zi is None:
+            self._setup(series)
+        else:
+            _check_contiguous(self, series)
+        self._end = float(series.t0.value) + series.size / self.sample_rate
+
+        if self.sos is not None:
+            out, self.zi = signal.sosfilt(self.sos, series.value, zi=self.zi)
+        else:
+            out, self.zi = signal.lfilter(*self.ba, series.value, zi=self.zi)
+
+        # format as type(series)
+        new = out.view(type(series))
+        new.__metadata_finalize__(series)
+        new._unit = series.unit
+        return new
+
+
+class StreamingResampler(object):
+    """Resample contiguous chunks of data to a new sampling rate
+
+    The data are resampled using the same polyphase FIR filter as
+    `TimeSeries.resample <gwpy.timeseries.TimeSeries.resample>`
+    (for a rational ratio of sampling rates), keeping only as much of the
+    input as is needed for the next output sample.
+    The concatenation of the output of `~StreamingResampler.update` for
+    each chunk, followed by `~StreamingResampler.flush`, is identical to
+    resampling all of the data at once with
+    :func:`scipy.signal.resample_poly`.
+
+    Parameters
+    ----------
+    rate : `float`
+        the new sampling rate (Hz)
+
+    window : `str`, `tuple`, optional
+        the window used to design the anti-aliasing FIR filter,
+        see :func:`scipy.signal.get_window` for details on acceptable
+        formats
+
+    Notes
+    -----
+    Each output sample is only returned once all of the input samples
+    that contribute to it have been received, so the output of each call
+    to `~StreamingResampler.update` lags the input by approximately
+    ``10 * max(up, down)`` input samples, where ``up / down`` is the
+    (reduced) ratio of the new and old sampling rates.
+
+    Examples
+    --------
+    >>> from gwpy.signal.streaming import StreamingResampler
+    >>> resampler = StreamingResampler(1024)
+    >>> chunks = [resampler.update(block['H1:GDS-CALIB_STRAIN'])
+    ...           for block in stream]
+    >>> chunks.append(resampler.flush())
+    """
+    def __init__(self, rate, window='hamming'):
+        self.rate = float(rate)
+        self.window = window
+        self.reset()
+
+    def reset(self):
+        """Reset the resampler, so that the next chunk of data is
+        treated as the start of the data
+        """
+        self.sample_rate = None
+        self.up = self.down = None
+        self._filter = None
+        self._offset = None  # number of filter delay output samples
+        self._buffer = None  # input samples not yet fully used
+        self._first = 0  # input index of the first sample in the buffer
+        self._nin = 0  # number of input samples received
+        self._nout = 0  # number of output samples returned
+        self._t0 = None  # GPS time of the first input sample
+        self._end = None  # GPS time of the end of the previous chunk
+        self._series = None  # the previous input chunk (for metadata)
+
+    def _setup(self, series):
+        self.sample_rate = series.sample_rate.to('Hz').value
+        ratio = filter_design._rational_ratio(self.rate, self.sample_rate)
+        if ratio is None:
+            raise ValueError(
+                "Cannot resample from {} Hz to {} Hz using a rational "
+                "polyphase filter".format(self.sample_rate, self.rate))
+        self.up, self.down = up, down = ratio
+        # mirror the filter padding of scipy.signal.resample_poly
+        filt = filter_design._polyphase_filter(up, down, window=self.window)
+        half_len = (filt.size - 1) // 2
+        npad = down - half_len % down
+        self._filter = numpy.concatenate((numpy.zeros(npad), filt * up))
+        self._offset = (half_len + npad) // down
+        self._buffer = numpy.zeros(0, dtype=series.dtype)
+        self._t0 = float(series.t0.value)
+
+    def _first_input(self, j):
+        """Return the index of the first input sample needed for output ``j``
+
+        The index is rounded down to a multiple of ``down``, so that the
+        output of `~scipy.signal.upfirdn` stays aligned.
+        """
+        # output sample j is the sum over input samples i of
+        # x[i] * h[(j + offset) * down - i * up]
+        first = -(-((j + self._offset) * self.down - self._filter.size + 1)
+                  // self.up)
+        first = max(first, 0)
+        return first - first % self.down
+
+    def _resample(self, end):
+        """Return the output samples up to (not including) ``end``
+        """
+        start = self._nout
+        if end <= start:
+            return numpy.zeros(0, dtype=self._buffer.dtype)
+        first = self._first_input(start)
+        out = signal.upfirdn(
+            self._filter,
+            self._buffer[first - self._first:],
+            self.up,
+            self.down,
+        )
+        shift = self._offset - first * self.up // self.down
+        out = out[start + shift:end + shift]
+        # zero-pad at the end of the data (if flushing)
+        if out.size < end - start:
+            out = numpy.concatenate((
+                out,
+                numpy.zeros(end - start - out.size, dtype=out.dtype),
+            ))
+        # discard input that isn't needed any more
+        first = self._first_input(end)
+        self._buffer = self._buffer[first - self._first:]
+        self._first = first
+        self._nout = end
+        return out
+
+    def _format(self, out, series, start):
+        new = out.view(type(series))
+        new.__metadata_finalize__(series)
+        new._unit = series.unit
+        new.sample_rate = self.rate
+        new.t0 = self._t0 + start / self.rate
+        return new
+
+    def update(self, series):
+        """Resample the next chunk of data
+
+        Parameters
+        ----------
+        series : `~gwpy.timeseries.TimeSeries`
+            the new data, which must start exactly where the previous
+            data ended
+
+        Returns
+        -------
+        resampled : `~gwpy.timeseries.TimeSeries`
+            the resampled data that can be fully determined from the
+            data received so far (which may be empty)
+
+        Raises
+        ------
+        ValueError
+            if the new data are not contiguous with the previous data,
+            or have a different sampling rate, or if the ratio of the
+            new and old sampling rates is not rational
+        """
+        if self._filter is None:
+            self._setup(series)
+        else:
+            _check_contiguous(self, series)
+        self._end = float(series.t0.value) + series.size / self.sample_rate
+        self._series = series
+        self._buffer = numpy.concatenate((self._buffer, series.value))
+        self._nin += series.size
+        start = self._nout
+        # output j is complete once input floor((j + offset) * down / up)
+        # has been received
+        end = -(-self._nin * self.up // self.down) - self._offset
+        return self._format(self._resample(end), series, start)
+
+    def flush(self):
+        """Return the remaining output samples, and reset the resampler
+
+        The data are assumed to be zero after the end of the last chunk,
+        matching :func:`scipy.signal.resample_poly`.
+
+        Returns
+        -------
+        resampled : `~gwpy.timeseries.TimeSeries`
+            the remaining resampled data
+
+        Raises
+        ------
+        ValueError
+            if no data have been received
+        """
+        if self._series is None:
+            raise ValueError("Cannot flush {}, no data have been "
+                             "received".format(type(self).__name__))
+        start = self._nout
+        end = -(-self._nin * self.up // self.down)
+        out = self._format(self._resample(end), self._series, start)
+        self.reset()
+        return out
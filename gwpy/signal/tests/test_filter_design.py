@@ -153,3 +153,67 @@ def test_parse_filter():
     parsed = filter_design.parse_filter(zpk)
     assert parsed[0] == 'zpk'
     utils.assert_zpk_equal(parsed[1], zpk)
+
+
+@pytest.fixture
+def cache():
+    filter_design.enable_cache(maxsize=2)
+    try:
+        yield filter_design
+    finally:
+        filter_design.disable_cache()
+
+
+def test_cache(cache):
+    assert cache.cache_info() == (0, 0, 2, 0)
+
+    # check that a repeated design is returned from the cache
+    lp = cache.lowpass(100, 1024)
+    utils.assert_zpk_equal(lp, LOWPASS_IIR_100HZ)
+    assert cache.lowpass(100, 1024) is lp
+    assert cache.lowpass(100 * ONE_HZ, 1024) is not lp
+    assert cache.cache_info() == (1, 2, 2, 2)
+
+    # check that cached designs can't be modified
+    with pytest.raises(ValueError):
+        lp[0][0] = 1.
+
+    # check that the least recently used design is evicted
+    cache.lowpass(100, 1024)
+    cache.highpass(100, 1024)
+    assert cache.cache_info().currsize == 2
+    assert cache.lowpass(100, 1024) is lp
+    assert cache.lowpass(100 * ONE_HZ, 1024) is not lp
+    assert cache.cache_info() == (3, 4, 2, 2)
+
+    # check that clear_cache() resets everything
+    cache.clear_cache()
+    assert cache.cache_info() == (0, 0, 2, 0)
+
+
+def test_cache_disabled():
+    lp = filter_design.lowpass(100, 1024)
+    assert filter_design.lowpass(100, 1024) is not lp
+    assert lp[0].flags.writeable
+    assert filter_design.cache_info() == (0, 0, 0, 0)
+    with pytest.raises(ValueError):
+        filter_design.enable_cache(maxsize=0)
+
+
+@pytest.mark.parametrize('factor, plan', [
+    (1, []),
+    (4, [4]),
+    (16, [4, 4]),
+    (1024, [8, 8, 4, 4]),
+    (1000, [8, 5, 5, 5]),
+    (34, [17, 2]),
+])
+def test_decimation_plan(factor, plan):
+    assert filter_design.decimation_plan(factor) == plan
+
+
+def test_decimation_plan_maxstage():
+    assert filter_design.decimation_plan(1024, maxstage=32) == [32, 32]
+    assert filter_design.decimation_plan(12, maxstage=2) == [3, 2, 2]
+    with pytest.raises(ValueError):
+        filter_design.decimation_plan(0)
@@ -0,0 +1,102 @@
+# -*- coding: utf-8 -*-
+# Copyright (C) Duncan Macleod (2014-2020)
+#
+# This file is part of GWpy.
+#
+# GWpy is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# GWpy is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with GWpy.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Unit tests for :mod:`gwpy.signal.spectral._cache`
+"""
+
+from unittest import mock
+
+import numpy
+import pytest
+
+from scipy import signal
+
+from ...testing.utils import assert_array_equal
+from ...timeseries import TimeSeries
+from ..spectral import _cache as fft_cache
+
+__author__ = 'Duncan Macleod <duncan.macleod@ligo.org>'
+
+
+@pytest.fixture
+def cache():
+    fft_cache.clear_cache()
+    yield
+    fft_cache.set_cache_size(fft_cache.DEFAULT_CACHE_SIZE)
+    fft_cache.clear_cache()
+
+
+def test_get_window(cache):
+    win = fft_cache.get_window('hann', 128)
+    assert_array_equal(win, signal.get_window('hann', 128))
+    assert not win.flags.writeable
+    assert fft_cache.get_window('hann', 128) is win
+    assert fft_cache.get_window(('kaiser', 5), 128) is not win
+    assert fft_cache.get_window('hann', 128, dtype='float32').dtype == (
+        numpy.float32)
+    assert fft_cache.cache_info() == fft_cache.CacheInfo(
+        plan_hits=0, plan_misses=0, window_hits=1, window_misses=3,
+        maxsize=fft_cache.DEFAULT_CACHE_SIZE, currsize=3)
+
+
+def test_get_fft_plan(cache):
+    create = mock.Mock(side_effect=lambda: object())
+    plan = fft_cache.get_fft_plan(128, 'test', create=create, forward=True)
+    assert fft_cache.get_fft_plan(128, 'test', create=create,
+                                  forward=True) is plan
+    assert fft_cache.get_fft_plan(128, 'test', create=create,
+                                  forward=False) is not plan
+    assert create.call_count == 2
+    info = fft_cache.cache_info()
+    assert (info.plan_hits, info.plan_misses) == (1, 2)
+
+
+def test_entries(cache):
+    win = fft_cache.get_window('hann', 128, library='test')
+    fft_cache.get_window('hann', 128)
+    assert fft_cache._CACHE.entries('window', 'test') == [
+        ((128, 'hann', numpy.dtype(float).str), win),
+    ]
+    assert fft_cache._CACHE.entries('plan', 'test') == []
+
+
+def test_cache_size(cache):
+    fft_cache.set_cache_size(2)
+    first = fft_cache.get_window('hann', 128)
+    fft_cache.get_window('hann', 256)
+    fft_cache.get_window('hann', 512)  # evicts the first window
+    assert fft_cache.cache_info().currsize == 2
+    assert fft_cache.get_window('hann', 128) is not first
+
+    # check that maxsize=0 disables the cache
+    fft_cache.set_cache_size(0)
+    assert fft_cache.cache_info().currsize == 0
+    assert fft_cache.get_window('hann', 128) is not first
+    assert fft_cache.cache_info().currsize == 0
+    with pytest.raises(ValueError):
+        fft_cache.set_cache_size(-1)
+
+
+def test_psd_uses_cache(cache):
+    data = TimeSeries(numpy.random.normal(size=1024), sample_rate=256)
+    psd = data.psd(1, .5)
+    data.psd(1, .5)
+    info = fft_cache.cache_info()
+    assert (info.window_hits, info.window_misses) == (1, 1)
+    fft_cache.set_cache_size(0)
+    assert_array_equal(data.psd(1, .5).value, psd.value)
@@ -0,0 +1,101 @@
+# -*- coding: utf-8 -*-
+# Copyright (C) Duncan Macleod (2014-2020)
+#
+# This file is part of GWpy.
+#
+# GWpy is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# GWpy is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with GWpy.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Unit tests for :mod:`gwpy.signal.spectral._coherence`
+"""
+
+import numpy
+import pytest
+
+from scipy import signal
+
+from ...frequencyseries import FrequencySeries
+from ...spectrogram import Spectrogram
+from ...spectrogram.coherence import _from_timeseries
+from ...timeseries import TimeSeries
+from ..spectral import OneToManyCoherence
+
+__author__ = 'Duncan Macleod <duncan.macleod@ligo.org>'
+
+
+@pytest.fixture
+def data():
+    numpy.random.seed(1)
+    ref = TimeSeries(numpy.random.normal(size=32 * 256), sample_rate=256,
+                     t0=1000000000, name='X1:REF', channel='X1:REF')
+    others = [
+        TimeSeries(
+            numpy.random.normal(size=32 * rate) + (
+                .5 * ref.value if rate == 256 else 0),
+            sample_rate=rate,
+            t0=1000000000,
+            name='X1:AUX-{}'.format(i),
+        ) for i, rate in enumerate((256, 256, 512, 128, 256))
+    ]
+    return ref, others
+
+
+def test_coherence(data):
+    ref, others = data
+    engine = OneToManyCoherence(ref, 4, 2)
+    results = list(engine.iter_coherence(others, batch=2))
+    assert [name for name, _ in results] == [o.name for o in others]
+    for other, (name, coh) in zip(others, results):
+        assert isinstance(coh, FrequencySeries)
+        assert coh.unit == 'coherence'
+        assert coh.name == "Coherence between X1:REF and {}".format(name)
+        rate = min(ref.sample_rate.value, other.sample_rate.value)
+        expected = signal.coherence(
+            ref.resample(rate).value,
+            other.resample(rate).value,
+            fs=rate,
+            window='hann',
+            nperseg=int(4 * rate),
+            noverlap=int(2 * rate),
+        )
+        numpy.testing.assert_allclose(coh.frequencies.value, expected[0])
+        numpy.testing.assert_allclose(coh.value, expected[1], atol=1e-12)
+
+    # check that the reference was only transformed once per rate
+    assert sorted(engine._cache) == [128, 256]
+
+
+def test_coherence_spectrogram(data):
+    ref, others = data
+    coh = OneToManyCoherence(ref, 2, stride=8, window=None).coherence(
+        others[0])
+    assert isinstance(coh, Spectrogram)
+    assert coh.shape == (4, 257)
+    assert coh.dt.value == 8
+    assert coh.df.value == .5
+
+    # check against the per-stride calculation
+    expected = _from_timeseries(ref, others[0], 8, fftlength=2,
+                                detrend='constant')
+    numpy.testing.assert_allclose(coh.value, expected.value, atol=1e-12)
+
+
+def test_coherence_errors(data):
+    ref, others = data
+    engine = OneToManyCoherence(ref, 4)
+    with pytest.raises(ValueError) as exc:
+        engine.coherence(others[0][:-256])
+    assert str(exc.value).startswith(
+        "Cannot calculate coherence between X1:REF and X1:AUX-0")
+    with pytest.raises(ValueError):
+        OneToManyCoherence(ref, 8, stride=4).coherence(others[0])
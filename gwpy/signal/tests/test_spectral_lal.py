@@ -67,6 +67,21 @@ def test_generate_fft_plan():
         fft_lal.generate_fft_plan(128, dtype=int)
 
 
+def test_deprecated_caches():
+    """Test the deprecated `LAL_WINDOWS` and `LAL_FFTPLANS` attributes
+    """
+    window = fft_lal.generate_window(128)
+    plan = fft_lal.generate_fft_plan(128)
+    with pytest.deprecated_call():
+        windows = fft_lal.LAL_WINDOWS
+    assert windows[(128, "('kaiser', 24)", 'REAL8')] is window
+    with pytest.deprecated_call():
+        plans = fft_lal.LAL_FFTPLANS
+    assert plans[(128, True, 'REAL8')] is plan
+    with pytest.raises(AttributeError):
+        fft_lal.LAL_OTHER
+
+
 def test_welch(noisy_sinusoid):
     psd = fft_lal.welch(noisy_sinusoid, 4096, noverlap=2048)
     # assert PSD peaks at 500 Hz (as designed)
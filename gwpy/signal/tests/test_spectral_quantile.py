@@ -0,0 +1,117 @@
+# -*- coding: utf-8 -*-
+# Copyright (C) Duncan Macleod (2014-2020)
+#
+# This file is part of GWpy.
+#
+# GWpy is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# GWpy is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with GWpy.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Unit tests for :mod:`gwpy.signal.spectral._quantile`
+"""
+
+from unittest import mock
+
+import numpy
+import pytest
+
+from ...timeseries import TimeSeries
+from ..spectral import _quantile as fft_quantile
+
+__author__ = 'Duncan Macleod <duncan.macleod@ligo.org>'
+
+
+@pytest.fixture
+def noise():
+    numpy.random.seed(1)
+    return TimeSeries(numpy.random.normal(size=600 * 256), sample_rate=256,
+                      t0=1000000000, unit='m', name='X1:TEST')
+
+
+def test_p2quantile():
+    numpy.random.seed(0)
+    data = numpy.random.exponential(size=(2000, 100))
+    sketch = fft_quantile.P2Quantile(100)
+
+    # check that the estimate is exact for a small number of observations
+    for i, row in enumerate(data[:4]):
+        sketch.update(row)
+        numpy.testing.assert_allclose(
+            sketch.value,
+            numpy.median(data[:i + 1], axis=0),
+        )
+
+    for row in data[4:]:
+        sketch.update(row)
+    assert sketch.count == 2000
+    assert numpy.abs(sketch.value - numpy.log(2)).max() < .1
+
+    with pytest.raises(ValueError):
+        fft_quantile.P2Quantile(10).value
+    with pytest.raises(ValueError):
+        fft_quantile.P2Quantile(10, quantile=1)
+
+
+@pytest.mark.parametrize('quantile', (.1, .9))
+def test_p2quantile_quantile(quantile):
+    numpy.random.seed(0)
+    data = numpy.random.uniform(size=(5000, 10))
+    sketch = fft_quantile.P2Quantile(10, quantile=quantile)
+    for row in data:
+        sketch.update(row)
+    numpy.testing.assert_allclose(sketch.value, quantile, atol=.02)
+
+
+def test_approximate_median(noise):
+    exact = noise.psd(4, 2, method='median')
+    approx = noise.psd(4, 2, method='median', approximate=True)
+    assert approx.unit == exact.unit
+    assert approx.name == exact.name
+    numpy.testing.assert_array_equal(approx.frequencies, exact.frequencies)
+
+    # check the documented error bound (ignoring DC and Nyquist)
+    nseg = 299
+    error = numpy.abs(approx.value / exact.value - 1)[1:-1]
+    assert numpy.median(error) < 1 / nseg ** .5
+    assert error.max() < 3 / nseg ** .5
+
+
+def test_approximate_median_float32(noise):
+    psd = noise.psd(4, 2, method='median', approximate=True)
+    psd32 = noise.psd(4, 2, method='median', approximate=True,
+                      dtype='float32')
+    assert psd32.dtype == numpy.float32
+
+    # single-precision rounding can change how the estimator's markers
+    # move, but the result should still be well within its error bound
+    error = numpy.abs(psd32.value / psd.value - 1)[1:-1]
+    assert numpy.median(error) < 1e-5
+    assert error.max() < 1 / 299 ** .5
+
+
+def test_approximate_median_memory(noise):
+    # check that only a limited number of periodograms are calculated
+    # at any one time
+    spectrogram = fft_quantile.scipy_spectrogram
+    with mock.patch.object(fft_quantile, 'scipy_spectrogram',
+                           side_effect=spectrogram) as mocked:
+        fft_quantile.approximate_median(noise, 1024, noverlap=512, batch=10)
+    assert mocked.call_count == 30
+    for call in mocked.call_args_list:
+        assert call[0][0].size <= 11 * 512
+
+
+def test_approximate_median_mean(noise):
+    psd = noise.psd(4, 2, method='median_mean', approximate=True)
+    welch = noise.psd(4, 2, method='welch')
+    error = numpy.abs(psd.value / welch.value - 1)[1:-1]
+    assert numpy.median(error) < .1
@@ -0,0 +1,111 @@
+# -*- coding: utf-8 -*-
+# Copyright (C) Duncan Macleod (2014-2020)
+#
+# This file is part of GWpy.
+#
+# GWpy is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# GWpy is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with GWpy.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Unit tests for :mod:`gwpy.signal.spectral._running`
+"""
+
+import numpy
+import pytest
+
+from scipy import signal
+
+from ...testing import utils
+from ...timeseries import TimeSeries
+from ..spectral import (ExponentialAverage, RunningMedian, RunningWelch)
+
+__author__ = 'Duncan Macleod <duncan.macleod@ligo.org>'
+
+
+@pytest.fixture
+def noise():
+    numpy.random.seed(1)
+    return TimeSeries(numpy.random.normal(size=64 * 256), sample_rate=256,
+                      t0=1000000000, unit='m', name='X1:TEST')
+
+
+def _feed(estimator, data, chunk=3):
+    """Feed ``data`` into ``estimator`` in chunks of ``chunk`` seconds
+    """
+    columns = []
+    start = data.span[0]
+    while start < data.span[1]:
+        columns.append(estimator.update(data.crop(start, start + chunk)))
+        start += chunk
+    return columns
+
+
+@pytest.mark.parametrize('estimator, method', [
+    (RunningWelch, 'welch'),
+    (RunningMedian, 'median'),
+])
+def test_running(noise, estimator, method):
+    est = estimator(4, 16, overlap=2)
+    _feed(est, noise)
+
+    # check that the estimate matches the last 16 seconds
+    assert est.nsegments == est.size == 7
+    psd = noise.crop(noise.span[1] - 16).psd(4, 2, method=method)
+    utils.assert_quantity_sub_equal(est.psd, psd, almost_equal=True)
+
+
+def test_running_spectrogram(noise):
+    est = RunningWelch(4, 16, overlap=2, stride=4)
+    columns = _feed(est, noise)
+    times = numpy.concatenate([c.times.value for c in columns])
+    numpy.testing.assert_array_equal(
+        times,
+        noise.t0.value + numpy.arange(16) * 4,
+    )
+    assert columns[1].dt.value == 4
+    assert columns[1].unit == noise.unit ** 2 / 'Hz'
+
+    # check that the first full column matches the batch estimate
+    values = numpy.concatenate([c.value for c in columns])
+    psd = noise.crop(end=noise.span[0] + 16).psd(4, 2, method='welch')
+    numpy.testing.assert_allclose(values[3], psd.value)
+
+
+def test_running_errors(noise):
+    est = RunningWelch(4, 16, overlap=2)
+    est.update(noise.crop(end=noise.span[0] + 1))
+    with pytest.raises(ValueError) as exc:
+        est.psd
+    assert str(exc.value) == "no data have been added to this estimate"
+    with pytest.raises(ValueError) as exc:
+        est.update(noise.crop(noise.span[0] + 2))
+    assert str(exc.value).startswith("Cannot update RunningWelch with "
+                                     "discontiguous data")
+    with pytest.raises(ValueError):
+        RunningWelch(4, 16, overlap=2, stride=3).update(noise)
+    with pytest.raises(ValueError):
+        RunningWelch(4, 2).update(noise)
+
+
+def test_exponential_average(noise):
+    est = ExponentialAverage(4, 8, overlap=2)
+    _feed(est, noise)
+    assert est.nsegments == 31
+
+    # calculate the expected result by hand
+    alpha = 1 - numpy.exp(-2 / 8.)
+    specgram = signal.spectrogram(noise.value, fs=256, window='hann',
+                                  nperseg=1024, noverlap=512)[2].T
+    expected = specgram[0]
+    for row in specgram[1:]:
+        expected = (1 - alpha) * expected + alpha * row
+    numpy.testing.assert_allclose(est.psd.value, expected)
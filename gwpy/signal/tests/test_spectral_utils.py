@@ -19,6 +19,7 @@
 """Unit test for signal module
 """
 
+import numpy
 import pytest
 
 from astropy import units
@@ -42,3 +43,32 @@ def test_scale_timeseries_unit():
         scale_(u, scaling='other')
     # check null unit
     assert scale_(None) == units.Unit('Hz^-1')
+
+
+@pytest.mark.parametrize('data, dtype, result', [
+    (numpy.arange(4.), None, 'float64'),
+    (numpy.arange(4.), 'float32', 'float32'),
+    (numpy.arange(4, dtype='float32'), numpy.float64, 'float64'),
+    (numpy.arange(4.) * 1j, 'float32', 'complex64'),
+])
+def test_as_precision(data, dtype, result):
+    out = fft_utils.as_precision(data, dtype)
+    assert out.dtype == numpy.dtype(result)
+    if out.dtype == data.dtype:
+        assert out is data
+
+
+def test_as_precision_error():
+    with pytest.raises(ValueError):
+        fft_utils.as_precision(numpy.arange(4.), 'int32')
+
+
+@pytest.mark.parametrize('dtype, result', [
+    ('float32', 'float32'),
+    ('float64', 'float64'),
+    ('complex64', 'float32'),
+    ('complex128', 'float64'),
+    ('int64', 'float64'),
+])
+def test_real_dtype(dtype, result):
+    assert fft_utils.real_dtype(dtype) == numpy.dtype(result)
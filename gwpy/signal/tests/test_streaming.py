@@ -0,0 +1,127 @@
+# -*- coding: utf-8 -*-
+# Copyright (C) Duncan Macleod (2014-2020)
+#
+# This file is part of GWpy.
+#
+# GWpy is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# GWpy is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with GWpy.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Unit tests for :mod:`gwpy.signal.streaming`
+"""
+
+import numpy
+import pytest
+
+from scipy import signal
+
+from ...testing import utils
+from ...timeseries import TimeSeries
+from .. import filter_design
+from ..streaming import (StreamingFilter, StreamingResampler)
+
+__author__ = 'Duncan Macleod <duncan.macleod@ligo.org>'
+
+BANDPASS = filter_design.bandpass(50, 250, 1024)
+FIR = filter_design.lowpass(100, 1024, type='fir')
+
+
+@pytest.fixture
+def data():
+    numpy.random.seed(1)
+    return TimeSeries(numpy.random.normal(loc=10, size=16 * 1024),
+                      sample_rate=1024, t0=1000000000, unit='m',
+                      name='X1:TEST')
+
+
+def _feed(filt, data, chunk=1.5):
+    """Filter ``data`` in chunks of ``chunk`` seconds
+    """
+    chunks = []
+    start = data.span[0]
+    while start < data.span[1]:
+        chunks.append(filt.update(data.crop(start, start + chunk)))
+        start += chunk
+    return chunks
+
+
+@pytest.mark.parametrize('filt', [BANDPASS, FIR])
+def test_streaming_filter(data, filt):
+    chunks = _feed(StreamingFilter(filt), data)
+    assert chunks[1].t0.value == data.t0.value + 1.5
+    assert chunks[1].unit == data.unit
+    assert chunks[1].name == data.name
+
+    # check that the result matches filtering all of the data at once
+    out = numpy.concatenate([c.value for c in chunks])
+    numpy.testing.assert_allclose(out, data.filter(filt).value)
+
+
+def test_streaming_filter_steady_state(data):
+    chunks = _feed(StreamingFilter(BANDPASS, steady_state=True), data)
+    sos = signal.zpk2sos(*BANDPASS)
+    expected = signal.sosfilt(sos, data.value,
+                              zi=signal.sosfilt_zi(sos) * data.value[0])[0]
+    utils.assert_allclose(numpy.concatenate([c.value for c in chunks]),
+                          expected)
+
+
+def test_streaming_filter_errors(data):
+    filt = StreamingFilter(BANDPASS)
+    filt.update(data.crop(end=data.span[0] + 1))
+    with pytest.raises(ValueError) as exc:
+        filt.update(data.crop(data.span[0] + 2))
+    assert str(exc.value).startswith("Cannot update StreamingFilter with "
+                                     "discontiguous data")
+    with pytest.raises(ValueError):
+        filt.update(data.crop(data.span[0] + 1).resample(512))
+
+    # check that reset() allows discontiguous data
+    filt.reset()
+    filt.update(data.crop(data.span[0] + 2))
+
+
+@pytest.mark.parametrize('rate, up, down', [
+    (256, 1, 4),
+    (1000, 125, 128),
+    (3000, 375, 128),
+])
+def test_streaming_resampler(data, rate, up, down):
+    resampler = StreamingResampler(rate)
+    chunks = _feed(resampler, data)
+    chunks.append(resampler.flush())
+    assert chunks[1].sample_rate.value == rate
+    assert chunks[1].unit == data.unit
+    assert chunks[1].name == data.name
+    for a, b in zip(chunks[:-1], chunks[1:]):  # output is contiguous
+        assert a.span[1] == b.span[0]
+
+    # check that the result matches resampling all of the data at once
+    utils.assert_allclose(
+        numpy.concatenate([c.value for c in chunks]),
+        signal.resample_poly(data.value, up, down, window='hamming'),
+    )
+
+    # check that flush() resets the resampler
+    assert resampler._series is None
+
+
+def test_streaming_resampler_errors(data):
+    with pytest.raises(ValueError) as exc:
+        StreamingResampler(numpy.pi).update(data)
+    assert str(exc.value).startswith("Cannot resample from 1024.0 Hz")
+    with pytest.raises(ValueError):
+        StreamingResampler(256).flush()
+    resampler = StreamingResampler(256)
+    resampler.update(data.crop(end=data.span[0] + 1))
+    with pytest.raises(ValueError):
+        resampler.update(data.crop(data.span[0] + 2))
@@ -171,12 +171,12 @@ def planck(N, nleft=0, nright=0):
     w = numpy.ones(N)
     if nleft:
         w[0] *= 0
-        zleft = numpy.array([nleft * (1./k + 1./(k-nleft))
-                            for k in range(1, nleft)])
+        k = numpy.arange(1, nleft)
+        zleft = nleft * (1./k + 1./(k-nleft))
         w[1:nleft] *= expit(-zleft)
     if nright:
         w[N-1] *= 0
-        zright = numpy.array([-nright * (1./(k-nright) + 1./k)
-                             for k in range(1, nright)])
+        k = numpy.arange(1, nright)
+        zright = -nright * (1./(k-nright) + 1./k)
         w[N-nright:N-1] *= expit(-zright)
     return w
@@ -69,6 +69,18 @@ def _from_timeseries(ts1, ts2, stride, fftlength=None, overlap=None,
     if not nsteps:
         return out
 
+    # transform all strides at once, unless custom options were given
+    if not kwargs and ts1.size == ts2.size:
+        from ..signal.spectral import OneToManyCoherence
+        out.value[:] = OneToManyCoherence(
+            ts1,
+            fftlength=fftlength,
+            overlap=overlap,
+            window=window,
+            stride=stride,
+        ).coherence(ts2).value
+        return out
+
     # stride through TimeSeries, recording PSDs as columns of spectrogram
     for step in range(nsteps):
         # find step TimeSeries
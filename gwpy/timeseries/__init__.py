@@ -21,8 +21,10 @@
 
 from .core import (TimeSeriesBase, TimeSeriesBaseDict, TimeSeriesBaseList)
 from .timeseries import (TimeSeries, TimeSeriesDict, TimeSeriesList)
+from .matrix import TimeSeriesMatrix
 from .statevector import (StateVector, StateVectorDict, StateVectorList,
                           StateTimeSeries, StateTimeSeriesDict, Bits)
+from .stream import (TimeSeriesRingBuffer, TimeSeriesStream)
 
 from . import io
 
@@ -330,7 +330,7 @@ class TimeSeriesBase(Series):
     @classmethod
     def fetch(cls, channel, start, end, host=None, port=None, verbose=False,
               connection=None, verify=False, pad=None, allow_tape=None,
-              scaled=None, type=None, dtype=None):
+              scaled=None, type=None, dtype=None, nproc=1):
         """Fetch data from NDS
 
         Parameters
@@ -373,11 +373,16 @@ class TimeSeriesBase(Series):
 
         dtype : `type`, `numpy.dtype`, `str`, optional
             identifier for desired output data type
+
+        nproc : `int`, optional
+            number of parallel NDS2 connections to use, the request is
+            split into time chunks across the connections
         """
         return cls.DictClass.fetch(
             [channel], start, end, host=host, port=port, verbose=verbose,
             connection=connection, verify=verify, pad=pad, scaled=scaled,
-            allow_tape=allow_tape, type=type, dtype=dtype)[str(channel)]
+            allow_tape=allow_tape, type=type, dtype=dtype,
+            nproc=nproc)[str(channel)]
 
     @classmethod
     def fetch_open_data(cls, ifo, start, end, sample_rate=4096,
@@ -579,8 +584,9 @@ class TimeSeriesBase(Series):
             `dict` of (`channel`, `dtype`) pairs
 
         nproc : `int`, optional, default: `1`
-            number of parallel processes to use, serial process by
-            default.
+            number of parallel processes (for GWF file access) or
+            connections (for remote NDS2 access) to use, serial process
+            by default.
 
         allow_tape : `bool`, optional, default: `None`
             allow the use of frames that are held on tape, default is `None`
@@ -1033,7 +1039,7 @@ class TimeSeriesBaseDict(OrderedDict):
     def fetch(cls, channels, start, end, host=None, port=None,
               verify=False, verbose=False, connection=None,
               pad=None, scaled=None, allow_tape=None, type=None,
-              dtype=None):
+              dtype=None, nproc=1):
         """Fetch data from NDS for a number of channels.
 
         Parameters
@@ -1084,6 +1090,11 @@ class TimeSeriesBaseDict(OrderedDict):
             numeric data type for returned data, e.g. `numpy.float`, or
             `dict` of (`channel`, `dtype`) pairs
 
+        nproc : `int`, optional, default: `1`
+            number of parallel NDS2 connections to use, the request is
+            split by channel and by time across the connections; this
+            option is ignored if ``connection`` is given
+
         Returns
         -------
         data : :class:`~gwpy.timeseries.TimeSeriesBaseDict`
@@ -1091,7 +1102,7 @@ class TimeSeriesBaseDict(OrderedDict):
             from NDS.
         """
         from ..io import nds2 as io_nds2
-        from .io.nds2 import (print_verbose, fetch)
+        from .io.nds2 import (print_verbose, fetch, fetch_parallel)
 
         if dtype is None:
             dtype = {}
@@ -1099,11 +1110,13 @@ class TimeSeriesBaseDict(OrderedDict):
         # -- open a connection ------------------
 
         # open connection to specific host
+        #     (unless fetching in parallel, see below)
         if connection is None and host is not None:
-            print_verbose("Opening new connection to {0}...".format(host),
-                          end=' ', verbose=verbose)
-            connection = io_nds2.auth_connect(host, port)
-            print_verbose('connected', verbose=verbose)
+            if nproc == 1:
+                print_verbose("Opening new connection to {0}...".format(host),
+                              end=' ', verbose=verbose)
+                connection = io_nds2.auth_connect(host, port)
+                print_verbose('connected', verbose=verbose)
         # otherwise cycle through connections in logical order
         elif connection is None:
             ifos = set([Channel(channel).ifo for channel in channels])
@@ -1123,7 +1136,8 @@ class TimeSeriesBaseDict(OrderedDict):
                         return cls.fetch(channels, start, end, host=host_,
                                          port=port_, verbose=verbose,
                                          type=type, dtype=dtype, pad=pad,
-                                         scaled=scaled, allow_tape=allow_tape_)
+                                         scaled=scaled, allow_tape=allow_tape_,
+                                         nproc=nproc)
                     except (RuntimeError, ValueError) as exc:
                         error = str(exc)  # need to assign to take out of scope
                         warnings.warn(error.split('\n', 1)[0],
@@ -1142,7 +1156,8 @@ class TimeSeriesBaseDict(OrderedDict):
                                                  verify=verify,
                                                  dtype=dtype.get(c), pad=pad,
                                                  scaled=scaled,
-                                                 allow_tape=allow_tape_))
+                                                 allow_tape=allow_tape_,
+                                                 nproc=nproc))
                         for c in channels)
             err = "Cannot find all relevant data on any known server."
             if not verbose:
@@ -1150,13 +1165,21 @@ class TimeSeriesBaseDict(OrderedDict):
                         " to see detailed failures.")
             raise RuntimeError(err)
 
-        # -- at this point we have an open connection, so perform fetch
+        # -- at this point we have an open connection (or a host to
+        #    connect to in parallel), so perform fetch
 
         start = to_gps(start)
         end = to_gps(end)
         istart = int(start)
         iend = int(ceil(end))
 
+        if connection is None:  # fetch with parallel connections to host
+            return fetch_parallel(
+                channels, istart, iend, nproc, host=host, port=port,
+                verbose=verbose, type=type, dtype=dtype, pad=pad,
+                allow_tape=allow_tape, scaled=scaled,
+                series_class=cls.EntryClass).crop(start, end)
+
         return fetch(channels, istart, iend, connection=connection,
                      host=host, port=port, verbose=verbose, type=type,
                      dtype=dtype, pad=pad, allow_tape=allow_tape,
@@ -1318,8 +1341,9 @@ class TimeSeriesBaseDict(OrderedDict):
             `dict` of (`channel`, `dtype`) pairs
 
         nproc : `int`, optional, default: `1`
-            number of parallel processes to use, serial process by
-            default.
+            number of parallel processes (for GWF file access) or
+            connections (for remote NDS2 access) to use, serial process
+            by default.
 
         allow_tape : `bool`, optional, default: `None`
             allow the use of frames that are held on tape, default is `None`
@@ -1363,7 +1387,7 @@ class TimeSeriesBaseDict(OrderedDict):
                     gprint("Failed to access data from frames, trying NDS...")
 
         # remove kwargs for .find()
-        for key in ('nproc', 'frametype', 'frametype_match', 'observatory'):
+        for key in ('frametype', 'frametype_match', 'observatory'):
             kwargs.pop(key, None)
         kwargs.update(nds_kw)  # replace nds keywords
 
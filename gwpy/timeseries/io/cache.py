@@ -19,7 +19,7 @@
 """I/O utilities for reading `TimeSeries` from a `list` of file paths.
 """
 
-from ...io.cache import (FILE_LIKE, read_cache, file_segment, sieve)
+from ...io.cache import (FILE_LIKE, read_cache_table, file_segment, sieve)
 from ...segments import Segment
 
 __author__ = "Duncan Macleod <duncan.macleod@ligo.org>"
@@ -51,8 +51,8 @@ def preformat_cache(cache, start=None, end=None):
     """
     # open cache file
     if isinstance(cache, (str,) + FILE_LIKE):
-        return read_cache(cache, sort=file_segment,
-                          segment=Segment(start, end))
+        cache = read_cache_table(cache, segment=(start, end))
+        return list(cache[cache.argsort()])
 
     # format existing cache file
     cache = type(cache)(cache)  # copy cache
@@ -57,9 +57,11 @@ def _join_factory(cls, gap, pad, start, end):
         def _join(data):
             out = cls()
             data = list(data)
+            # don't copy data freshly read from a single source
+            copy = len(data) > 1
             while data:
                 tsd = data.pop(0)
-                out.append(tsd, gap=gap, pad=pad)
+                out.append(tsd, copy=copy, gap=gap, pad=pad)
                 del tsd
             if gap in ("pad", "raise"):
                 for key in out:
@@ -76,7 +78,11 @@ def _join_factory(cls, gap, pad, start, end):
 
         def _join(arrays):
             list_ = TimeSeriesBaseList(*arrays)
-            joined = list_.join(pad=pad, gap=gap)
+            if len(list_) == 1:
+                # don't copy data freshly read from a single source
+                joined = list_[0]
+            else:
+                joined = list_.join(pad=pad, gap=gap)
             if gap in ("pad", "raise"):
                 return _pad_series(
                     joined,
@@ -250,7 +250,7 @@ def register_gwf_api(library):
                 and source.name.endswith(('.lcf', '.cache'))
             )
         ):
-            source = io_cache.read_cache(source)
+            source = io_cache.read_cache_table(source)
         # separate cache into contiguous segments
         if io_cache.is_cache(source):
             if start is not None and end is not None:
@@ -258,7 +258,7 @@ def register_gwf_api(library):
                     source,
                     segment=LigoSegment(start, end),
                 )
-            source = list(io_cache.find_contiguous(source))
+            source = list(map(list, io_cache.find_contiguous(source)))
         # convert everything else into a list if needed
         if not isinstance(source, (list, tuple)):
             source = [source]
@@ -22,8 +22,17 @@
 from astropy import units
 
 from ...io import registry as io_registry
-from ...io.hdf5 import (identify_hdf5, with_read_hdf5, with_write_hdf5)
-from ...types.io.hdf5 import (read_hdf5_array, write_hdf5_series)
+from ...io.hdf5 import (
+    find_dataset,
+    identify_hdf5,
+    with_read_hdf5,
+    with_write_hdf5,
+)
+from ...types.io.hdf5 import (
+    read_hdf5_data,
+    read_hdf5_metadata,
+    write_hdf5_series,
+)
 from .. import (TimeSeries, TimeSeriesDict,
                 StateVector, StateVectorDict)
 
@@ -34,20 +43,66 @@ __author__ = 'Duncan Macleod <duncan.macleod@ligo.org>'
 
 # -- read ---------------------------------------------------------------------
 
-def read_hdf5_timeseries(h5f, path=None, start=None, end=None, **kwargs):
+@with_read_hdf5
+def read_hdf5_timeseries(h5f, path=None, start=None, end=None,
+                         array_type=TimeSeries, mmap=False):
     """Read a `TimeSeries` from HDF5
+
+    If ``start`` and/or ``end`` are given, only the relevant samples are
+    read from disk.
+
+    If ``mmap=True`` is given, contiguous, uncompressed datasets are
+    memory-mapped as read-only arrays, so that data are only loaded from
+    disk as they are accessed; cropping or slicing the returned series
+    gives a view of the mapped data without copying.
+    """
+    dataset = find_dataset(h5f, path=path)
+    attrs = read_hdf5_metadata(dataset)
+
+    # find the samples to read
+    index = _crop_index(attrs, dataset.shape[0], start, end)
+    if index is None:  # irregular series, read everything and crop
+        series = array_type(
+            read_hdf5_data(dataset, mmap=mmap),
+            copy=False,
+            **attrs,
+        )
+        if start is not None:
+            start = max(start, series.span[0])
+        if end is not None:
+            end = min(end, series.span[1])
+        if start is not None or end is not None:
+            return series.crop(start, end)
+        return series
+
+    # read data and record the new start time
+    data = read_hdf5_data(dataset, index=index, mmap=mmap)
+    if index.start:
+        attrs['x0'] = attrs['x0'] + index.start * attrs['dx']
+    return array_type(data, copy=False, **attrs)
+
+
+def _crop_index(attrs, size, start, end):
+    """Find the `slice` of a regular series dataset covering ``[start, end)``
+
+    Returns `None` if ``attrs`` don't describe a regularly-sampled series.
     """
-    # read data
-    kwargs.setdefault('array_type', TimeSeries)
-    series = read_hdf5_array(h5f, path=path, **kwargs)
-    # crop if needed
-    if start is not None:
-        start = max(start, series.span[0])
+    try:
+        x0 = float(attrs['x0'])
+        dx = float(attrs['dx'])
+    except KeyError:
+        return None
+    if 'xindex' in attrs:
+        return None
+
+    idx0 = idx1 = None
+    if start is not None and float(start) > x0:
+        idx0 = min(int((float(start) - x0) // dx), size)
     if end is not None:
-        end = min(end, series.span[1])
-    if start is not None or end is not None:
-        return series.crop(start, end)
-    return series
+        idx1 = max(int((float(end) - x0) // dx), idx0 or 0)
+        if idx1 >= size:
+            idx1 = None
+    return slice(idx0, idx1)
 
 
 def _is_timeseries_dataset(dataset):
@@ -20,18 +20,20 @@
 """
 
 import operator
+import time
 import warnings
 from functools import reduce
+from math import ceil
 
-from numpy import ones as numpy_ones
+import numpy
 
 from ...detector import Channel
 from ...io import nds2 as io_nds2
 from ...segments import (Segment, SegmentList)
 from ...utils import gprint
+from ...utils.mp import multiprocess_with_queues
 from ...utils.progress import progress_bar
 from .. import (TimeSeries)
-from .core import _pad_series
 
 __author__ = "Duncan Macleod <duncan.macleod@ligo.org>"
 
@@ -149,6 +151,8 @@ def fetch(channels, start, end, type=None, dtype=None, allow_tape=None,
 
     # query for each segment
     out = series_class.DictClass()
+    extent = {}  # [first, last) index of data received for each channel
+    stats = {chan: [0, 0.] for chan in channels}  # bytes, decode time
     desc = verbose if isinstance(verbose, str) else 'Downloading data'
     with progress_bar(total=float(abs(qsegs)), desc=desc,
                       unit='s', disable=not bool(verbose)) as bar:
@@ -156,12 +160,16 @@ def fetch(channels, start, end, type=None, dtype=None, allow_tape=None,
             total = 0.
             for buffers in connection.iterate(int(seg[0]), int(seg[1]), names):
                 for buffer_, chan in zip(buffers, channels):
+                    tic = time.perf_counter()
                     series = series_class.from_nds2_buffer(
                         buffer_,
                         scaled=scaled,
-                        copy=chan not in out,  # only copy if first buffer
+                        copy=False,  # copied into the output array below
                     )
-                    out.append({chan: series}, pad=pad, gap=gap)
+                    _insert_series(out, extent, chan, series, start, end,
+                                   pad=pad, gap=gap)
+                    stats[chan][0] += buffer_.data.nbytes
+                    stats[chan][1] += time.perf_counter() - tic
                 new = buffer_.length / buffer_.channel.sample_rate
                 total += new
                 bar.update(new)
@@ -170,21 +178,164 @@ def fetch(channels, start, end, type=None, dtype=None, allow_tape=None,
                 raise RuntimeError("no data received from {0} for {1}".format(
                     connection.get_host(), seg))
 
+    for chan in channels:
+        print_verbose(
+            "    {0}: received {1[0]} bytes, decoded in {1[1]:.3f}s".format(
+                chan, stats[chan]),
+            verbose=verbose,
+        )
+
     # finalise timeseries to make sure each channel has the correct limits
-    # only if user asked to pad gaps
-    if pad is not None:
-        for chan, ndschan in zip(channels, ndschannels):
-            try:
-                ts = out[chan]
-            except KeyError:
-                out[chan] = _create_series(ndschan, pad, start, end,
-                                           series_class=series_class)
-            else:
-                out[chan] = _pad_series(ts, pad, start, end)
+    for chan, ndschan in zip(channels, ndschannels):
+        if chan not in out and pad is not None:  # no data received at all
+            out[chan] = _create_series(ndschan, pad, start, end,
+                                       series_class=series_class)
+        elif chan in out and pad is None:  # crop to the data received
+            out[chan] = out[chan][slice(*extent[chan])]
+
+    return out
+
+
+def _fetch_chunk(task):
+    """Fetch data for one group of channels over one time chunk
+
+    A new connection is opened for each task, so that tasks can be
+    executed in parallel.
+    """
+    channels, start, end, kwargs = task
+    return fetch(channels, start, end, **kwargs)
+
+
+def _split_segment(start, end, nchunks, step=1):
+    """Split ``[start, end)`` into at most ``nchunks`` contiguous chunks
+
+    Chunk boundaries are aligned to multiples of ``step`` seconds
+    relative to ``start``.
+    """
+    size = max(int(ceil((end - start) / nchunks / step)) * step, step)
+    edges = list(range(start, end, size)) + [end]
+    return list(zip(edges[:-1], edges[1:]))
+
+
+def fetch_parallel(channels, start, end, nproc, host=None, port=None,
+                   pad=None, verbose=False, series_class=TimeSeries,
+                   **kwargs):
+    """Fetch a dict of data series from NDS2 using parallel connections
+
+    The request is split by channel groups and by time chunks into
+    (roughly) ``nproc`` tasks, each of which is executed with its own
+    connection to ``host``, and the results are merged into a single,
+    pre-allocated dict.
+
+    This method sits underneath `TimeSeriesDict.fetch` and related methods,
+    and isn't really designed to be called directly.
+    """
+    # handle minute trend timing here, so that all chunks align
+    step = 1
+    if any(Channel(c).type == 'm-trend' for c in channels):
+        step = 60
+        if start % 60 or end % 60:
+            warnings.warn("Requested at least one minute trend, but "
+                          "start and stop GPS times are not multiples of "
+                          "60. Times will be expanded outwards to compensate")
+            start, end = io_nds2.minute_trend_times(start, end)
+
+    # split request into channel groups and time chunks
+    ngroups = min(nproc, len(channels))
+    groups = [channels[i::ngroups] for i in range(ngroups)]
+    chunks = _split_segment(start, end, int(ceil(nproc / ngroups)), step=step)
+    kwargs.update(host=host, port=port, pad=pad, series_class=series_class)
+    tasks = [(group, cstart, cend, kwargs) for cstart, cend in chunks for
+             group in groups]
 
+    # fetch data
+    if bool(verbose):
+        verbose = verbose if isinstance(verbose, str) else 'Downloading data'
+    results = multiprocess_with_queues(
+        min(nproc, len(tasks)),
+        _fetch_chunk,
+        tasks,
+        verbose=verbose,
+        unit='chunks',
+    )
+
+    # merge results (ordered by time) into a single pre-allocated dict
+    out = series_class.DictClass()
+    extent = {}
+    gap = 'raise' if pad is None else 'pad'
+    for chan in channels:  # preserve channel order
+        for result in results:
+            if chan in result:
+                _insert_series(out, extent, chan, result[chan], start, end,
+                               pad=pad, gap=gap)
+        if pad is None:  # crop to the data received
+            out[chan] = out[chan][slice(*extent[chan])]
     return out
 
 
+def _allocate_series(series, start, end, pad=None):
+    """Allocate a new series to hold all data for the [start, end) interval
+
+    The new array is filled with ``pad``, or left uninitialised if
+    ``pad=None``.
+    """
+    nsamp = int(round(float(end - start) * series.sample_rate.value))
+    if pad is None:
+        data = numpy.empty(nsamp, dtype=series.dtype)
+    else:
+        data = numpy.full(nsamp, pad, dtype=numpy.result_type(series.dtype,
+                                                              pad))
+    return type(series)(
+        data,
+        t0=start,
+        sample_rate=series.sample_rate,
+        unit=series.unit,
+        channel=series.channel,
+        name=series.name,
+        copy=False,
+    )
+
+
+def _insert_series(out, extent, key, series, start, end, pad=None,
+                   gap='raise'):
+    """Write the data for a single buffer into the pre-allocated output
+
+    ``out[key]`` is allocated to cover the full ``[start, end)`` interval
+    when the first buffer is received for that key, so each new buffer
+    is copied exactly once.
+    ``extent[key]`` records the ``[first, last)`` indices of the data
+    received so far.
+    """
+    try:
+        target = out[key]
+    except KeyError:
+        target = out[key] = _allocate_series(series, start, end, pad=pad)
+    rate = series.sample_rate.value
+    idx0 = int(round(float(series.t0.value - start) * rate))
+    idx1 = idx0 + series.size
+
+    # check that the new data are contiguous with the old
+    if key in extent and gap == 'raise' and idx0 != extent[key][1]:
+        first, last = extent[key]
+        raise ValueError(
+            "Cannot append discontiguous {0}\n"
+            "    {0} 1 span: {1}\n    {0} 2 span: {2}".format(
+                type(series).__name__,
+                (float(start) + first / rate, float(start) + last / rate),
+                series.xspan,
+            ))
+
+    # write the data into their slot
+    lo = max(idx0, 0)
+    hi = min(idx1, target.size)
+    if hi > lo:
+        target.value[lo:hi] = series.value[lo - idx0:hi - idx0]
+    if key in extent:
+        extent[key] = (min(extent[key][0], lo), max(extent[key][1], hi))
+    else:
+        extent[key] = (lo, hi)
+
+
 def _create_series(ndschan, value, start, end, series_class=TimeSeries):
     """Create a timeseries to cover the specified [start, end) limits
 
@@ -192,7 +343,7 @@ def _create_series(ndschan, value, start, end, series_class=TimeSeries):
     """
     channel = Channel.from_nds2(ndschan)
     nsamp = int((end - start) * channel.sample_rate.value)
-    return series_class(numpy_ones(nsamp) * value, t0=start,
+    return series_class(numpy.ones(nsamp) * value, t0=start,
                         sample_rate=channel.sample_rate, unit=channel.unit,
                         channel=channel)
 
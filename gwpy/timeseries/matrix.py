@@ -0,0 +1,698 @@
+# -*- coding: utf-8 -*-
+# Copyright (C) Duncan Macleod (2014-2020)
+#
+# This file is part of GWpy.
+#
+# GWpy is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# GWpy is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with GWpy.  If not, see <http://www.gnu.org/licenses/>.
+
+"""A 2-D array of time-series data for many channels
+"""
+
+import numpy
+from numpy.lib.stride_tricks import as_strided
+
+from scipy import signal
+
+from astropy import units
+
+from ..detector.units import parse_unit
+from ..frequencyseries import FrequencySeries
+from ..segments import Segment
+from ..signal.spectral._ui import (
+    _chunk_indices,
+    _normalize_overlap,
+    _normalize_window,
+    seconds_to_samples,
+)
+from ..signal.spectral._utils import scale_timeseries_unit
+from .timeseries import (
+    DEFAULT_FFT_METHOD,
+    TimeSeries,
+    TimeSeriesDict,
+    _apply_filter,
+    _convolve_array,
+    _digital_filter,
+    _fft_length_default,
+    _whitening_filter,
+)
+
+__author__ = 'Duncan Macleod <duncan.macleod@ligo.org>'
+
+__all__ = ['TimeSeriesMatrix']
+
+#: averaging method for each of the supported PSD ``method`` arguments
+AVERAGE_METHODS = {
+    'bartlett': 'mean',
+    'median': 'median',
+    'welch': 'mean',
+}
+
+
+def _owner(arr):
+    """Return the array that owns the memory of ``arr``
+    """
+    while isinstance(arr.base, numpy.ndarray):
+        arr = arr.base
+    return arr
+
+
+def _stacked_view(arrays):
+    """Return a 2-D view of 1-D arrays that are equally-spaced in memory
+
+    Returns `None` if the arrays cannot be represented as a single view
+    (e.g. they were allocated separately).
+    """
+    first = arrays[0]
+    if first.ndim != 1:
+        return None
+    if len(arrays) == 1:
+        return first[numpy.newaxis]
+    # the view only holds a reference to the first array, so all of the
+    # arrays must share the same memory
+    owner = _owner(first)
+    if any(arr.dtype != first.dtype or arr.shape != first.shape
+           or arr.strides != first.strides or _owner(arr) is not owner
+           for arr in arrays):
+        return None
+    ptrs = [arr.__array_interface__['data'][0] for arr in arrays]
+    step = ptrs[1] - ptrs[0]
+    if step <= 0 or any(b - a != step for a, b in zip(ptrs[:-1], ptrs[1:])):
+        return None
+    return as_strided(
+        first,
+        shape=(len(arrays), first.size),
+        strides=(step, first.strides[0]),
+        writeable=first.flags.writeable,
+    )
+
+
+class TimeSeriesMatrix(object):
+    """A 2-D array of data for many channels, sharing the same time samples
+
+    Each row of the `TimeSeriesMatrix` holds the data for one channel, with
+    every row sharing the same GPS start time and sampling rate; each of
+    the processing methods operates on all rows of the array in a single
+    call, rather than one channel at a time.
+
+    Parameters
+    ----------
+    value : `numpy.ndarray`
+        a 2-D array of shape ``(nchannels, nsamples)``
+
+    t0 : `~gwpy.time.LIGOTimeGPS`, `float`, optional
+        GPS time of the first sample (of each row), default: ``0``
+
+    dt : `float`, `~astropy.units.Quantity`, optional
+        time between successive samples (seconds), default: ``1``
+
+    sample_rate : `float`, `~astropy.units.Quantity`, optional
+        the rate of samples per second (Hertz), can be given instead
+        of ``dt``
+
+    unit : `~astropy.units.Unit`, `list`, optional
+        the physical unit of the data, or a list of units (one per row)
+
+    names : `list` of `str`, optional
+        the name of each row
+
+    channels : `list`, optional
+        the `~gwpy.detector.Channel` (or channel name) for each row
+
+    copy : `bool`, optional
+        if `True` copy ``value`` into new (contiguous) memory,
+        default: `False`
+
+    Notes
+    -----
+    Rows returned by indexing, iterating over, or converting the matrix
+    with :meth:`~TimeSeriesMatrix.to_dict` are `TimeSeries` views of the
+    underlying array, so no data are copied.
+
+    Examples
+    --------
+    >>> from gwpy.timeseries import (TimeSeriesDict, TimeSeriesMatrix)
+    >>> data = TimeSeriesDict.get(channels, start, end)
+    >>> matrix = TimeSeriesMatrix.from_dict(data)
+    >>> asds = matrix.asd(4, 2)
+    """
+    def __init__(self, value, t0=0, dt=None, sample_rate=None, unit=None,
+                 names=None, channels=None, copy=False):
+        value = numpy.array(value, copy=copy, subok=False)
+        if value.ndim != 2:
+            raise ValueError("{} data must be 2-dimensional, got shape "
+                             "{}".format(type(self).__name__, value.shape))
+        self.value = value
+        self.t0 = t0
+        if sample_rate is not None and dt is None:
+            self.sample_rate = sample_rate
+        else:
+            self.dt = 1 if dt is None else dt
+        nrow = value.shape[0]
+        if unit is None or isinstance(unit, (str, units.UnitBase)):
+            unit = [unit] * nrow
+        self.units = [None if u is None else parse_unit(u) for u in unit]
+        self.names = list(names) if names is not None else [None] * nrow
+        self.channels = (list(channels) if channels is not None
+                         else [None] * nrow)
+        for attr in ('units', 'names', 'channels'):
+            if len(getattr(self, attr)) != nrow:
+                raise ValueError("{} must have one entry per row".format(
+                    attr))
+
+    # -- properties -----------------------------
+
+    @property
+    def t0(self):
+        """GPS time of the first sample
+
+        :type: `~astropy.units.Quantity` scalar
+        """
+        return units.Quantity(self._t0, 's')
+
+    @t0.setter
+    def t0(self, t0):
+        if isinstance(t0, units.Quantity):
+            t0 = t0.to('s').value
+        self._t0 = float(t0)
+
+    @property
+    def dt(self):
+        """Time between samples
+
+        :type: `~astropy.units.Quantity` scalar
+        """
+        return units.Quantity(self._dt, 's')
+
+    @dt.setter
+    def dt(self, dt):
+        if isinstance(dt, units.Quantity):
+            dt = dt.to('s').value
+        self._dt = float(dt)
+
+    @property
+    def sample_rate(self):
+        """Data rate for each row in samples per second (Hertz)
+
+        :type: `~astropy.units.Quantity` scalar
+        """
+        return units.Quantity(1 / self._dt, 'Hz')
+
+    @sample_rate.setter
+    def sample_rate(self, rate):
+        if isinstance(rate, units.Quantity):
+            rate = rate.to('Hz').value
+        self._dt = 1 / float(rate)
+
+    @property
+    def shape(self):
+        """The ``(nchannels, nsamples)`` shape of the data
+        """
+        return self.value.shape
+
+    @property
+    def duration(self):
+        """Duration of the data (in seconds)
+
+        :type: `~astropy.units.Quantity` scalar
+        """
+        return units.Quantity(self.shape[1] * self._dt, 's')
+
+    @property
+    def span(self):
+        """GPS ``[start, stop)`` span of the data
+
+        :type: `~gwpy.segments.Segment`
+        """
+        return Segment(self._t0, self._t0 + self.shape[1] * self._dt)
+
+    @property
+    def times(self):
+        """Array of GPS times for each sample (of every row)
+
+        :type: `~astropy.units.Quantity` array
+        """
+        return units.Quantity(
+            self._t0 + numpy.arange(self.shape[1]) * self._dt, 's')
+
+    # -- container methods ----------------------
+
+    def __len__(self):
+        return self.shape[0]
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self[i]
+
+    def __getitem__(self, item):
+        """Return one row as a `TimeSeries` (view)
+
+        ``item`` can be either a row index, or the name of a row.
+        """
+        if isinstance(item, str):
+            item = self.names.index(item)
+        return TimeSeries(
+            self.value[item],
+            t0=self._t0,
+            dt=self._dt,
+            unit=self.units[item],
+            name=self.names[item],
+            channel=self.channels[item],
+            copy=False,
+        )
+
+    def __repr__(self):
+        return "<{}({} channels, {} samples, t0={}, sample_rate={})>".format(
+            type(self).__name__, self.shape[0], self.shape[1], self.t0,
+            self.sample_rate)
+
+    def _new(self, value, **kwargs):
+        """Return a new `TimeSeriesMatrix` with the metadata of this one
+        """
+        if 'sample_rate' not in kwargs:
+            kwargs.setdefault('dt', self.dt)
+        for attr in ('t0', 'names', 'channels'):
+            kwargs.setdefault(attr, getattr(self, attr))
+        kwargs.setdefault('unit', self.units)
+        return type(self)(value, **kwargs)
+
+    def copy(self):
+        """Return a copy of this `TimeSeriesMatrix`
+        """
+        return self._new(self.value, copy=True)
+
+    @classmethod
+    def from_dict(cls, tsdict, copy=False):
+        """Create a new `TimeSeriesMatrix` from a `TimeSeriesDict`
+
+        Parameters
+        ----------
+        tsdict : `dict` of `TimeSeries`
+            the input data, all entries must share the same GPS start
+            time, sampling rate, and number of samples
+
+        copy : `bool`, optional
+            if `True` always copy the data; by default entries that are
+            already rows of a single array (e.g. from
+            :meth:`~TimeSeriesMatrix.to_dict`) are not copied, otherwise
+            they are stacked into a new array
+
+        Returns
+        -------
+        matrix : `TimeSeriesMatrix`
+            a new matrix with one row per entry of ``tsdict``
+
+        Raises
+        ------
+        ValueError
+            if the entries do not share the same time samples
+        """
+        names = list(tsdict)
+        series = list(tsdict.values())
+        if not series:
+            raise ValueError("Cannot create {} from empty {}".format(
+                cls.__name__, type(tsdict).__name__))
+        first = series[0]
+        for ts in series[1:]:
+            if (ts.t0 != first.t0 or ts.dt != first.dt
+                    or ts.size != first.size):
+                raise ValueError(
+                    "Cannot create {} from {}, all entries must have the "
+                    "same t0, dt, and size".format(
+                        cls.__name__, type(tsdict).__name__))
+        value = None if copy else _stacked_view([ts.value for ts in series])
+        if value is None:
+            value = numpy.vstack([ts.value for ts in series])
+        return cls(
+            value,
+            t0=first.t0,
+            dt=first.dt,
+            unit=[ts.unit for ts in series],
+            names=names,
+            channels=[ts.channel for ts in series],
+        )
+
+    def to_dict(self):
+        """Convert this `TimeSeriesMatrix` into a `TimeSeriesDict`
+
+        Each entry is a `TimeSeries` view of a row of this matrix, keyed
+        by the row name (or index, if the row has no name).
+
+        Returns
+        -------
+        tsdict : `TimeSeriesDict`
+        """
+        out = TimeSeriesDict()
+        for i, ts in enumerate(self):
+            out[i if ts.name is None else ts.name] = ts
+        return out
+
+    # -- processing -----------------------------
+
+    def crop(self, start=None, end=None, copy=False):
+        """Crop this `TimeSeriesMatrix` to the given GPS ``[start, end)``
+
+        Parameters
+        ----------
+        start : `~gwpy.time.LIGOTimeGPS`, `float`, `str`, optional
+            GPS start time to crop `TimeSeriesMatrix` at left
+
+        end : `~gwpy.time.LIGOTimeGPS`, `float`, `str`, optional
+            GPS end time to crop `TimeSeriesMatrix` at right
+
+        copy : `bool`, optional
+            if `True` copy the data, otherwise return a view,
+            default: `False`
+
+        Returns
+        -------
+        matrix : `TimeSeriesMatrix`
+            a new matrix with a sub-set of the input data
+
+        See also
+        --------
+        TimeSeries.crop
+            for details of how the new span is determined
+        """
+        # use the TimeSeries logic to find the new span of the first row
+        cropped = self[0].crop(start=start, end=end)
+        idx0 = int(round((cropped.t0.value - self._t0) / self._dt))
+        return self._new(
+            self.value[:, idx0:idx0 + cropped.size],
+            t0=cropped.t0,
+            copy=copy,
+        )
+
+    def filter(self, *filt, **kwargs):
+        """Filter every row of this `TimeSeriesMatrix` with the same filter
+
+        Parameters
+        ----------
+        *filt : filter arguments
+            1, 2, 3, or 4 arguments defining the filter to be applied,
+            see `TimeSeries.filter` for details
+
+        filtfilt : `bool`, optional
+            filter forward and backwards to preserve phase,
+            default: `False`
+
+        analog : `bool`, optional
+            if `True`, filter coefficients will be converted from Hz
+            to Z-domain digital representation, default: `False`
+
+        **kwargs
+            other keyword arguments are passed to the filter method
+
+        Returns
+        -------
+        matrix : `TimeSeriesMatrix`
+            the filtered data
+
+        See also
+        --------
+        TimeSeries.filter
+            for more details
+        """
+        filtfilt = kwargs.pop('filtfilt', False)
+        form, filt = _digital_filter(
+            filt,
+            analog=kwargs.pop('analog', False),
+            sample_rate=self.sample_rate.value,
+        )
+        kwargs['axis'] = -1
+        return self._new(
+            _apply_filter(self.value, form, filt, filtfilt=filtfilt,
+                          **kwargs),
+        )
+
+    def _fft_params(self, fftlength, overlap, window, method):
+        if method not in AVERAGE_METHODS:
+            raise ValueError(
+                "{} only supports the {} PSD methods, not {!r}".format(
+                    type(self).__name__,
+                    ', '.join(map(repr, sorted(AVERAGE_METHODS))),
+                    method,
+                ))
+        nfft = seconds_to_samples(fftlength, self.sample_rate)
+        noverlap = _normalize_overlap(overlap, window, nfft,
+                                      self.sample_rate, method=method)
+        window = _normalize_window(window, nfft, None, self.value.dtype)
+        return nfft, noverlap, window
+
+    def _welch(self, data, nfft, noverlap, window, method):
+        """Calculate the PSD of each row of ``data`` along its last axis
+        """
+        kwargs = {'average': AVERAGE_METHODS[method]}
+        if window is not None:
+            kwargs['window'] = window
+        return signal.welch(
+            data,
+            fs=self.sample_rate.value,
+            nperseg=nfft,
+            noverlap=noverlap,
+            axis=-1,
+            **kwargs
+        )
+
+    def psd(self, fftlength=None, overlap=None, window='hann',
+            method=DEFAULT_FFT_METHOD):
+        """Calculate the PSD of every row of this `TimeSeriesMatrix`
+
+        Parameters
+        ----------
+        fftlength : `float`, optional
+            number of seconds in single FFT, defaults to a single FFT
+            covering the full duration
+
+        overlap : `float`, optional
+            number of seconds of overlap between FFTs, defaults to the
+            recommended overlap for the given window (if given), or 0
+
+        window : `str`, `numpy.ndarray`, optional
+            window function to apply to the data prior to FFT,
+            see :func:`scipy.signal.get_window` for details on acceptable
+            formats
+
+        method : `str`, optional
+            FFT-averaging method, one of ``'bartlett'``, ``'median'``,
+            or ``'welch'``
+
+        Returns
+        -------
+        psds : `list` of `~gwpy.frequencyseries.FrequencySeries`
+            the PSD for each row (in order)
+
+        See also
+        --------
+        TimeSeries.psd
+            for more details
+        """
+        nfft, noverlap, window = self._fft_params(
+            fftlength or self.duration, overlap, window, method)
+        freqs, psd = self._welch(self.value, nfft, noverlap, window, method)
+        return [FrequencySeries(
+            row,
+            unit=scale_timeseries_unit(unit, 'density'),
+            frequencies=freqs,
+            name=name,
+            epoch=self.t0.value,
+            channel=channel,
+            copy=False,
+        ) for row, unit, name, channel in zip(
+            psd, self.units, self.names, self.channels)]
+
+    def asd(self, fftlength=None, overlap=None, window='hann',
+            method=DEFAULT_FFT_METHOD):
+        """Calculate the ASD of every row of this `TimeSeriesMatrix`
+
+        See :meth:`TimeSeriesMatrix.psd` for details of the arguments.
+
+        Returns
+        -------
+        asds : `list` of `~gwpy.frequencyseries.FrequencySeries`
+            the ASD for each row (in order)
+
+        See also
+        --------
+        TimeSeries.asd
+            for more details
+        """
+        return [psd ** (1/2.) for psd in self.psd(
+            fftlength=fftlength,
+            overlap=overlap,
+            window=window,
+            method=method,
+        )]
+
+    def spectrogram(self, stride, fftlength=None, overlap=None,
+                    window='hann', method=DEFAULT_FFT_METHOD):
+        """Calculate the average power spectrogram of every row
+
+        Parameters
+        ----------
+        stride : `float`
+            number of seconds in single PSD (column of spectrogram)
+
+        fftlength : `float`, optional
+            number of seconds in single FFT, defaults to ``stride``
+
+        overlap : `float`, optional
+            number of seconds of overlap between FFTs, defaults to the
+            recommended overlap for the given window (if given), or 0
+
+        window : `str`, `numpy.ndarray`, optional
+            window function to apply to the data prior to FFT,
+            see :func:`scipy.signal.get_window` for details on acceptable
+            formats
+
+        method : `str`, optional
+            FFT-averaging method, one of ``'bartlett'``, ``'median'``,
+            or ``'welch'``
+
+        Returns
+        -------
+        spectrograms : `list` of `~gwpy.spectrogram.Spectrogram`
+            the spectrogram for each row (in order)
+
+        See also
+        --------
+        TimeSeries.spectrogram
+            for more details
+        """
+        from ..spectrogram import Spectrogram
+        nstride = seconds_to_samples(stride, self.sample_rate)
+        nfft, noverlap, window = self._fft_params(
+            fftlength or stride, overlap, window, method)
+        if nstride > self.shape[1]:
+            raise ValueError("stride cannot be greater than the duration of "
+                             "this TimeSeriesMatrix")
+        if nfft > nstride:
+            raise ValueError("fftlength cannot be greater than stride")
+        if noverlap >= nfft:
+            raise ValueError("overlap must be less than fftlength")
+
+        # stack the data for each stride along a new axis
+        idx = numpy.array([
+            numpy.arange(x, y) for x, y in
+            _chunk_indices(self.shape[1], nstride, noverlap)
+        ])
+        freqs, psd = self._welch(self.value[:, idx], nfft, noverlap, window,
+                                 method)
+        return [Spectrogram(
+            row,
+            unit=scale_timeseries_unit(unit, 'density'),
+            epoch=self.t0.value,
+            dt=stride,
+            f0=freqs[0],
+            df=freqs[1] - freqs[0],
+            name=name,
+            channel=channel,
+            copy=False,
+        ) for row, unit, name, channel in zip(
+            psd, self.units, self.names, self.channels)]
+
+    def whiten(self, fftlength=None, overlap=0, method=DEFAULT_FFT_METHOD,
+               window='hanning', detrend='constant', asd=None,
+               fduration=2, highpass=None):
+        """Whiten every row of this `TimeSeriesMatrix`
+
+        Parameters
+        ----------
+        fftlength : `float`, optional
+            FFT integration length (in seconds) for ASD estimation,
+            default: choose based on sample rate
+
+        overlap : `float`, optional
+            number of seconds of overlap between FFTs, default: ``0``
+
+        method : `str`, optional
+            FFT-averaging method for ASD estimation
+
+        window : `str`, `numpy.ndarray`, optional
+            window function to apply to the data prior to FFT
+
+        detrend : `str`, optional
+            type of detrending to do before FFT
+
+        asd : `list` of `~gwpy.frequencyseries.FrequencySeries`, optional
+            the amplitude spectral density for each row, if not given
+            these are calculated using :meth:`TimeSeriesMatrix.asd`
+
+        fduration : `float`, optional
+            duration (in seconds) of the time-domain FIR whitening filter,
+            must be no longer than `fftlength`, default: 2 seconds
+
+        highpass : `float`, optional
+            highpass corner frequency (in Hz) of the FIR whitening filter,
+            default: `None`
+
+        Returns
+        -------
+        matrix : `TimeSeriesMatrix`
+            the whitened data
+
+        See also
+        --------
+        TimeSeries.whiten
+            for more details
+        """
+        fftlength = fftlength if fftlength else _fft_length_default(self.dt)
+        if asd is None:
+            asd = self.asd(fftlength, overlap=overlap, method=method,
+                           window=window)
+        if len(asd) != len(self):
+            raise ValueError("asd must contain one ASD per row")
+        duration = self.duration.value
+        rate = self.sample_rate.value
+        # design one whitening filter per row, then apply all at once
+        tdw = numpy.vstack([_whitening_filter(
+            row,
+            duration,
+            rate,
+            fduration=fduration,
+            highpass=highpass,
+            window=window,
+        ) for row in asd])
+        in_ = signal.detrend(self.value, type=detrend, axis=-1)
+        out = _convolve_array(in_, tdw, window=window)
+        return self._new(out * numpy.sqrt(2 * self._dt))
+
+    def rms(self, stride=1):
+        """Calculate the root-mean-square value of every row once per stride
+
+        Parameters
+        ----------
+        stride : `float`
+            stride (seconds) between RMS calculations
+
+        Returns
+        -------
+        rms : `TimeSeriesMatrix`
+            a new matrix containing the RMS values with ``dt=stride``
+
+        See also
+        --------
+        TimeSeries.rms
+            for more details
+        """
+        stridesamp = int(stride * self.sample_rate.value)
+        nsteps = int(self.shape[1] // stridesamp)
+        data = numpy.abs(
+            self.value[:, :nsteps * stridesamp]
+        ).reshape(len(self), nsteps, stridesamp)
+        return self._new(
+            numpy.sqrt(numpy.mean(data ** 2, axis=-1)),
+            sample_rate=1/float(stride),
+            names=['%s %.2f-second RMS' % (name, stride) for
+                   name in self.names],
+        )
@@ -0,0 +1,354 @@
+# -*- coding: utf-8 -*-
+# Copyright (C) Duncan Macleod (2014-2020)
+#
+# This file is part of GWpy.
+#
+# GWpy is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# GWpy is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with GWpy.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Streaming access to time-series data from a growing archive of files
+"""
+
+import glob
+import os.path
+import time
+
+import numpy
+
+from ..io.cache import file_segment
+from ..io.utils import file_path
+from ..time import to_gps
+from .timeseries import (TimeSeries, TimeSeriesDict)
+
+__author__ = "Duncan Macleod <duncan.macleod@ligo.org>"
+
+__all__ = ['TimeSeriesRingBuffer', 'TimeSeriesStream']
+
+
+# -- ring buffer --------------------------------------------------------------
+
+class TimeSeriesRingBuffer(object):
+    """A fixed-length buffer holding the most recent data for one channel
+
+    Parameters
+    ----------
+    duration : `float`
+        the length (in seconds) of data to retain
+
+    sample_rate : `float`, `~astropy.units.Quantity`
+        the rate of samples per second (Hertz)
+
+    dtype : `numpy.dtype`, optional
+        the data type of the buffer
+
+    **metadata
+        other metadata (e.g. ``unit``, ``name``, ``channel``) for the
+        `TimeSeries` returned by :attr:`data`
+
+    Notes
+    -----
+    The buffer allocates twice the required storage and writes each sample
+    twice, so that the most recent ``duration`` of data are always
+    stored contiguously in memory; this means that :attr:`data` is a
+    view of the buffer, and accessing it never copies any data.
+    """
+    def __init__(self, duration, sample_rate, dtype=float, **metadata):
+        self.metadata = metadata
+        self.metadata['sample_rate'] = sample_rate
+        self.dt = 1 / float(getattr(sample_rate, 'value', sample_rate))
+        self.size = int(round(float(duration) / self.dt))
+        self._buffer = numpy.zeros(2 * self.size, dtype=dtype)
+        self.clear()
+
+    @classmethod
+    def from_series(cls, series, duration):
+        """Create a new buffer with the same properties as this series
+        """
+        return cls(duration, series.sample_rate, dtype=series.dtype,
+                   unit=series.unit, name=series.name,
+                   channel=series.channel)
+
+    def clear(self):
+        """Remove all data from this buffer
+        """
+        self._head = 0  # index of the next sample to write
+        self._count = 0  # number of samples held
+        self.end = None  # GPS time after the last sample
+
+    def __len__(self):
+        return self._count
+
+    @property
+    def start(self):
+        """GPS time of the first sample held in this buffer
+        """
+        if self.end is None:
+            return None
+        return self.end - self._count * self.dt
+
+    def append(self, series, pad=None):
+        """Add new data to the end of this buffer
+
+        The oldest data are discarded to make room for the new data.
+
+        Parameters
+        ----------
+        series : `TimeSeries`
+            the new data, must start where the existing data end
+
+        pad : `float`, optional
+            value with which to fill any gap between the existing data
+            and the new data, by default gaps will result in a
+            `ValueError`
+
+        Raises
+        ------
+        ValueError
+            if the new data overlap with the existing data, or if
+            there is a gap and ``pad=None`` is given
+        """
+        t0 = float(series.t0.value)
+        if self.end is not None:
+            gap = int(round((t0 - self.end) / self.dt))
+            if gap < 0:
+                raise ValueError(
+                    "Cannot append overlapping data to buffer ending at "
+                    f"{self.end}, new data start at {t0}",
+                )
+            if gap and pad is None:
+                raise ValueError(
+                    "Cannot append discontiguous data to buffer ending at "
+                    f"{self.end}, new data start at {t0}",
+                )
+            if gap:
+                self._write(numpy.full(min(gap, self.size), pad))
+        self._write(numpy.asarray(series.value))
+        self.end = t0 + series.size * self.dt
+
+    def _write(self, values):
+        size = self.size
+        nsamp = values.shape[0]
+        if nsamp > size:  # only keep the most recent data
+            values = values[-size:]
+            nsamp = size
+        head = self._head
+        first = min(nsamp, size - head)
+        for offset in (0, size):  # write everything twice
+            self._buffer[offset+head:offset+head+first] = values[:first]
+            self._buffer[offset:offset+nsamp-first] = values[first:]
+        self._head = (head + nsamp) % size
+        self._count = min(self._count + nsamp, size)
+
+    @property
+    def data(self):
+        """The data held in this buffer, as a read-only `TimeSeries`
+
+        This is a view of the buffer memory, and so will be modified by
+        subsequent calls to :meth:`append`, use ``buffer.data.copy()``
+        to keep a permanent record.
+        """
+        stop = self._head + self.size
+        view = self._buffer[stop-self._count:stop]
+        view.flags.writeable = False
+        return TimeSeries(view, t0=self.start or 0, copy=False,
+                          **self.metadata)
+
+
+# -- streaming ----------------------------------------------------------------
+
+class TimeSeriesStream(object):
+    """Iterate over new data from a growing archive of files
+
+    Each iteration yields a `TimeSeriesDict` containing the data from
+    the next new file, after first adding those data to a fixed-length
+    buffer for each channel (see :attr:`buffer`).
+
+    Parameters
+    ----------
+    channels : `list` of `str`
+        the names of the channels to read
+
+    duration : `float`
+        the length (in seconds) of data to retain in the buffer for
+        each channel
+
+    source : `str`, optional
+        the path of a directory to watch for new files, one of ``source``
+        or ``frametype`` is required
+
+    frametype : `str`, optional
+        the name of the frametype to query for new files using
+        `gwpy.io.datafind` (which supports both gwdatafind and FFL
+        archives), one of ``source`` or ``frametype`` is required
+
+    observatory : `str`, optional
+        the observatory prefix to use for datafind queries, defaults
+        to the prefix of the first channel
+
+    pattern : `str`, optional
+        glob pattern to use to match files in ``source``
+
+    start : `~gwpy.time.LIGOTimeGPS`, `float`, `str`, optional
+        GPS start time of required data, by default the stream will
+        start from the most recent file available
+
+    end : `~gwpy.time.LIGOTimeGPS`, `float`, `str`, optional
+        GPS end time of required data, by default the stream will run
+        forever
+
+    pad : `float`, optional
+        value with which to fill gaps in the data, by default the
+        buffers are emptied when a gap is found, so that the buffered
+        data are always contiguous
+
+    poll : `float`, optional
+        time (in seconds) to wait between checks for new files
+
+    timeout : `float`, optional
+        time (in seconds) after which to stop iterating if no new files
+        are found, by default the stream will wait forever
+
+    connection : `gwdatafind.http.HTTPConnection`, `FflConnection`, optional
+        the datafind connection to use when ``frametype`` is given
+
+    **readargs
+        other keyword arguments to pass to :meth:`TimeSeriesDict.read`
+
+    Examples
+    --------
+    To keep an up-to-date PSD of the last 64 seconds of strain data:
+
+    >>> from gwpy.timeseries import TimeSeriesStream
+    >>> stream = TimeSeriesStream(['H1:GDS-CALIB_STRAIN'], 64,
+    ...                           frametype='H1_llhoft')
+    >>> for block in stream:
+    ...     psd = stream.buffer['H1:GDS-CALIB_STRAIN'].psd(4, 2)
+    """
+    def __init__(self, channels, duration, source=None, frametype=None,
+                 observatory=None, pattern='*.gwf', start=None, end=None,
+                 pad=None, poll=1., timeout=None, connection=None,
+                 **readargs):
+        if source is None and frametype is None:
+            raise ValueError("one of `source` or `frametype` is required")
+        self.channels = list(map(str, channels))
+        self.duration = float(duration)
+        self.source = source
+        self.frametype = frametype
+        self.observatory = observatory or self.channels[0][0]
+        self.pattern = pattern
+        self.end = None if end is None else float(to_gps(end))
+        self.pad = pad
+        self.poll = poll
+        self.timeout = timeout
+        self.connection = connection
+        self.readargs = readargs
+
+        #: GPS time of the next data to read
+        self.next = None if start is None else float(to_gps(start))
+
+        #: `dict` of `TimeSeriesRingBuffer` for each channel
+        self.buffers = {}
+
+    @property
+    def buffer(self):
+        """The buffered data for each channel, as a `TimeSeriesDict`
+
+        Each `TimeSeries` is a read-only view of the relevant
+        `TimeSeriesRingBuffer`, see :attr:`TimeSeriesRingBuffer.data`.
+        """
+        return TimeSeriesDict(
+            (key, self.buffers[key].data) for key in self.channels if
+            key in self.buffers)
+
+    # -- file discovery -------------------------
+
+    def _find_files(self):
+        """Find new files that contain data after ``self.next``
+        """
+        if self.source is not None:
+            paths = sorted(
+                glob.glob(os.path.join(self.source, self.pattern)),
+                key=file_segment,
+            )
+        else:
+            paths = self._find_datafind()
+        if self.next is None:  # start from the latest file
+            return paths[-1:]
+        return [path for path in paths if file_segment(path)[1] > self.next]
+
+    def _find_datafind(self):
+        from ..io import datafind as io_datafind
+        try:
+            latest = io_datafind.find_latest(
+                self.observatory,
+                self.frametype,
+                allow_tape=True,
+                connection=self.connection,
+            )
+        except RuntimeError:  # no files (yet)
+            return []
+        end = file_segment(latest)[1]
+        if self.next is None or self.next >= end:
+            return [latest]
+        return list(map(file_path, io_datafind.find_urls(
+            self.observatory,
+            self.frametype,
+            self.next,
+            end,
+            on_gaps='ignore',
+            connection=self.connection,
+        )))
+
+    # -- reading --------------------------------
+
+    def _read(self, path):
+        """Read data from the given file and add them to the buffers
+        """
+        start, end = file_segment(path)
+        if self.next is not None:
+            start = max(start, self.next)
+        if self.end is not None:
+            end = min(end, self.end)
+        block = TimeSeriesDict.read(path, self.channels, start=start,
+                                    end=end, **self.readargs)
+        for key, series in block.items():
+            try:
+                buff = self.buffers[key]
+            except KeyError:
+                buff = self.buffers[key] = TimeSeriesRingBuffer.from_series(
+                    series,
+                    self.duration,
+                )
+            try:
+                buff.append(series, pad=self.pad)
+            except ValueError:  # gap (or overlap), so start again
+                buff.clear()
+                buff.append(series)
+        self.next = end
+        return block
+
+    def __iter__(self):
+        waited = 0.
+        while self.end is None or self.next is None or self.next < self.end:
+            paths = self._find_files()
+            if not paths:
+                if self.timeout is not None and waited >= self.timeout:
+                    return
+                time.sleep(self.poll)
+                waited += self.poll
+                continue
+            waited = 0.
+            for path in paths:
+                yield self._read(path)
+                if self.end is not None and self.next >= self.end:
+                    return
@@ -0,0 +1,149 @@
+# -*- coding: utf-8 -*-
+# Copyright (C) Duncan Macleod (2014-2020)
+#
+# This file is part of GWpy.
+#
+# GWpy is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# GWpy is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with GWpy.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Unit tests for :mod:`gwpy.timeseries.matrix`
+"""
+
+import pytest
+
+import numpy
+
+from ...signal import filter_design
+from ...testing import utils
+from .. import (TimeSeries, TimeSeriesDict, TimeSeriesMatrix)
+
+__author__ = "Duncan Macleod <duncan.macleod@ligo.org>"
+
+T0 = 1000000000
+
+
+def _assert_rows(rows, expected, **kwargs):
+    rows = list(rows)
+    assert len(rows) == len(expected)
+    for row, ts in zip(rows, expected.values()):
+        utils.assert_quantity_sub_equal(row, ts, almost_equal=True, **kwargs)
+
+
+class TestTimeSeriesMatrix(object):
+    TEST_CLASS = TimeSeriesMatrix
+
+    @pytest.fixture()
+    def data(self):
+        numpy.random.seed(1)
+        return TimeSeriesDict(
+            (name, TimeSeries(numpy.random.normal(size=256 * 32), t0=T0,
+                              sample_rate=256, name=name, channel=name,
+                              unit=unit))
+            for name, unit in (('X1:TEST-1', 'm'), ('X1:TEST-2', 'V'),
+                               ('X1:TEST-3', 'm')))
+
+    @pytest.fixture()
+    def instance(self, data):
+        return self.TEST_CLASS.from_dict(data)
+
+    def test_new(self):
+        matrix = self.TEST_CLASS(numpy.zeros((2, 100)), t0=T0,
+                                 sample_rate=10, unit='m')
+        assert matrix.shape == (2, 100)
+        assert len(matrix) == 2
+        assert matrix.t0.value == T0
+        assert matrix.dt.value == .1
+        assert matrix.span == (T0, T0 + 10)
+        assert matrix.units == [matrix[0].unit] * 2
+        with pytest.raises(ValueError):
+            self.TEST_CLASS(numpy.zeros(100))
+        with pytest.raises(ValueError):
+            self.TEST_CLASS(numpy.zeros((2, 100)), names=['a'])
+
+    def test_from_dict(self, data, instance):
+        assert instance.names == list(data)
+        assert instance.value.flags.c_contiguous
+        utils.assert_quantity_sub_equal(instance['X1:TEST-2'],
+                                        data['X1:TEST-2'])
+
+        # check that a round-trip doesn't copy the data
+        new = self.TEST_CLASS.from_dict(instance.to_dict())
+        assert numpy.shares_memory(new.value, instance.value)
+        _assert_rows(new, data)
+        new = self.TEST_CLASS.from_dict(instance.to_dict(), copy=True)
+        assert not numpy.shares_memory(new.value, instance.value)
+
+        # check that mismatched data are rejected
+        data['X1:TEST-2'] = data['X1:TEST-2'][1:]
+        with pytest.raises(ValueError):
+            self.TEST_CLASS.from_dict(data)
+
+    def test_to_dict(self, data, instance):
+        new = instance.to_dict()
+        assert isinstance(new, TimeSeriesDict)
+        assert list(new) == list(data)
+        _assert_rows(new.values(), data)
+        assert numpy.shares_memory(new['X1:TEST-1'].value, instance.value)
+
+    def test_crop(self, data, instance):
+        cropped = instance.crop(T0 + 1.5, T0 + 10)
+        assert numpy.shares_memory(cropped.value, instance.value)
+        _assert_rows(cropped, data.crop(T0 + 1.5, T0 + 10))
+
+    def test_filter(self, data, instance):
+        zpk = filter_design.highpass(10, 256)
+        _assert_rows(
+            instance.filter(zpk, filtfilt=True),
+            data.filter(zpk, filtfilt=True),
+        )
+
+    @pytest.mark.parametrize('method', ('welch', 'bartlett', 'median'))
+    def test_psd(self, data, instance, method):
+        _assert_rows(
+            instance.psd(4, 2, method=method),
+            dict((key, ts.psd(4, 2, method=method)) for
+                 key, ts in data.items()),
+        )
+        with pytest.raises(ValueError):
+            instance.psd(4, method='lal_median')
+
+    def test_asd(self, data, instance):
+        _assert_rows(
+            instance.asd(4),
+            dict((key, ts.asd(4)) for key, ts in data.items()),
+        )
+
+    def test_spectrogram(self, data, instance):
+        _assert_rows(
+            instance.spectrogram(4, 2, 1),
+            dict((key, ts.spectrogram(4, 2, 1)) for key, ts in data.items()),
+        )
+        with pytest.raises(ValueError):
+            instance.spectrogram(4, 8)
+
+    def test_whiten(self, data, instance):
+        _assert_rows(
+            instance.whiten(4, 2, window='hann'),
+            dict((key, ts.whiten(4, 2, window='hann')) for
+                 key, ts in data.items()),
+        )
+
+    def test_rms(self, data, instance):
+        rms = instance.rms(2)
+        assert rms.sample_rate.value == .5
+        assert rms.names[0] == 'X1:TEST-1 2.00-second RMS'
+        _assert_rows(
+            rms,
+            dict((key, ts.rms(2)) for key, ts in data.items()),
+            exclude=['unit', 'channel'],
+        )
@@ -0,0 +1,165 @@
+# -*- coding: utf-8 -*-
+# Copyright (C) Duncan Macleod (2014-2020)
+#
+# This file is part of GWpy.
+#
+# GWpy is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# GWpy is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with GWpy.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Unit tests for :mod:`gwpy.timeseries.stream`
+"""
+
+from unittest import mock
+
+import pytest
+
+import numpy
+from numpy import testing as nptest
+
+from ...testing import utils
+from .. import (TimeSeries, TimeSeriesDict)
+from ..stream import (TimeSeriesRingBuffer, TimeSeriesStream)
+
+__author__ = "Duncan Macleod <duncan.macleod@ligo.org>"
+
+CHANNELS = ['X1:TEST-1', 'X1:TEST-2']
+
+
+def _create(start, duration, sample_rate=16, name='X1:TEST-1'):
+    times = numpy.arange(start, start + duration, 1 / sample_rate)
+    return TimeSeries(times, t0=start, sample_rate=sample_rate, name=name,
+                      unit='m')
+
+
+def _write_file(directory, start, duration=4):
+    data = TimeSeriesDict(
+        (name, _create(start, duration, name=name)) for name in CHANNELS)
+    path = directory / f"X-TEST-{start}-{duration}.h5"
+    data.write(path, format='hdf5')
+    return path
+
+
+# -- TimeSeriesRingBuffer -----------------------------------------------------
+
+class TestTimeSeriesRingBuffer(object):
+    TEST_CLASS = TimeSeriesRingBuffer
+
+    def test_append(self):
+        buff = self.TEST_CLASS.from_series(_create(0, 1), 10)
+        assert buff.size == 160
+        assert len(buff) == 0
+        assert buff.data.size == 0
+
+        # fill the buffer, then keep going
+        for start in range(15):
+            buff.append(_create(start, 1))
+            data = buff.data
+            duration = min(start + 1, 10)
+            utils.assert_quantity_sub_equal(
+                data,
+                _create(start + 1 - duration, duration),
+                exclude=['channel'],
+            )
+
+    def test_data_view(self):
+        buff = self.TEST_CLASS.from_series(_create(0, 1), 4)
+        for start in range(7):
+            buff.append(_create(start, 1))
+        data = buff.data
+        assert numpy.shares_memory(data.value, buff._buffer)
+        assert not data.value.flags.writeable
+
+        # check that big chunks only keep the most recent data
+        buff.append(_create(7, 9))
+        utils.assert_quantity_sub_equal(buff.data, _create(12, 4),
+                                        exclude=['channel'])
+
+    def test_append_gap(self):
+        buff = self.TEST_CLASS.from_series(_create(0, 1), 4)
+        buff.append(_create(0, 1))
+        with pytest.raises(ValueError) as exc:
+            buff.append(_create(2, 1))
+        assert str(exc.value).startswith("Cannot append discontiguous")
+        with pytest.raises(ValueError) as exc:
+            buff.append(_create(0.5, 1))
+        assert str(exc.value).startswith("Cannot append overlapping")
+
+        # check padding
+        buff.append(_create(2, 1), pad=-1)
+        assert buff.data.span == (0, 3)
+        nptest.assert_array_equal(buff.data.value[16:32], -1)
+
+
+# -- TimeSeriesStream ---------------------------------------------------------
+
+class TestTimeSeriesStream(object):
+    TEST_CLASS = TimeSeriesStream
+
+    def test_init_error(self):
+        with pytest.raises(ValueError):
+            self.TEST_CLASS(CHANNELS, 8)
+
+    def test_iter_directory(self, tmp_path):
+        for start in (0, 4, 8):
+            _write_file(tmp_path, start)
+        stream = self.TEST_CLASS(CHANNELS, 10, source=tmp_path,
+                                 pattern='*.h5', start=2, end=14)
+
+        # write the next file after the first block is read
+        blocks = []
+        for block in stream:
+            blocks.append(block)
+            if len(blocks) == 1:
+                _write_file(tmp_path, 12)
+        assert [b.span for b in blocks] == [(2, 4), (4, 8), (8, 12), (12, 14)]
+
+        # check that the buffer holds the most recent data
+        for name in CHANNELS:
+            utils.assert_quantity_sub_equal(
+                stream.buffer[name],
+                _create(4, 10, name=name),
+                exclude=['channel'],
+            )
+
+    def test_iter_latest(self, tmp_path):
+        for start in (0, 4):
+            _write_file(tmp_path, start)
+        stream = self.TEST_CLASS(CHANNELS, 10, source=tmp_path,
+                                 pattern='*.h5', poll=0, timeout=0)
+        blocks = list(stream)
+        assert [b.span for b in blocks] == [(4, 8)]
+
+    def test_iter_gap(self, tmp_path):
+        for start in (0, 8):
+            _write_file(tmp_path, start)
+        stream = self.TEST_CLASS(CHANNELS, 10, source=tmp_path,
+                                 pattern='*.h5', start=0, poll=0, timeout=0)
+        list(stream)
+        assert stream.buffer[CHANNELS[0]].span == (8, 12)
+
+        stream = self.TEST_CLASS(CHANNELS, 16, source=tmp_path, pad=0,
+                                 pattern='*.h5', start=0, poll=0, timeout=0)
+        list(stream)
+        assert stream.buffer[CHANNELS[0]].span == (0, 12)
+
+    @mock.patch('gwpy.io.datafind.find_urls')
+    @mock.patch('gwpy.io.datafind.find_latest')
+    def test_iter_datafind(self, find_latest, find_urls, tmp_path):
+        paths = [str(_write_file(tmp_path, start)) for start in (0, 4, 8)]
+        find_latest.return_value = paths[-1]
+        find_urls.return_value = paths[1:]
+        stream = self.TEST_CLASS(CHANNELS, 10, frametype='TEST',
+                                 start=4, end=12)
+        assert [b.span for b in stream] == [(4, 8), (8, 12)]
+        find_urls.assert_called_once_with(
+            'X', 'TEST', 4, 12, on_gaps='ignore', connection=None)
@@ -25,6 +25,8 @@ from unittest import mock
 
 import pytest
 
+import h5py
+
 import numpy
 from numpy import testing as nptest
 
@@ -462,6 +464,76 @@ class TestTimeSeries(_TestTimeSeriesBase):
         t = type(array).read(tmp, start=start, end=end)
         utils.assert_quantity_sub_equal(t, array.crop(start, end))
 
+    @pytest.mark.parametrize('compression', (None, 'gzip'))
+    def test_read_hdf5_mmap(self, tmp_path, compression):
+        array = self.create(name='TEST')
+        tmp = tmp_path / "test.h5"
+        array.write(tmp, compression=compression)
+
+        ts = type(array).read(tmp, mmap=True)
+        utils.assert_quantity_sub_equal(ts, array)
+        # contiguous, uncompressed data are mapped read-only from disk
+        assert ts.flags.writeable is (compression is not None)
+
+        # check that cropping the mapped data gives the right answer
+        start, end = array.span.contract(25)
+        t = type(array).read(tmp, start=start, end=end, mmap=True)
+        utils.assert_quantity_sub_equal(t, array.crop(start, end))
+        cropped = ts.crop(start, end)
+        utils.assert_quantity_sub_equal(cropped, t)
+        assert numpy.shares_memory(cropped.value, ts.value)
+
+    @pytest.mark.parametrize('compression, shuffle', [
+        ('gzip', False),
+        ('lzf', True),
+    ])
+    def test_write_hdf5_extend(self, tmp_path, compression, shuffle):
+        array = self.create(name='TEST')
+        tmp = tmp_path / "test.h5"
+        mid = array.size // 2
+
+        # write in two pieces
+        array[:mid].write(tmp, extend=True, compression=compression,
+                          shuffle=shuffle)
+        array[mid:].write(tmp, extend=True)
+        ts = type(array).read(tmp)
+        utils.assert_quantity_sub_equal(ts, array)
+
+        # check that the dataset was created with the right options
+        with h5py.File(tmp, 'r') as h5f:
+            dset = h5f['TEST']
+            assert dset.maxshape == (None,)
+            assert dset.compression == compression
+            assert dset.shuffle is shuffle
+
+        # check that discontiguous data are refused
+        gap = array.copy()
+        gap.x0 = array.span[1] + 1
+        with pytest.raises(ValueError) as exc:
+            gap.write(tmp, extend=True)
+        assert str(exc.value).startswith('Cannot append discontiguous')
+
+        # check that gaps can be padded
+        gap.write(tmp, extend=True, pad=-1)
+        ts = type(array).read(tmp)
+        assert ts.span == (array.span[0], gap.span[1])
+        npad = int(array.sample_rate.value)
+        nptest.assert_array_equal(ts.value[array.size:-gap.size], -1)
+        assert ts.size == array.size + npad + gap.size
+        nptest.assert_array_equal(ts.value[-gap.size:], gap.value)
+
+    def test_write_hdf5_extend_fixed(self, tmp_path):
+        array = self.create(name='TEST')
+        tmp = tmp_path / "test.h5"
+        array.write(tmp)
+        new = array.copy()
+        new.x0 = array.span[1]
+        with pytest.raises(ValueError) as exc:
+            new.write(tmp, extend=True)
+        assert str(exc.value).startswith(
+            "Cannot extend fixed-size HDF5 dataset 'TEST'",
+        )
+
     def test_read_write_wav(self):
         array = self.create(dtype='float32')
         utils.test_read_write(
@@ -616,6 +688,54 @@ class TestTimeSeries(_TestTimeSeriesBase):
             assert ts2[-11] == ts[-1]
             assert ts2[-1] == -100. * ts.unit
 
+    @utils.skip_missing_dependency('nds2')
+    def test_fetch_buffers(self, capsys):
+        ts = self.TEST_CLASS(numpy.arange(100.), t0=1000000000,
+                             sample_rate=10, name='L1:TEST', unit='m')
+        nds_connection = mocks.nds2_connection(
+            buffers=[mocks.nds2_buffer_from_timeseries(ts)],
+        )
+
+        # return each segment as two separate buffers
+        def iterate(start, end, names):
+            data = ts[int((start - ts.t0.value) * 10):
+                      int((end - ts.t0.value) * 10)]
+            half = data.size // 2
+            return [[mocks.nds2_buffer_from_timeseries(data[:half])],
+                    [mocks.nds2_buffer_from_timeseries(data[half:])]]
+
+        nds_connection.iterate = iterate
+        segments = SegmentList([
+            Segment(ts.t0.value, ts.t0.value + 4),
+            Segment(ts.t0.value + 6, ts.span[1]),
+        ])
+
+        with mock.patch('nds2.connection') as mock_connection, \
+                mock.patch('gwpy.timeseries.io.nds2._get_data_segments',
+                           return_value=segments), \
+                pytest.warns(UserWarning):
+            mock_connection.return_value = nds_connection
+            ts2 = self.TEST_CLASS.fetch('L1:TEST', *ts.span.protract(2),
+                                        pad=-100., host='anything',
+                                        verbose=True)
+
+        # check that the buffers were placed correctly, with gaps padded
+        assert ts2.span == ts.span.protract(2)
+        rate = int(ts.sample_rate.value)
+        nums = numpy.array([2, 4, 2, 4, 2]) * rate
+        pad, data, gap, data2, pad2 = numpy.split(ts2.value,
+                                                  numpy.cumsum(nums)[:-1])
+        assert (pad == -100.).all()
+        assert (gap == -100.).all()
+        assert (pad2 == -100.).all()
+        nptest.assert_array_equal(data, ts.value[:nums[1]])
+        nptest.assert_array_equal(data2, ts.value[-nums[3]:])
+
+        # check that the per-channel statistics were reported
+        assert (
+            "L1:TEST: received {} bytes".format(8 * rate * 8)
+        ) in capsys.readouterr().out
+
     @utils.skip_missing_dependency('nds2')
     def test_fetch_empty_iterate_error(self):
         # test that the correct error is raised if nds2.connection.iterate
@@ -829,6 +949,27 @@ class TestTimeSeries(_TestTimeSeriesBase):
             gw150914.psd(1, **kw) ** (1/2.),
         )
 
+    @pytest.mark.parametrize('method', ('welch', 'bartlett', 'median'))
+    def test_psd_float32(self, noisy_sinusoid, method):
+        psd = noisy_sinusoid.psd(.5, method=method)
+        psd32 = noisy_sinusoid.psd(.5, method=method, dtype='float32')
+        assert psd32.dtype == numpy.float32
+        assert psd32.unit == psd.unit
+        utils.assert_quantity_equal(psd32.frequencies, psd.frequencies)
+        # check relative accuracy (ignoring DC and Nyquist)
+        nptest.assert_allclose(psd32.value[1:-1], psd.value[1:-1],
+                               rtol=1e-5)
+        # check that the working precision is a floating-point type
+        with pytest.raises(ValueError):
+            noisy_sinusoid.psd(.5, method=method, dtype='int32')
+
+    def test_asd_float32(self, noisy_sinusoid):
+        asd = noisy_sinusoid.asd(.5, dtype='float32')
+        assert asd.dtype == numpy.float32
+        nptest.assert_allclose(asd.value[1:-1],
+                               noisy_sinusoid.asd(.5).value[1:-1],
+                               rtol=1e-5)
+
     def test_csd(self, noisy_sinusoid, corrupt_noisy_sinusoid):
         # test that csd(self) is the same as psd()
         fs = noisy_sinusoid.csd(noisy_sinusoid)
@@ -901,6 +1042,22 @@ class TestTimeSeries(_TestTimeSeriesBase):
         utils.assert_quantity_sub_equal(sg[0], psd, exclude=['epoch'],
                                         almost_equal=True)
 
+    def test_spectrogram_float32(self, noisy_sinusoid):
+        sg = noisy_sinusoid.spectrogram(1, .5, method='median')
+        sg32 = noisy_sinusoid.spectrogram(1, .5, method='median',
+                                          dtype='float32')
+        assert sg32.dtype == numpy.float32
+        assert sg32.unit == sg.unit
+        utils.assert_quantity_equal(sg32.times, sg.times)
+        nptest.assert_allclose(sg32.value[:, 1:-1], sg.value[:, 1:-1],
+                               rtol=1e-5)
+
+        sg = noisy_sinusoid.spectrogram2(.5)
+        sg32 = noisy_sinusoid.spectrogram2(.5, dtype='float32')
+        assert sg32.dtype == numpy.float32
+        nptest.assert_allclose(sg32.value[:, 1:-1], sg.value[:, 1:-1],
+                               rtol=1e-4)
+
     def test_spectrogram_fftlength(self, gw150914):
         sg = gw150914.spectrogram(1, fftlength=0.5, method="median")
         assert sg.shape == (abs(gw150914.span),
@@ -1087,6 +1244,55 @@ class TestTimeSeries(_TestTimeSeriesBase):
         # FIXME: this test needs to be more robust
         assert l2.sample_rate == 1024 * units.Hz
 
+    def test_resample_multistage(self):
+        # a 1 Hz sinusoid plus a 100 Hz sinusoid that should be removed
+        times = numpy.arange(1024 * 64) / 1024.
+        data = self.TEST_CLASS(
+            numpy.sin(2 * numpy.pi * times)
+            + numpy.sin(2 * numpy.pi * 100 * times),
+            sample_rate=1024,
+        )
+        new = data.resample(4)  # 256 = [8, 8, 4]
+        assert new.sample_rate == 4 * units.Hz
+        assert new.size == data.size // 256
+        middle = slice(new.size // 4, -new.size // 4)
+        utils.assert_allclose(
+            new.value[middle],
+            numpy.sin(2 * numpy.pi * new.times.value[middle]),
+            atol=1e-2,
+        )
+
+    @pytest.mark.parametrize('duration, rate', [
+        (1, 16),  # 1024 = [8, 8, 16]
+        (16, 1),  # 16384 = [8, 8, 8, 32]
+    ])
+    def test_resample_multistage_short(self, duration, rate):
+        # check that stages are merged when the later stages would
+        # otherwise have too little data to filter
+        numpy.random.seed(1)
+        data = self.TEST_CLASS(numpy.random.normal(size=16384 * duration),
+                               sample_rate=16384)
+        new = data.resample(rate)
+        assert new.sample_rate == rate * units.Hz
+        assert new.size == duration * rate
+
+    @pytest.mark.parametrize('rate, ftype, up, down', [
+        (1000, 'fir', 125, 128),  # rational
+        (256, 'poly', 1, 4),  # integer, forced polyphase
+    ])
+    def test_resample_poly(self, rate, ftype, up, down):
+        numpy.random.seed(1)
+        data = self.TEST_CLASS(numpy.random.normal(size=4096),
+                               sample_rate=1024, unit='m')
+        new = data.resample(rate, ftype=ftype)
+        assert new.sample_rate == rate * units.Hz
+        assert new.unit == data.unit
+        assert new.t0 == data.t0
+        utils.assert_allclose(
+            new.value,
+            signal.resample_poly(data.value, up, down, window='hamming'),
+        )
+
     def test_resample_noop(self):
         data = self.TEST_CLASS([1, 2, 3, 4, 5])
         with pytest.warns(UserWarning):
@@ -1121,6 +1327,21 @@ class TestTimeSeries(_TestTimeSeriesBase):
         utils.assert_allclose(masked.value[4352:4416],
                               window[:64] * window[-64:])
 
+    def test_mask_deadtime(self):
+        # check that masking matches a per-sample membership test for
+        # segment boundaries both on and between sample times
+        data = self.TEST_CLASS(numpy.ones(1024), sample_rate=64,
+                               t0=1000000000.25)
+        deadtime = SegmentList([
+            Segment(999999999, 1000000000.5),
+            Segment(1000000002 + 1/3., 1000000002.5),
+            Segment(1000000003.25, 1000000003.28125),
+            Segment(1000000010 + 1/7., 1000000020),
+        ])
+        masked = data.mask(deadtime=deadtime, tpad=0)
+        dead = [t in deadtime for t in data.times.value]
+        nptest.assert_array_equal(numpy.isnan(masked.value), dead)
+
     def test_demodulate(self):
         # create a timeseries that is simply one loud sinusoidal oscillation
         # at a particular frequency, then demodulate at that frequency and
@@ -1265,6 +1486,28 @@ class TestTimeSeries(_TestTimeSeriesBase):
         # check that there are no remaining values above the threshold
         assert gated.max() < threshold
 
+    @pytest.mark.parametrize('whiten, threshold', [
+        (False, 10.),
+        (True, 15.),
+    ])
+    def test_gate_chunk(self, whiten, threshold):
+        numpy.random.seed(0)
+        data = self.TEST_CLASS(numpy.random.normal(scale=0.5, size=4096*64),
+                               sample_rate=4096, epoch=-32)
+        # add glitches, including two either side of a chunk boundary
+        for glitchtime in (-20.3, -0.05, 0.1, 25):
+            data += signal.gausspulse(data.times.value - glitchtime,
+                                      bw=100) * 20
+
+        kwargs = {'tzero': .5, 'tpad': .25, 'threshold': threshold,
+                  'whiten': whiten}
+        if whiten:
+            kwargs.update(fftlength=4, overlap=2, window='hann')
+        gated = data.gate(**kwargs)
+        chunked = data.gate(chunk=8, **kwargs)
+        assert (gated.value == 0).any()
+        utils.assert_quantity_sub_equal(chunked, gated)
+
     def test_whiten(self):
         # create noise with a glitch in it at 1000 Hz
         noise = self.TEST_CLASS(
@@ -1291,6 +1534,15 @@ class TestTimeSeries(_TestTimeSeriesBase):
         tmax = whitened.times[whitened.argmax()]
         nptest.assert_almost_equal(tmax.value, glitchtime)
 
+    def test_whiten_float32(self, noisy_sinusoid):
+        whitened = noisy_sinusoid.whiten(2, 1, window='hann')
+        white32 = noisy_sinusoid.whiten(2, 1, window='hann', dtype='float32')
+        assert white32.dtype == numpy.float32
+        assert white32.unit == whitened.unit
+        utils.assert_quantity_equal(white32.times, whitened.times)
+        # whitened data have unit variance
+        nptest.assert_allclose(white32.value, whitened.value, atol=1e-4)
+
     def test_convolve(self):
         data = self.TEST_CLASS(
             signal.hann(1024), sample_rate=512, epoch=-1
@@ -1423,6 +1675,23 @@ class TestTimeSeries(_TestTimeSeriesBase):
         assert qspecgram.q == 5.65685424949238
         nptest.assert_almost_equal(qspecgram.value.max(), 155.93774, decimal=5)
 
+    def test_q_transform_float32(self, noisy_sinusoid):
+        qspecgram = noisy_sinusoid.q_transform(whiten=False)
+        qsg32 = noisy_sinusoid.q_transform(whiten=False, dtype='float32')
+        assert qsg32.dtype == numpy.float32
+        assert qsg32.shape == qspecgram.shape
+        utils.assert_quantity_equal(qsg32.frequencies, qspecgram.frequencies)
+        # normalised energies are of order unity
+        nptest.assert_allclose(qsg32.value, qspecgram.value, atol=1e-4)
+
+        # without dtype, single-precision input is transformed as before
+        # (in double precision)
+        data32 = noisy_sinusoid.astype('float32')
+        utils.assert_quantity_sub_equal(
+            data32.q_transform(whiten=False),
+            data32.astype('float64').q_transform(whiten=False),
+        )
+
     def test_q_transform_nan(self):
         data = TimeSeries(numpy.empty(256*10) * numpy.nan, sample_rate=256)
         with pytest.raises(ValueError) as exc:
@@ -1491,6 +1760,86 @@ class TestTimeSeriesDict(_TestTimeSeriesBaseDict):
         for key in new:
             utils.assert_quantity_sub_equal(new[key], instance[key])
 
+    def test_write_hdf5_extend(self, instance, tmp_path):
+        tmp = tmp_path / "test.h5"
+        first = instance.copy().crop(end=instance.span[0] + 5)
+        second = instance.copy().crop(start=instance.span[0] + 5)
+        first.write(tmp, extend=True, compression='lzf')
+        second.write(tmp, extend=True)
+        new = self.TEST_CLASS.read(tmp, instance.keys())
+        for key in new:
+            utils.assert_quantity_sub_equal(new[key], instance[key])
+
+    @classmethod
+    def _many(cls):
+        numpy.random.seed(1)
+        data = cls.TEST_CLASS()
+        for i, rate in enumerate((256, 256, 1024, 256)):
+            name = 'X1:TEST-{}'.format(i)
+            data[name] = cls.ENTRY_CLASS(
+                numpy.random.normal(size=rate * 16),
+                t0=1000000000,
+                sample_rate=rate,
+                name=name,
+                unit='m',
+            )
+        return data
+
+    @pytest.mark.parametrize('nproc', (1, 2))
+    def test_filter(self, nproc):
+        data = self._many()
+        zpk = filter_design.highpass(10, 256)
+        expected = dict((key, ts.filter(zpk, filtfilt=True)) for
+                        key, ts in data.items())
+        assert data.filter(zpk, filtfilt=True, nproc=nproc) is data
+        for key in data:
+            utils.assert_quantity_sub_equal(data[key], expected[key])
+
+    @pytest.mark.parametrize('nproc', (1, 2))
+    def test_resample_grouped(self, nproc):
+        data = self._many()
+        rate = dict((key, 100 if i == 3 else 64) for i, key in
+                    enumerate(data))
+        expected = dict((key, ts.resample(rate[key])) for
+                        key, ts in data.items())
+        data.resample(rate, nproc=nproc)
+        for key in data:
+            utils.assert_quantity_sub_equal(data[key], expected[key])
+
+    @pytest.mark.parametrize('nproc', (1, 2))
+    def test_whiten(self, nproc):
+        data = self._many()
+        expected = dict((key, ts.whiten(2, 1, window='hann')) for
+                        key, ts in data.items())
+        data.whiten(2, 1, window='hann', nproc=nproc)
+        for key in data:
+            utils.assert_quantity_sub_equal(data[key], expected[key])
+
+    @utils.skip_missing_dependency('nds2')
+    @pytest.mark.parametrize('nproc', (2, 4))
+    def test_fetch_parallel(self, nproc):
+        data = self.TEST_CLASS()
+        for i, name in enumerate(('X1:TEST-1', 'X1:TEST-2', 'X1:TEST-3')):
+            data[name] = self.ENTRY_CLASS(
+                numpy.arange(1000.) * (i + 1),
+                t0=1000000000,
+                sample_rate=10,
+                name=name,
+                unit='m',
+            )
+        nds_connection = mocks.nds2_connection(
+            buffers=list(map(mocks.nds2_buffer_from_timeseries,
+                             data.values())),
+        )
+        with mock.patch('nds2.connection') as mock_connection:
+            mock_connection.return_value = nds_connection
+            new = self.TEST_CLASS.fetch(list(data), *data.span,
+                                        host='anything', nproc=nproc)
+        assert list(new) == list(data)
+        for key in data:
+            utils.assert_quantity_sub_equal(new[key], data[key],
+                                            exclude=['channel'])
+
 
 # -- TimeSeriesList -----------------------------------------------------------
 
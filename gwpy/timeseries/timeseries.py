@@ -21,6 +21,8 @@
 
 import math
 import warnings
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 
 import numpy
 from numpy import fft as npfft
@@ -30,6 +32,7 @@ from astropy import units
 
 from ..segments import (Segment, SegmentList, DataQualityFlag)
 from ..signal import (filter_design, qtransform, spectral)
+from ..signal.spectral._utils import (as_precision, real_dtype)
 from ..signal.window import (recommended_overlap, planck)
 from .core import (TimeSeriesBase, TimeSeriesBaseDict, TimeSeriesBaseList,
                    as_series_dict_class)
@@ -57,6 +60,182 @@ def _fft_length_default(dt):
     return int(max(2, numpy.ceil(2048 * dt.decompose().value)))
 
 
+def _digital_filter(filt, analog=False, sample_rate=None):
+    """Parse a filter definition into a form that can be applied to data
+
+    Returns ``('sos', sos)`` for IIR filters, or ``('ba', (b, a))``.
+    """
+    form, filt = filter_design.parse_filter(
+        filt,
+        analog=analog,
+        sample_rate=sample_rate,
+    )
+    if form == 'zpk':
+        return 'sos', signal.zpk2sos(*filt)
+    return form, filt
+
+
+def _apply_filter(data, form, filt, filtfilt=False, **kwargs):
+    """Apply a filter parsed by `_digital_filter` to an array
+
+    See `TimeSeries.filter` for details of the arguments.
+    """
+    if form == 'sos' and filtfilt:
+        return signal.sosfiltfilt(filt, data, **kwargs)
+    if form == 'sos':
+        return signal.sosfilt(filt, data, **kwargs)
+    if filtfilt:
+        return signal.filtfilt(*filt, data, **kwargs)
+    return signal.lfilter(*filt, data, **kwargs)
+
+
+def _decimation_stages(factor, size, n):
+    """Plan the FIR decimation stages for ``size`` samples of data
+
+    Each stage is applied with `~scipy.signal.filtfilt`, which needs more
+    than ``3 * (n + 1)`` samples of input, so the last stages of the
+    `~gwpy.signal.filter_design.decimation_plan` are merged until every
+    stage has enough data.
+    """
+    stages = filter_design.decimation_plan(factor)
+    padlen = 3 * (n + 1)
+    while len(stages) > 1:
+        # size of the input to the final stage
+        insize = size
+        for stage in stages[:-1]:
+            insize = -(-insize // stage)  # ceil division, as for [::stage]
+        if insize > padlen:
+            break
+        stages[-2:] = [stages[-2] * stages[-1]]
+    return stages
+
+
+def _resample_array(data, old, new, window='hamming', ftype='fir', n=None):
+    """Resample an array (along its last axis) to a new sampling rate
+
+    See `TimeSeries.resample` for details of the arguments.
+    """
+    if n is None and ftype == 'iir':
+        n = 8
+    elif n is None:
+        n = 60
+    factor = old / new
+    # if integer down-sampling, use decimate
+    if factor.is_integer() and ftype != 'poly':
+        if ftype == 'fir':
+            stages = _decimation_stages(factor, data.shape[-1], n)
+        else:
+            stages = [int(factor)]
+        for stage in stages:
+            form, filt = _digital_filter((filter_design._decimation_filter(
+                stage, ftype=ftype, n=n, window=window),))
+            data = _apply_filter(data, form, filt, filtfilt=True,
+                                 axis=-1)[..., ::stage]
+        return data
+    # if rational resampling, use polyphase filtering
+    if isinstance(window, numpy.ndarray):  # can't design a filter
+        ratio = None
+    else:
+        ratio = filter_design._rational_ratio(new, old)
+    if ratio is not None:
+        up, down = ratio
+        return signal.resample_poly(
+            data,
+            up,
+            down,
+            axis=-1,
+            window=filter_design._polyphase_filter(up, down, window=window),
+        )
+    # otherwise use Fourier filtering
+    nsamp = int(data.shape[-1] / old * new)
+    return signal.resample(data, nsamp, axis=-1, window=window)
+
+
+def _convolve_array(data, fir, window='hanning'):
+    """Convolve an array (along its last axis) with an FIR filter
+
+    ``fir`` may be 2-D, giving a different filter for each row of
+    ``data``. ``data`` is modified in place.
+    See `TimeSeries.convolve` for details of the arguments.
+    """
+    ntaps = fir.shape[-1]
+    size = data.shape[-1]
+    pad = int(numpy.ceil(ntaps/2))
+    nfft = min(8*ntaps, size)
+
+    def _conv(x):
+        return signal.fftconvolve(x, fir, mode='same', axes=-1)
+
+    # condition the input data
+    window = signal.get_window(window, ntaps)
+    data[..., :pad] *= window[:pad]
+    data[..., -pad:] *= window[-pad:]
+    # if FFT length is long enough, perform only one convolution
+    if nfft >= size/2:
+        return _conv(data)
+    # else use the overlap-save algorithm
+    nstep = nfft - 2*pad
+    conv = numpy.zeros(data.shape, dtype=numpy.result_type(data, fir))
+    # handle first chunk separately
+    conv[..., :nfft-pad] = _conv(data[..., :nfft])[..., :nfft-pad]
+    # process chunks of length nstep
+    k = nfft - pad
+    while k < size - nfft + pad:
+        yk = _conv(data[..., k-pad:k+nstep+pad])
+        conv[..., k:k+yk.shape[-1]-2*pad] = yk[..., pad:-pad]
+        k += nstep
+    # handle last chunk separately
+    conv[..., -nfft+pad:] = _conv(data[..., -nfft:])[..., -nfft+pad:]
+    return conv
+
+
+def _whitening_filter(asd, duration, rate, fduration=2, highpass=None,
+                      window='hanning'):
+    """Design an FIR whitening filter for data of a given duration
+
+    See `TimeSeries.whiten` for details of the arguments.
+    """
+    asd = asd.interpolate(1. / duration)
+    # design whitening filter, with highpass if requested
+    ncorner = int(highpass / asd.df.decompose().value) if highpass else 0
+    ntaps = int(fduration * rate)
+    return filter_design.fir_from_transfer(1/asd.value, ntaps=ntaps,
+                                           window=window, ncorner=ncorner)
+
+
+def _segment_indices(segments, t0, rate, size):
+    """Convert a list of segments into ranges of sample indices
+
+    Parameters
+    ----------
+    segments : `~gwpy.segments.SegmentList`
+        the list of ``[start, end)`` segments to convert
+
+    t0 : `float`
+        the GPS time of the first sample
+
+    rate : `float`
+        the sampling rate (Hz)
+
+    size : `int`
+        the number of samples
+
+    Returns
+    -------
+    indices : `numpy.ndarray`
+        an array of shape ``(len(segments), 2)`` giving the ``[start, end)``
+        index range of samples (at times ``t0 + k / rate``) that fall
+        within each segment
+    """
+    edges = numpy.asarray(segments, dtype=float).reshape(-1)
+    idx = numpy.ceil((edges - t0) * rate).astype(int)
+    # correct for rounding, so that each index is exactly the first
+    # sample (at time t0 + k / rate) at or after each edge
+    idx += (t0 + idx / rate) < edges
+    idx -= (t0 + (idx - 1) / rate) >= edges
+    return numpy.clip(idx, 0, size).reshape(-1, 2)
+
+
 # -- TimeSeries ---------------------------------------------------------------
 
 class TimeSeries(TimeSeriesBase):
@@ -253,7 +432,7 @@ class TimeSeries(TimeSeriesBase):
         return mean
 
     def psd(self, fftlength=None, overlap=None, window='hann',
-            method=DEFAULT_FFT_METHOD, **kwargs):
+            method=DEFAULT_FFT_METHOD, dtype=None, **kwargs):
         """Calculate the PSD `FrequencySeries` for this `TimeSeries`
 
         Parameters
@@ -275,6 +454,11 @@ class TimeSeries(TimeSeriesBase):
             FFT-averaging method (default: ``'median'``),
             see *Notes* for more details
 
+        dtype : `type`, `str`, optional
+            the floating-point precision of the calculation, e.g.
+            ``'float32'``, default: the precision of the input data,
+            see *Notes* for more details
+
         **kwargs
             other keyword arguments are passed to the underlying
             PSD-generation method
@@ -291,16 +475,24 @@ class TimeSeries(TimeSeriesBase):
         - ``'bartlett'`` : a mean average of non-overlapping periodograms
         - ``'median'`` : a median average of overlapping periodograms
         - ``'welch'`` : a mean average of overlapping periodograms
+
+        The ``dtype`` argument sets the working precision of the
+        calculation; the data are cast once, and windowing, Fourier
+        transforms, and averaging are all performed with that precision.
+        Working in ``float32`` halves the memory required; the relative
+        difference from a ``float64`` calculation is typically of order
+        ``1e-6``, see :ref:`gwpy-signal-precision`.
         """
         # get method
         method_func = spectral.get_method(method)
 
         # calculate PSD using UI method
         return spectral.psd(self, method_func, fftlength=fftlength,
-                            overlap=overlap, window=window, **kwargs)
+                            overlap=overlap, window=window, dtype=dtype,
+                            **kwargs)
 
     def asd(self, fftlength=None, overlap=None, window='hann',
-            method=DEFAULT_FFT_METHOD, **kwargs):
+            method=DEFAULT_FFT_METHOD, dtype=None, **kwargs):
         """Calculate the ASD `FrequencySeries` of this `TimeSeries`
 
         Parameters
@@ -322,6 +514,11 @@ class TimeSeries(TimeSeriesBase):
             FFT-averaging method (default: ``'median'``),
             see *Notes* for more details
 
+        dtype : `type`, `str`, optional
+            the floating-point precision of the calculation, e.g.
+            ``'float32'``, default: the precision of the input data,
+            see *Notes* for more details
+
         Returns
         -------
         asd :  `~gwpy.frequencyseries.FrequencySeries`
@@ -338,9 +535,16 @@ class TimeSeries(TimeSeriesBase):
         - ``'bartlett'`` : a mean average of non-overlapping periodograms
         - ``'median'`` : a median average of overlapping periodograms
         - ``'welch'`` : a mean average of overlapping periodograms
+
+        The ``dtype`` argument sets the working precision of the
+        calculation; the data are cast once, and windowing, Fourier
+        transforms, and averaging are all performed with that precision.
+        Working in ``float32`` halves the memory required; the relative
+        difference from a ``float64`` calculation is typically of order
+        ``1e-6``, see :ref:`gwpy-signal-precision`.
         """
         return self.psd(method=method, fftlength=fftlength, overlap=overlap,
-                        window=window, **kwargs) ** (1/2.)
+                        window=window, dtype=dtype, **kwargs) ** (1/2.)
 
     def csd(self, other, fftlength=None, overlap=None, window='hann',
             **kwargs):
@@ -379,7 +583,7 @@ class TimeSeries(TimeSeriesBase):
         )
 
     def spectrogram(self, stride, fftlength=None, overlap=None, window='hann',
-                    method=DEFAULT_FFT_METHOD, nproc=1, **kwargs):
+                    method=DEFAULT_FFT_METHOD, nproc=1, dtype=None, **kwargs):
         """Calculate the average power spectrogram of this `TimeSeries`
         using the specified average spectrum method.
 
@@ -415,6 +619,11 @@ class TimeSeries(TimeSeriesBase):
         nproc : `int`
             number of CPUs to use in parallel processing of FFTs
 
+        dtype : `type`, `str`, optional
+            the floating-point precision of the calculation, e.g.
+            ``'float32'``, default: the precision of the input data,
+            see *Notes* for more details
+
         Returns
         -------
         spectrogram : `~gwpy.spectrogram.Spectrogram`
@@ -428,6 +637,13 @@ class TimeSeries(TimeSeriesBase):
         - ``'bartlett'`` : a mean average of non-overlapping periodograms
         - ``'median'`` : a median average of overlapping periodograms
         - ``'welch'`` : a mean average of overlapping periodograms
+
+        The ``dtype`` argument sets the working precision of the
+        calculation; the data are cast once, and windowing, Fourier
+        transforms, and averaging are all performed with that precision.
+        Working in ``float32`` halves the memory required; the relative
+        difference from a ``float64`` calculation is typically of order
+        ``1e-6``, see :ref:`gwpy-signal-precision`.
         """
         # get method
         method_func = spectral.get_method(method)
@@ -440,10 +656,12 @@ class TimeSeries(TimeSeriesBase):
             fftlength=fftlength,
             overlap=overlap,
             window=window,
+            dtype=dtype,
             **kwargs
         )
 
-    def spectrogram2(self, fftlength, overlap=None, window='hann', **kwargs):
+    def spectrogram2(self, fftlength, overlap=None, window='hann', dtype=None,
+                     **kwargs):
         """Calculate the non-averaged power `Spectrogram` of this `TimeSeries`
 
         Parameters
@@ -467,6 +685,11 @@ class TimeSeries(TimeSeriesBase):
             where the `Spectrogram` has units of V**2 if the input is
             measured in V. Defaults to 'density'.
 
+        dtype : `type`, `str`, optional
+            the floating-point precision of the calculation, e.g.
+            ``'float32'``, default: the precision of the input data,
+            see :meth:`TimeSeries.spectrogram` for more details
+
         **kwargs
             other parameters to be passed to `scipy.signal.periodogram` for
             each column of the `Spectrogram`
@@ -498,6 +721,7 @@ class TimeSeries(TimeSeriesBase):
             fftlength=fftlength,
             overlap=overlap,
             window=window,
+            dtype=dtype,
             **kwargs
         )
 
@@ -909,28 +1133,52 @@ class TimeSeries(TimeSeriesBase):
             rate to which to resample this `Series`
 
         window : `str`, `numpy.ndarray`, optional
-            window function to apply to signal in the Fourier domain,
+            window function to use in designing the anti-aliasing FIR
+            filter, or to apply to the signal in the Fourier domain,
             see :func:`scipy.signal.get_window` for details on acceptable
-            formats, only used for `ftype='fir'` or irregular downsampling
+            formats, not used for `ftype='iir'`
 
         ftype : `str`, optional
-            type of filter, either 'fir' or 'iir', defaults to 'fir'
+            type of filter, one of
+
+            - ``'fir'`` - zero-phase FIR filter (default)
+            - ``'iir'`` - zero-phase Chebyshev type I IIR filter
+            - ``'poly'`` - polyphase FIR filter
 
         n : `int`, optional
-            if `ftype='fir'` the number of taps in the filter, otherwise
-            the order of the Chebyshev type I IIR filter
+            if `ftype='fir'` the number of taps in the filter, if
+            `ftype='iir'` the order of the Chebyshev type I IIR filter
 
         Returns
         -------
         Series
             a new Series with the resampling applied, and the same
             metadata
-        """
-        if n is None and ftype == 'iir':
-            n = 8
-        elif n is None:
-            n = 60
 
+        Notes
+        -----
+        Integer down-sampling with ``ftype='fir'`` or ``ftype='iir'`` is
+        performed by filtering forward and backward (to preserve phase)
+        and then decimating.
+        For ``ftype='fir'``, factors larger than
+        `gwpy.signal.filter_design.MAX_DECIMATION_STAGE` are applied in
+        multiple stages (see
+        :func:`gwpy.signal.filter_design.decimation_plan`), with an
+        ``n``-tap anti-aliasing filter designed for each stage.
+
+        Otherwise, if the ratio of the new and old rates is a rational
+        number (with numerator and denominator no larger than
+        `gwpy.signal.filter_design.MAX_POLYPHASE_FACTOR`), and
+        ``window`` is not given as an array, the data are resampled using
+        :func:`scipy.signal.resample_poly` which applies a linear-phase
+        FIR filter (with the given ``window``) at the output rate only;
+        the memory required is only that of the input and output.
+        Otherwise the data are resampled in the Fourier domain using
+        :func:`scipy.signal.resample`.
+
+        For data that are too long to hold in memory, or that arrive in
+        chunks, see `~gwpy.signal.streaming.StreamingResampler`.
+        """
         if isinstance(rate, units.Quantity):
             rate = rate.value
         factor = (self.sample_rate.value / rate)
@@ -942,22 +1190,13 @@ class TimeSeries(TimeSeriesBase):
                 UserWarning,
             )
             return self
-        # if integer down-sampling, use decimate
-        if factor.is_integer():
-            if ftype == 'iir':
-                filt = signal.cheby1(n, 0.05, 0.8/factor, output='zpk')
-            else:
-                filt = signal.firwin(n+1, 1./factor, window=window)
-            return self.filter(filt, filtfilt=True)[::int(factor)]
-        # otherwise use Fourier filtering
-        else:
-            nsamp = int(self.shape[0] * self.dx.value * rate)
-            new = signal.resample(self.value, nsamp,
-                                  window=window).view(self.__class__)
-            new.__metadata_finalize__(self)
-            new._unit = self.unit
-            new.sample_rate = rate
-            return new
+        out = _resample_array(self.value, self.sample_rate.value, rate,
+                              window=window, ftype=ftype, n=n)
+        new = out.view(self.__class__)
+        new.__metadata_finalize__(self)
+        new._unit = self.unit
+        new.sample_rate = rate
+        return new
 
     def zpk(self, zeros, poles, gain, analog=True, **kwargs):
         """Filter this `TimeSeries` by applying a zero-pole-gain filter
@@ -1086,27 +1325,15 @@ class TimeSeries(TimeSeriesBase):
         filtfilt = kwargs.pop('filtfilt', False)
 
         # parse filter
-        form, filt = filter_design.parse_filter(
+        form, filt = _digital_filter(
             filt,
             analog=kwargs.pop('analog', False),
             sample_rate=self.sample_rate.to('Hz').value,
         )
-        if form == 'zpk':
-            sos = signal.zpk2sos(*filt)
-        else:
-            sos = None
-            b, a = filt
 
         # perform filter
         kwargs.setdefault('axis', 0)
-        if sos is not None and filtfilt:
-            out = signal.sosfiltfilt(sos, self, **kwargs)
-        elif sos is not None:
-            out = signal.sosfilt(sos, self, **kwargs)
-        elif filtfilt:
-            out = signal.filtfilt(b, a, self, **kwargs)
-        else:
-            out = signal.lfilter(b, a, self, **kwargs)
+        out = _apply_filter(self, form, filt, filtfilt=filtfilt, **kwargs)
 
         # format as type(self)
         new = out.view(type(self))
@@ -1430,22 +1657,32 @@ class TimeSeries(TimeSeriesBase):
                 flag, start=start, end=end, **kwargs)
             deadtime = (~dqflag.active if dqflag.isgood
                         else dqflag.active)
-        # identify timestamps and mask out
+        # identify samples in each segment and mask out
         deadtime = (deadtime & span).coalesce()
-        timestamps = tstart + numpy.arange(self.size) / sample
-        (masked, ) = numpy.nonzero([t in deadtime for t in timestamps])
-        out.value[masked] = const
+        for (start, end) in _segment_indices(deadtime, tstart, sample,
+                                             self.size):
+            out.value[start:end] = const
         # taper off at segment boundaries, being careful not to taper
         # at either edge of the original TimeSeries, and to cut off
         # the taper window in segments that are too short
+        windows = {}
         for seg in (span - deadtime):
             k = int((seg[0] - tstart) * sample)
             N = int(abs(seg) * sample)
             nhalf = min(npad, N)
-            window = planck(2*npad, nleft=(int(k != 0) * npad),
-                            nright=(int(k + N != self.size) * npad))
-            out[k:k+nhalf] *= window[:nhalf]
-            out[k+N-nhalf:k+N] *= window[-nhalf:]
+            if not nhalf:
+                continue
+            key = (k != 0, k + N != self.size)
+            try:
+                window = windows[key]
+            except KeyError:
+                window = windows[key] = planck(
+                    2*npad,
+                    nleft=(int(key[0]) * npad),
+                    nright=(int(key[1]) * npad),
+                )
+            out.value[k:k+nhalf] *= window[:nhalf]
+            out.value[k+N-nhalf:k+N] *= window[-nhalf:]
         return out
 
     def demodulate(self, f, stride=1, exp=False, deg=True):
@@ -1710,7 +1947,7 @@ class TimeSeries(TimeSeriesBase):
 
     def whiten(self, fftlength=None, overlap=0, method=DEFAULT_FFT_METHOD,
                window='hanning', detrend='constant', asd=None,
-               fduration=2, highpass=None, **kwargs):
+               fduration=2, highpass=None, dtype=None, **kwargs):
         """Whiten this `TimeSeries` using inverse spectrum truncation
 
         Parameters
@@ -1748,6 +1985,11 @@ class TimeSeries(TimeSeriesBase):
             highpass corner frequency (in Hz) of the FIR whitening filter,
             default: `None`
 
+        dtype : `type`, `str`, optional
+            the floating-point precision of the calculation, e.g.
+            ``'float32'``, if given the ASD estimate, the whitening filter,
+            and the convolution all use this precision, default: `None`
+
         **kwargs
             other keyword arguments are passed to the `TimeSeries.asd`
             method to estimate the amplitude spectral density
@@ -1789,24 +2031,30 @@ class TimeSeries(TimeSeriesBase):
 
         For more on inverse spectrum truncation, see arXiv:gr-qc/0509116.
         """
+        data = as_precision(self, dtype)
         # compute the ASD
         fftlength = fftlength if fftlength else _fft_length_default(self.dt)
         if asd is None:
-            asd = self.asd(fftlength, overlap=overlap,
+            asd = data.asd(fftlength, overlap=overlap,
                            method=method, window=window, **kwargs)
-        asd = asd.interpolate(1./self.duration.decompose().value)
-        # design whitening filter, with highpass if requested
-        ncorner = int(highpass / asd.df.decompose().value) if highpass else 0
-        ntaps = int((fduration * self.sample_rate).decompose().value)
-        tdw = filter_design.fir_from_transfer(1/asd.value, ntaps=ntaps,
-                                              window=window, ncorner=ncorner)
+        tdw = _whitening_filter(
+            asd,
+            self.duration.decompose().value,
+            self.sample_rate.decompose().value,
+            fduration=fduration,
+            highpass=highpass,
+            window=window,
+        )
+        if dtype is not None:
+            tdw = tdw.astype(real_dtype(data.dtype), copy=False)
         # condition the input data and apply the whitening filter
-        in_ = self.copy().detrend(detrend)
+        in_ = data.copy().detrend(detrend)
         out = in_.convolve(tdw, window=window)
-        return out * numpy.sqrt(2 * in_.dt.decompose().value)
+        return out * math.sqrt(2 * in_.dt.decompose().value)
 
     def gate(self, tzero=1.0, tpad=0.5, whiten=True,
-             threshold=50., cluster_window=0.5, **whiten_kwargs):
+             threshold=50., cluster_window=0.5, chunk=None,
+             **whiten_kwargs):
         """Removes high amplitude peaks from data using inverse Planck window.
 
         Points will be discovered automatically using a provided threshold
@@ -1833,6 +2081,11 @@ class TimeSeries(TimeSeriesBase):
         cluster_window : `float`, optional
             time duration (seconds) over which gating points will be clustered
 
+        chunk : `float`, optional
+            duration (seconds) of data in which to search for gating points
+            at once, default: `None` (search all of the data at once),
+            see "Notes" below
+
         **whiten_kwargs
             other keyword arguments that will be passed to the
             `TimeSeries.whiten` method if it is being used when discovering
@@ -1869,6 +2122,15 @@ class TimeSeries(TimeSeriesBase):
         >>> ax.legend()
         >>> overlay.show()
 
+        Notes
+        -----
+        If ``chunk`` is given, the ASD (for whitening) is estimated once
+        using all of the data, and a single whitening filter is then applied
+        to each ``chunk`` of data in turn (padded to avoid filter
+        corruption) to search for gating points, so that only one chunk of
+        whitened data is held in memory at any time.
+        This is recommended for long (e.g. many hours of) data.
+
         See also
         --------
         TimeSeries.mask
@@ -1879,10 +2141,19 @@ class TimeSeries(TimeSeriesBase):
         from scipy.signal import find_peaks
         # Find points to gate based on a threshold
         sample = self.sample_rate.to('Hz').value
-        data = self.whiten(**whiten_kwargs) if whiten else self
         window_samples = cluster_window * sample
-        gates = find_peaks(abs(data.value), height=threshold,
-                           distance=window_samples)[0]
+        if chunk is None:
+            data = self.whiten(**whiten_kwargs) if whiten else self
+            gates = find_peaks(abs(data.value), height=threshold,
+                               distance=window_samples)[0]
+        else:
+            gates = numpy.concatenate([[]] + list(self._iter_gate_points(
+                chunk,
+                threshold,
+                window_samples,
+                whiten=whiten,
+                **whiten_kwargs
+            ))).astype(int)
         # represent gates as time segments
         deadtime = SegmentList([Segment(
             self.t0.value + (k / sample) - tzero,
@@ -1891,6 +2162,61 @@ class TimeSeries(TimeSeriesBase):
         # return the self-gated timeseries
         return self.mask(deadtime=deadtime, const=0, tpad=tpad)
 
+    def _iter_gate_points(self, chunk, threshold, distance, whiten=True,
+                          **whiten_kwargs):
+        """Yield the indices of gating points, one chunk of data at a time
+
+        See `TimeSeries.gate` for details of the arguments.
+        """
+        from scipy.signal import find_peaks
+        sample = self.sample_rate.to('Hz').value
+        nchunk = int(chunk * sample)
+        if nchunk < 1:
+            raise ValueError("chunk must be at least one sample long")
+
+        # estimate the ASD once, using all of the data
+        if whiten:
+            filter_kw = {key: whiten_kwargs.pop(key) for key in
+                         ('window', 'fduration', 'highpass') if
+                         key in whiten_kwargs}
+            filter_kw.setdefault('window', 'hanning')
+            detrend = whiten_kwargs.pop('detrend', 'constant')
+            asd = whiten_kwargs.pop('asd', None)
+            if asd is None:
+                fftlength = (whiten_kwargs.pop('fftlength', None)
+                             or _fft_length_default(self.dt))
+                whiten_kwargs.setdefault('overlap', 0)
+                whiten_kwargs.setdefault('method', DEFAULT_FFT_METHOD)
+                asd = self.asd(fftlength, window=filter_kw['window'],
+                               **whiten_kwargs)
+            # pad each chunk to avoid filter corruption at either end
+            npad = int(max(filter_kw.get('fduration', 2), distance / sample)
+                       * sample)
+        else:
+            npad = int(distance)
+
+        filters = {}
+        for start in range(0, self.size, nchunk):
+            end = min(start + nchunk, self.size)
+            # pad each chunk so that peaks near the edges are clustered
+            # correctly, then only keep those peaks in the chunk itself
+            pstart = max(start - npad, 0)
+            data = self[pstart:min(end + npad, self.size)]
+            if whiten:
+                # design the filter once (per length of data)
+                try:
+                    tdw = filters[data.size]
+                except KeyError:
+                    tdw = filters[data.size] = _whitening_filter(
+                        asd, data.size / sample, sample, **filter_kw)
+                data = data.detrend(detrend).convolve(
+                    tdw,
+                    window=filter_kw['window'],
+                ) * numpy.sqrt(2 / sample)
+            peaks = find_peaks(abs(data.value), height=threshold,
+                               distance=distance)[0] + pstart
+            yield peaks[(peaks >= start) & (peaks < end)]
+
     def convolve(self, fir, window='hanning'):
         """Convolve this `TimeSeries` with an FIR filter using the
            overlap-save method
@@ -1926,33 +2252,7 @@ class TimeSeries(TimeSeriesBase):
         corrupted at the left and right boundaries. To prevent spectral leakage
         these segments will be windowed before convolving.
         """
-        pad = int(numpy.ceil(fir.size/2))
-        nfft = min(8*fir.size, self.size)
-        # condition the input data
-        in_ = self.copy()
-        window = signal.get_window(window, fir.size)
-        in_.value[:pad] *= window[:pad]
-        in_.value[-pad:] *= window[-pad:]
-        # if FFT length is long enough, perform only one convolution
-        if nfft >= self.size/2:
-            conv = signal.fftconvolve(in_.value, fir, mode='same')
-        # else use the overlap-save algorithm
-        else:
-            nstep = nfft - 2*pad
-            conv = numpy.zeros(self.size)
-            # handle first chunk separately
-            conv[:nfft-pad] = signal.fftconvolve(in_.value[:nfft], fir,
-                                                 mode='same')[:nfft-pad]
-            # process chunks of length nstep
-            k = nfft - pad
-            while k < self.size - nfft + pad:
-                yk = signal.fftconvolve(in_.value[k-pad:k+nstep+pad], fir,
-                                        mode='same')
-                conv[k:k+yk.size-2*pad] = yk[pad:-pad]
-                k += nstep
-            # handle last chunk separately
-            conv[-nfft+pad:] = signal.fftconvolve(in_.value[-nfft:], fir,
-                                                  mode='same')[-nfft+pad:]
+        conv = _convolve_array(self.copy().value, fir, window=window)
         out = type(self)(conv)
         out.__array_finalize__(self)
         return out
@@ -2173,6 +2473,7 @@ class TimeSeries(TimeSeriesBase):
                     whiten=True,
                     fduration=2,
                     highpass=None,
+                    dtype=None,
                     **asd_kw):
         """Scan a `TimeSeries` using the multi-Q transform and return an
         interpolated high-resolution spectrogram
@@ -2239,6 +2540,10 @@ class TimeSeries(TimeSeriesBase):
             highpass corner frequency (in Hz) of the FIR whitening filter,
             used only if `whiten` is not `False`, default: `None`
 
+        dtype : `type`, `str`, optional
+            the floating-point precision of the calculation, e.g.
+            ``'float32'``, default: `None`, see *Notes* for more details
+
         **asd_kw
             keyword arguments to pass to `TimeSeries.asd` to generate
             an ASD to use when whitening the data
@@ -2262,6 +2567,12 @@ class TimeSeries(TimeSeriesBase):
         This method will return a `Spectrogram` of dtype ``float32`` if
         ``norm`` is given, and ``float64`` otherwise.
 
+        If ``dtype`` is given, the data are cast to that precision, which
+        is then used for the ASD estimate, the whitening, and the
+        Q-transform itself; with ``dtype='float32'`` the normalised tile
+        energies typically differ from the ``float64`` calculation by less
+        than one part in ``1e5``, see :ref:`gwpy-signal-precision`.
+
         To optimize plot rendering with `~matplotlib.axes.Axes.pcolormesh`,
         the output `~gwpy.spectrogram.Spectrogram` can be given a log-sampled
         frequency axis by passing `logf=True` at runtime. The `fres` argument
@@ -2299,6 +2610,7 @@ class TimeSeries(TimeSeriesBase):
         >>> plot.show()
         """  # noqa: E501
         from ..frequencyseries import FrequencySeries
+        series = as_precision(self, dtype)
         # condition data
         if whiten is True:  # generate ASD dynamically
             window = asd_kw.pop('window', 'hann')
@@ -2310,14 +2622,14 @@ class TimeSeries(TimeSeriesBase):
                 overlap = 0
             elif overlap is None:
                 overlap = recommended_overlap(window) * fftlength
-            whiten = self.asd(fftlength, overlap, window=window, **asd_kw)
+            whiten = series.asd(fftlength, overlap, window=window, **asd_kw)
         if isinstance(whiten, FrequencySeries):
             # apply whitening (with error on division by zero)
             with numpy.errstate(all='raise'):
-                data = self.whiten(asd=whiten, fduration=fduration,
-                                   highpass=highpass)
+                data = series.whiten(asd=whiten, fduration=fduration,
+                                     highpass=highpass, dtype=dtype)
         else:
-            data = self
+            data = series
         # determine search window
         if gps is None:
             search = None
@@ -2325,7 +2637,7 @@ class TimeSeries(TimeSeriesBase):
             search = Segment(gps-search/2, gps+search/2) & self.span
         qgram, _ = qtransform.q_scan(
             data, frange=frange, qrange=qrange, norm=norm,
-            mismatch=mismatch, search=search)
+            mismatch=mismatch, search=search, dtype=dtype)
         return qgram.interpolate(
             tres=tres, fres=fres, logf=logf, outseg=outseg)
 
@@ -2336,6 +2648,205 @@ class TimeSeriesDict(TimeSeriesBaseDict):  # pylint: disable=missing-docstring
                                                  'TimeSeries')
     EntryClass = TimeSeries
 
+    def _group(self, keys=None, **extra):
+        """Group entries by sample rate, dtype, and size
+
+        Any ``extra`` keyword arguments should be `dict` of (key, value)
+        pairs which are also used to group the entries.
+
+        Returns
+        -------
+        groups : `OrderedDict`
+            `dict` of ``((rate, dtype, size, *extra), keys)`` pairs
+        """
+        groups = OrderedDict()
+        for key in self if keys is None else keys:
+            series = self[key]
+            group = (
+                series.sample_rate.to('Hz').value,
+                series.dtype,
+                series.size,
+            ) + tuple(extra[name][key] for name in sorted(extra))
+            groups.setdefault(group, []).append(key)
+        return groups
+
+    def _map_stacked(self, groups, func, nproc=1):
+        """Apply a function to the stacked data for each group of entries
+
+        The data for each group from `_group` are stacked into a 2-D array
+        (split into at most ``nproc`` blocks) and passed as
+        ``func(data, group)``, which should return a 2-D array with one row
+        per entry; the blocks are processed in a pool of ``nproc`` threads.
+
+        Yields ``(key, row)`` pairs for each entry.
+        """
+        tasks = []
+        for group, keys in groups.items():
+            nrow = -(-len(keys) // max(nproc, 1))
+            tasks.extend(
+                (group, keys[i:i+nrow]) for i in range(0, len(keys), nrow))
+
+        def _run(task):
+            group, keys = task
+            data = numpy.vstack([self[key].value for key in keys])
+            return keys, func(data, group)
+
+        if nproc > 1 and len(tasks) > 1:
+            with ThreadPoolExecutor(max_workers=nproc) as pool:
+                results = list(pool.map(_run, tasks))
+        else:
+            results = map(_run, tasks)
+        for keys, out in results:
+            yield from zip(keys, out)
+
+    def _set_row(self, key, row, **metadata):
+        """Replace an entry with new data, keeping its metadata
+        """
+        old = self[key]
+        new = row.view(type(old))
+        new.__metadata_finalize__(old)
+        new._unit = old.unit
+        for attr, value in metadata.items():
+            setattr(new, attr, value)
+        self[key] = new
+
+    def filter(self, *filt, **kwargs):
+        """Filter each entry of this `dict` with an IIR or FIR filter
+
+        This operation over-writes items inplace.
+
+        Entries with the same sample rate, dtype, and size are filtered
+        together as a single 2-D array, with the filter designed only once
+        for each sample rate.
+
+        Parameters
+        ----------
+        *filt : filter arguments
+            1, 2, 3, or 4 arguments defining the filter to be applied,
+            see `TimeSeries.filter` for details
+
+        filtfilt : `bool`, optional
+            filter forward and backwards to preserve phase,
+            default: `False`
+
+        analog : `bool`, optional
+            if `True`, filter coefficients will be converted from Hz
+            to Z-domain digital representation, default: `False`
+
+        nproc : `int`, optional
+            number of parallel threads to use, default: ``1``
+
+        **kwargs
+            other keyword arguments are passed to the filter method
+
+        See also
+        --------
+        TimeSeries.filter
+            for more details
+        """
+        filtfilt = kwargs.pop('filtfilt', False)
+        analog = kwargs.pop('analog', False)
+        nproc = kwargs.pop('nproc', 1)
+        groups = self._group()
+        designs = {}
+        for rate, _, _ in groups:
+            if rate not in designs:
+                designs[rate] = _digital_filter(filt, analog=analog,
+                                                sample_rate=rate)
+
+        def _filter(data, group):
+            form, design = designs[group[0]]
+            return _apply_filter(data, form, design, filtfilt=filtfilt,
+                                 axis=-1, **kwargs)
+
+        for key, row in list(self._map_stacked(groups, _filter, nproc=nproc)):
+            self._set_row(key, row)
+        return self
+
+    def resample(self, rate, nproc=1, **kwargs):
+        """Resample items in this dict.
+
+        This operation over-writes items inplace.
+
+        Entries with the same sample rate, dtype, and size (and new
+        sample rate) are resampled together as a single 2-D array, with
+        the anti-aliasing filter designed only once.
+
+        Parameters
+        ----------
+        rate : `dict`, `float`
+            either a `dict` of (channel, `float`) pairs for key-wise
+            resampling, or a single float/int to resample all items.
+
+        nproc : `int`, optional
+            number of parallel threads to use, default: ``1``
+
+        **kwargs
+             other keyword arguments to pass to each item's resampling
+             method.
+
+        See also
+        --------
+        TimeSeries.resample
+            for more details
+        """
+        if not isinstance(rate, dict):
+            rate = dict((c, rate) for c in self)
+        rate = dict(
+            (key, getattr(new, 'value', new)) for key, new in rate.items())
+        keys = []
+        for key, new in rate.items():
+            old = self[key].sample_rate.to('Hz').value
+            if math.isclose(old / new, 1., rel_tol=1e-09, abs_tol=0.):
+                # use the TimeSeries method to emit the warning
+                self[key] = self[key].resample(new, **kwargs)
+            else:
+                keys.append(key)
+        groups = self._group(keys, rate=rate)
+
+        def _resample(data, group):
+            return _resample_array(data, group[0], group[3], **kwargs)
+
+        for key, row in list(self._map_stacked(groups, _resample,
+                                               nproc=nproc)):
+            self._set_row(key, row, sample_rate=rate[key])
+        return self
+
+    def whiten(self, *args, **kwargs):
+        """Whiten each entry of this `dict`
+
+        This operation over-writes items inplace.
+
+        Each entry is whitened by its own ASD, so the entries are
+        whitened independently, in parallel if ``nproc > 1``.
+
+        Parameters
+        ----------
+        *args, **kwargs
+            all arguments are passed to `TimeSeries.whiten`
+
+        nproc : `int`, optional
+            number of parallel threads to use, default: ``1``
+
+        See also
+        --------
+        TimeSeries.whiten
+            for more details
+        """
+        nproc = kwargs.pop('nproc', 1)
+
+        def _whiten(key):
+            return key, self[key].whiten(*args, **kwargs)
+
+        if nproc > 1 and len(self) > 1:
+            with ThreadPoolExecutor(max_workers=nproc) as pool:
+                results = list(pool.map(_whiten, list(self)))
+        else:
+            results = list(map(_whiten, list(self)))
+        for key, new in results:
+            self[key] = new
+        return self
+
 
 class TimeSeriesList(TimeSeriesBaseList):  # pylint: disable=missing-docstring
     __doc__ = TimeSeriesBaseList.__doc__.replace('TimeSeriesBase',
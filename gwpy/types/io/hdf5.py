@@ -23,6 +23,8 @@ import pickle
 from decimal import Decimal
 from operator import attrgetter
 
+import numpy
+
 from astropy.units import (Quantity, UnitBase)
 
 from ...detector import Channel
@@ -44,7 +46,7 @@ ATTR_TYPE_MAP = {
 # -- read ---------------------------------------------------------------------
 
 @io_hdf5.with_read_hdf5
-def read_hdf5_array(source, path=None, array_type=Array):
+def read_hdf5_array(source, path=None, array_type=Array, mmap=False):
     """Read an `Array` from the given HDF5 object
 
     Parameters
@@ -57,8 +59,32 @@ def read_hdf5_array(source, path=None, array_type=Array):
 
     array_type : `type`
         desired return type
+
+    mmap : `bool`, optional, default: `False`
+        if `True`, memory-map contiguous, uncompressed datasets
+        as read-only arrays, rather than reading them into memory,
+        see :func:`read_hdf5_data` for details
     """
     dataset = io_hdf5.find_dataset(source, path=path)
+    attrs = read_hdf5_metadata(dataset)
+    data = read_hdf5_data(dataset, mmap=mmap)
+    return array_type(data, copy=False, **attrs)
+
+
+def read_hdf5_metadata(dataset):
+    """Read the array metadata stored in the attributes of a dataset
+
+    Parameters
+    ----------
+    dataset : `h5py.Dataset`
+        the dataset to read
+
+    Returns
+    -------
+    attrs : `dict`
+        the formatted metadata, suitable to pass as keyword arguments
+        when creating an `Array`
+    """
     attrs = dict(dataset.attrs)
     # unpickle channel object
     try:
@@ -69,7 +95,69 @@ def read_hdf5_array(source, path=None, array_type=Array):
     for key in attrs:
         if isinstance(attrs[key], bytes):
             attrs[key] = attrs[key].decode('utf-8')
-    return array_type(dataset[()], **attrs)
+    return attrs
+
+
+def read_hdf5_data(dataset, index=(), mmap=False):
+    """Read (a slice of) the data from a dataset
+
+    Parameters
+    ----------
+    dataset : `h5py.Dataset`
+        the dataset to read
+
+    index : `slice`, `tuple`, optional
+        the index to read, defaults to reading the whole dataset
+
+    mmap : `bool`, optional, default: `False`
+        if `True`, return a read-only `numpy.memmap` view of the dataset
+        on disk, if possible, see _Notes_ below
+
+    Returns
+    -------
+    data : `numpy.ndarray`
+        the data array
+
+    Notes
+    -----
+    Only datasets that use contiguous (not chunked) storage, without
+    any compression or other filters, in a file opened with the default
+    driver, can be memory-mapped; for any other dataset ``mmap=True``
+    has no effect and only the requested ``index`` is read into memory.
+
+    To write data that can be memory-mapped, pass ``compression=None``
+    when writing.
+    """
+    if mmap:
+        mapped = _memmap_dataset(dataset)
+        if mapped is not None:
+            return mapped[index]
+    return dataset[index]
+
+
+def _memmap_dataset(dataset):
+    """Return a read-only `numpy.memmap` of a contiguous dataset
+
+    Returns `None` if the dataset cannot be memory-mapped.
+    """
+    if (
+        dataset.chunks is not None  # chunked (or compressed) storage
+        or dataset.dtype.hasobject
+        or not dataset.shape
+        or not dataset.size
+        or dataset.file.driver not in ('sec2', 'stdio')
+    ):
+        return None
+    offset = dataset.id.get_offset()
+    if offset is None:  # compact storage, or storage not allocated
+        return None
+    return numpy.memmap(
+        dataset.file.filename,
+        mode='r',
+        dtype=dataset.dtype,
+        offset=offset,
+        shape=dataset.shape,
+    )
 
 
 def _unpickle_channel(raw):
@@ -174,12 +262,7 @@ def write_hdf5_array(array, h5g, path=None, attrs=None,
     datasets : `h5py.Dataset`
         the newly created dataset
     """
-    if path is None:
-        path = array.name
-    if path is None:
-        raise ValueError("Cannot determine HDF5 path for %s, "
-                         "please set ``name`` attribute, or pass ``path=`` "
-                         "keyword when writing" % type(array).__name__)
+    path = _get_hdf5_path(array, path)
 
     # create dataset
     dset = io_hdf5.create_dataset(h5g, path, overwrite=overwrite,
@@ -197,6 +280,18 @@ def write_hdf5_array(array, h5g, path=None, attrs=None,
     return dset
 
 
+def _get_hdf5_path(array, path=None):
+    """Return the HDF5 dataset path to use when writing ``array``
+    """
+    if path is None:
+        path = array.name
+    if path is None:
+        raise ValueError("Cannot determine HDF5 path for %s, "
+                         "please set ``name`` attribute, or pass ``path=`` "
+                         "keyword when writing" % type(array).__name__)
+    return path
+
+
 def format_index_array_attrs(series):
     """Format metadata attributes for and indexed array
 
@@ -222,16 +317,138 @@ def format_index_array_attrs(series):
     return attrs
 
 
-def write_hdf5_series(series, output, path=None, attrs=None, **kwargs):
+def write_hdf5_series(series, output, path=None, attrs=None, extend=False,
+                      **kwargs):
     """Write a Series to HDF5.
 
     See :func:`write_hdf5_array` for details of arguments and keywords.
+
+    If ``extend=True`` is given, the series is appended to an existing
+    resizable dataset, see :func:`extend_hdf5_series` for details.
     """
     if attrs is None:
         attrs = format_index_array_attrs(series)
+    if extend:
+        kwargs['append'] = True
+        return extend_hdf5_series(series, output, path=path, attrs=attrs,
+                                  **kwargs)
     return write_hdf5_array(series, output, path=path, attrs=attrs, **kwargs)
 
 
+@io_hdf5.with_write_hdf5
+def extend_hdf5_series(series, h5g, path=None, attrs=None, gap=None,
+                       pad=None, append=True, overwrite=False,
+                       compression='gzip', chunks=True, **kwargs):
+    """Append a `Series` to the end of a resizable `h5py.Dataset`
+
+    If the dataset doesn't exist, a new chunked dataset is created that
+    can be resized along the first axis, so that later data can be
+    appended in place.
+
+    Parameters
+    ----------
+    series : `gwpy.types.Series`
+        the data to write
+
+    h5g : `str`, `h5py.Group`
+        a file path to write to, or an `h5py.Group` in which to find
+        (or create) the dataset
+
+    path : `str`, optional
+        the path inside the group of the dataset,
+        defaults to ``series.name``
+
+    attrs : `dict`, optional
+        extra metadata to write into `h5py.Dataset.attrs` when creating
+        a new dataset
+
+    gap : `str`, optional
+        action to perform if there's a gap between the stored data
+        and the new series, one of
+
+        - ``'raise'`` - raise a `ValueError`
+        - ``'ignore'`` - remove gap and join data
+        - ``'pad'`` - pad gap with ``pad``
+
+        If ``pad`` is given and is not `None`, the default is ``'pad'``,
+        otherwise ``'raise'``.
+
+    pad : `float`, optional
+        value with which to pad discontiguous series
+
+    append : `bool`, default: `True`
+        if `True`, write to an existing file, see :func:`write_hdf5_array`
+
+    overwrite : `bool`, default: `False`
+        if `True`, replace any existing dataset with a new resizable
+        dataset containing only ``series``
+
+    compression : `str`, `int`, optional
+        compression option to pass to :meth:`h5py.Group.create_dataset`,
+        e.g. ``'gzip'`` or ``'lzf'``, only used when creating a new dataset
+
+    chunks : `bool`, `tuple`, optional
+        chunk shape to pass to :meth:`h5py.Group.create_dataset`,
+        by default the chunk shape is chosen automatically by `h5py`
+
+    **kwargs
+        other keyword arguments for :meth:`h5py.Group.create_dataset`,
+        e.g. ``shuffle=True`` to enable the byte-shuffle filter
+
+    Returns
+    -------
+    dataset : `h5py.Dataset`
+        the extended (or newly created) dataset
+
+    Raises
+    ------
+    ValueError
+        if the existing dataset cannot be resized, if its metadata are
+        incompatible with ``series``, or if ``series`` doesn't follow
+        on from the stored data (according to ``gap``)
+
+    See also
+    --------
+    Series.append
+        for details of how the new data are joined to the existing data
+    """
+    path = _get_hdf5_path(series, path)
+
+    # create a new resizable dataset
+    if overwrite or path not in h5g or not h5g[path].shape[0]:
+        return write_hdf5_array(
+            series,
+            h5g,
+            path=path,
+            attrs=attrs,
+            overwrite=True,
+            compression=compression,
+            chunks=chunks,
+            maxshape=(None,) + series.shape[1:],
+            **kwargs
+        )
+
+    dset = h5g[path]
+    if dset.maxshape[0] is not None:
+        raise ValueError(
+            f"Cannot extend fixed-size HDF5 dataset '{path}', please "
+            "rewrite it with extend=True to create a resizable dataset",
+        )
+
+    # use the last stored sample to join the new data, which applies
+    # the usual compatibility checks and gap handling
+    nstored = dset.shape[0]
+    metadata = read_hdf5_metadata(dset)
+    last = type(series)(dset[nstored - 1:], copy=False, **metadata)
+    last.x0 = last.x0 + (nstored - 1) * last.dx
+    new = last.append(series, inplace=False, gap=gap, pad=pad).value[1:]
+
+    # write the new data in place
+    dset.resize(nstored + new.shape[0], axis=0)
+    dset[nstored:] = new
+    return dset
+
+
 # -- register -----------------------------------------------------------------
 
 def register_hdf5_array_io(array_type, format='hdf5', identify=True):